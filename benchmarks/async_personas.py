@@ -0,0 +1,77 @@
+"""
+The persona matrix of test_other_user_add_and_remove_from_cart, run one persona after
+the other and then all at once on a single event loop with the async page objects.
+
+    python -m benchmarks.async_personas --app local --repeat 3
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from playwright.async_api import Browser, async_playwright
+
+from config import URL, VIEWPORT
+from pages.aio import AsyncDashboardPage, AsyncLoginPage
+from test_data.product_data import allowed_cart
+from utils.local_app import LocalSwagLabs
+
+PERSONAS = ("problem_user", "error_user")
+
+
+async def add_every_product(browser: Browser, url: str, username: str) -> None:
+    context = await browser.new_context(viewport=VIEWPORT)
+    try:
+        page = await context.new_page()
+        await AsyncLoginPage(page).open_and_login(url, username)
+        await AsyncDashboardPage(page).add_every_product_and_assert_allowed(allowed_cart)
+    finally:
+        await context.close()
+
+
+async def sequential(browser: Browser, url: str, personas) -> None:
+    for username in personas:
+        await add_every_product(browser, url, username)
+
+
+async def concurrent(browser: Browser, url: str, personas) -> None:
+    await asyncio.gather(*(add_every_product(browser, url, username) for username in personas))
+
+
+async def benchmark(url: str, personas, repeat: int, headless: bool) -> dict:
+    timings = {"sequential": [], "concurrent": []}
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        for _ in range(repeat):
+            for name, flow in (("sequential", sequential), ("concurrent", concurrent)):
+                start = time.perf_counter()
+                await flow(browser, url, personas)
+                timings[name].append(time.perf_counter() - start)
+        await browser.close()
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", choices=("remote", "local"), default="remote")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--personas", nargs="+", default=list(PERSONAS))
+    parser.add_argument("--headed", action="store_true")
+    options = parser.parse_args()
+
+    if options.app == "local":
+        with LocalSwagLabs() as app:
+            timings = asyncio.run(benchmark(app.url, options.personas, options.repeat, not options.headed))
+    else:
+        timings = asyncio.run(benchmark(URL, options.personas, options.repeat, not options.headed))
+
+    sequential_median = statistics.median(timings["sequential"])
+    for name, runs in timings.items():
+        median = statistics.median(runs)
+        print(f"{name:<11} median {median:7.2f}s  min {min(runs):7.2f}s  speed-up {sequential_median / median:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+How page object operations scale with the catalog size, on generated catalogs served by the local app.
+Every operation is timed and its browser round trips counted (utils.instrumentation). The exit code is 1
+when an operation's round trips grow faster than --max-slope on a log-log fit against catalog size.
+
+    python -m benchmarks.inventory_scaling --sizes 6 60 600 3000
+"""
+import argparse
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from playwright.sync_api import Browser, Page, sync_playwright
+
+from config import VIEWPORT
+from pages.cart_page import CartPage
+from pages.dashboard_page import DashboardPage
+from pages.login_page import LoginPage
+from test_data.catalog import Catalog
+from test_data.filter_data import Filter
+from utils.cart_seed import seed_cart
+from utils.catalog_generator import write_catalog
+from utils.instrumentation import CallLog, Instrumentation
+from utils.local_app import LocalSwagLabs
+
+
+# the grid opens sorted by name (A to Z), not in catalog order
+def visible_products(page: Page, catalog: Catalog) -> None:
+    DashboardPage(page).assert_product_visible(catalog.sorted(Filter.NAME_ASC))
+
+
+def problem_user_grid(page: Page, catalog: Catalog) -> None:
+    DashboardPage(page).filter_behaviour_on_problem_user(catalog.sorted(Filter.NAME_ASC))
+
+
+def cart_with_every_product(page: Page, catalog: Catalog) -> None:
+    # what add_all_products + cart_page_navigate do, then the cart check
+    dashboard_page = DashboardPage(page)
+    seed_cart(page, catalog.products)
+    dashboard_page.is_inventory_page()
+    dashboard_page.wait_until_page_fields_are_ready()
+    dashboard_page.open_cart_page()
+    CartPage(page).check_products_data(catalog.products)
+
+
+# name -> (persona, operation)
+OPERATIONS: Dict[str, Tuple[str, Callable[[Page, Catalog], None]]] = {
+    "DashboardPage.assert_product_visible": ("standard_user", visible_products),
+    "DashboardPage.filter_behaviour_on_problem_user": ("problem_user", problem_user_grid),
+    "seed_cart + CartPage.check_products_data": ("standard_user", cart_with_every_product),
+}
+
+
+def log_log_slope(sizes: List[int], values: List[float]) -> float:
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0.0
+
+
+def measure(browser: Browser, url: str, catalog: Catalog, persona: str, operation, instrumentation: Instrumentation) -> Tuple[float, int]:
+    context = browser.new_context(viewport=VIEWPORT)
+    try:
+        page = context.new_page()
+        LoginPage(page).open_and_login(url, persona)
+
+        instrumentation.current = CallLog(operation.__name__)
+        start = time.perf_counter()
+        operation(page, catalog)
+        elapsed = time.perf_counter() - start
+        calls, instrumentation.current = instrumentation.current, None
+        return elapsed, sum(stats.calls for stats in calls.by_category.values())
+    finally:
+        context.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 60, 600, 3000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--catalog-dir", type=Path, default=Path(tempfile.gettempdir()) / "swag-labs-catalogs")
+    parser.add_argument("--max-slope", type=float, default=1.15, help="Largest allowed log-log slope of round trips against size")
+    parser.add_argument("--headed", action="store_true")
+    options = parser.parse_args()
+
+    instrumentation = Instrumentation(options.catalog_dir / "instrumentation")
+    instrumentation.install()
+    results: Dict[str, List[Tuple[int, float, int]]] = {name: [] for name in OPERATIONS}
+
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=not options.headed)
+            for size in options.sizes:
+                directory = options.catalog_dir / f"{size}-{options.seed}"
+                catalog = write_catalog(directory, size, options.seed)
+                with LocalSwagLabs(catalog, image_dir=directory / "images") as app:
+                    for name, (persona, operation) in OPERATIONS.items():
+                        elapsed, round_trips = measure(browser, app.url, catalog, persona, operation, instrumentation)
+                        results[name].append((size, elapsed, round_trips))
+                        print(f"{size:6d}  {elapsed:8.2f}s  {round_trips:6d} round trips  {name}")
+            browser.close()
+    finally:
+        instrumentation.uninstall()
+
+    print(f"\n{'time slope':>10} {'trip slope':>10}  operation")
+    failed = []
+    for name, rows in results.items():
+        sizes = [size for size, _, _ in rows]
+        time_slope = log_log_slope(sizes, [elapsed for _, elapsed, _ in rows])
+        trip_slope = log_log_slope(sizes, [round_trips for _, _, round_trips in rows])
+        print(f"{time_slope:10.2f} {trip_slope:10.2f}  {name}")
+        if trip_slope > options.max_slope:
+            failed.append(name)
+
+    if failed:
+        print(f"\nround trips grow faster than n^{options.max_slope}: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
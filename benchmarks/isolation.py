@@ -0,0 +1,47 @@
+"""
+Wall-clock time of the full `make regression` run under every isolation level.
+
+    python -m benchmarks.isolation
+    python -m benchmarks.isolation --repeat 3 --levels test-browser test-context
+"""
+import argparse
+import statistics
+import subprocess
+import time
+
+from config import ISOLATION_LEVELS
+
+
+def run_regression(level: str, extra_args: str) -> tuple[float, int]:
+    args = f"--isolation={level} {extra_args}".strip()
+    start = time.perf_counter()
+    result = subprocess.run(["make", "regression", f"ARGS={args}"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start, result.returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=1, help="runs per isolation level")
+    parser.add_argument("--levels", nargs="+", default=list(ISOLATION_LEVELS), choices=ISOLATION_LEVELS)
+    parser.add_argument("--args", default="", help="extra pytest arguments, e.g. '-n 4'")
+    options = parser.parse_args()
+
+    results = {}
+    for level in options.levels:
+        timings = []
+        for run in range(options.repeat):
+            elapsed, returncode = run_regression(level, options.args)
+            status = "ok" if returncode == 0 else f"exit {returncode}"
+            print(f"{level:<16} run {run + 1}: {elapsed:8.2f}s ({status})")
+            timings.append(elapsed)
+        results[level] = timings
+
+    baseline = statistics.median(results[options.levels[0]])
+    print(f"\n{'isolation':<16} {'median':>10} {'min':>10} {'vs ' + options.levels[0]:>22}")
+    for level, timings in results.items():
+        median = statistics.median(timings)
+        print(f"{level:<16} {median:9.2f}s {min(timings):9.2f}s {baseline / median:21.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+"Add every product" on a synthetic inventory page, locating each product's button by scanning
+the cards' text (inventory_items.filter(has_text=name)) and by its data-test slug.
+
+    python -m benchmarks.name_lookup --sizes 50 200 800
+"""
+import argparse
+import html
+import statistics
+import time
+
+from playwright.sync_api import Page, expect, sync_playwright
+
+from config import VIEWPORT
+from pages.dashboard_page import DashboardPage
+from test_data.product_data import product_slug
+
+CARD = """
+<div class="inventory_item" data-test="inventory-item">
+  <div class="inventory_item_name" data-test="inventory-item-name">{name}</div>
+  <div class="inventory_item_desc" data-test="inventory-item-desc">Synthetic product number {index}</div>
+  <div class="inventory_item_price" data-test="inventory-item-price">${price:.2f}</div>
+  <button class="btn" data-test="add-to-cart-{slug}" data-slug="{slug}">Add to cart</button>
+</div>
+"""
+
+# same swap the app does: the add button becomes a remove button
+SCRIPT = """
+<script>
+document.addEventListener("click", (event) => {
+    const button = event.target.closest("button[data-slug]");
+    if (!button) return;
+    const adding = button.dataset.test.startsWith("add-to-cart-");
+    button.dataset.test = `${adding ? "remove" : "add-to-cart"}-${button.dataset.slug}`;
+    button.textContent = adding ? "Remove" : "Add to cart";
+});
+</script>
+"""
+
+
+def catalog_names(size: int):
+    return [f"Sauce Labs Item {index:05d}" for index in range(size)]
+
+
+def catalog_html(names) -> str:
+    cards = "".join(
+        CARD.format(name=html.escape(name), index=index, price=5 + index % 50, slug=html.escape(product_slug(name)))
+        for index, name in enumerate(names)
+    )
+    return f'<div data-test="inventory-container"><div class="inventory_list">{cards}</div></div>{SCRIPT}'
+
+
+def add_by_text_scan(dashboard: DashboardPage, name: str) -> None:
+    add_button = dashboard.inventory_items.filter(has_text=name).locator(dashboard.ADD_TO_CART_BUTTON_FIELD)
+    expect(add_button).to_be_visible()
+    add_button.click()
+
+
+def add_by_slug(dashboard: DashboardPage, name: str) -> None:
+    dashboard.add_to_cart_by_product_name(name)
+
+
+STRATEGIES = {"text scan": add_by_text_scan, "slug": add_by_slug}
+
+
+def add_every_product(page: Page, names, strategy) -> float:
+    page.set_content(catalog_html(names))
+    dashboard = DashboardPage(page)
+    start = time.perf_counter()
+    for name in names:
+        strategy(dashboard, name)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--headed", action="store_true")
+    options = parser.parse_args()
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=not options.headed)
+        page = browser.new_page(viewport=VIEWPORT)
+
+        print(f"{'products':>8}  {'strategy':<10} {'median':>9} {'per product':>12}")
+        for size in options.sizes:
+            names = catalog_names(size)
+            for label, strategy in STRATEGIES.items():
+                runs = [add_every_product(page, names, strategy) for _ in range(options.repeat)]
+                median = statistics.median(runs)
+                print(f"{size:8d}  {label:<10} {median:8.2f}s {median / size * 1000:10.2f}ms")
+
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,8 @@
-URL="https://www.saucedemo.com/"
\ No newline at end of file
+URL="https://www.saucedemo.com/"
+
+VIEWPORT = {"width": 1280, "height": 720}
+
+# test-browser   -> a new browser per test (slowest, full isolation)
+# test-context   -> one browser per worker, a new context per test (default)
+# module-context -> one browser per worker, one context per test module (fastest, cookies and storage are wiped between tests)
+ISOLATION_LEVELS = ("test-browser", "test-context", "module-context")
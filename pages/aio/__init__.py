@@ -0,0 +1,7 @@
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.dashboard_page import AsyncDashboardPage
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_page import AsyncCheckoutPage
+from pages.aio.order_page import AsyncOrderPage
+
+__all__ = ["AsyncLoginPage", "AsyncDashboardPage", "AsyncCartPage", "AsyncCheckoutPage", "AsyncOrderPage"]
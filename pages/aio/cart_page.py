@@ -0,0 +1,63 @@
+from typing import Dict, List, Optional
+from playwright.async_api import Page, expect
+from pages.cart_page import CartPage
+from pages.line_items import LineItem, LineItemReader
+from pages.aio.shared import AsyncAppPage, shares_selectors
+from test_data.product_data import Product
+
+
+@shares_selectors(CartPage)
+class AsyncCartPage(AsyncAppPage):
+
+    __slots__ = ()
+
+    #----------Getters------------
+    async def get_cart_items_count(self) -> int:
+        return await self.inventory_items.count()
+
+    async def get_line_items(self) -> Dict[str, LineItem]:
+        reader = LineItemReader(self.inventory_items, self.ITEM_NAME_FIELD, self.ITEM_DESC_FIELD, self.ITEM_PRICE_FIELD, self.ITEM_QUANTITY_FIELD)
+        return await reader.snapshot_async()
+
+    async def get_item_details(self, item_name: str, items: Optional[Dict[str, LineItem]] = None) -> dict:
+        items = items if items is not None else await self.get_line_items()
+        return LineItemReader.pick(items, item_name=item_name).as_details()
+
+    #---------------assertions------------------
+    async def is_cart_page(self) -> None:
+        await expect(self.page).to_have_url(self.CART_URL)
+
+    async def assert_product_count_in_cart(self, expected_count, items: Optional[Dict[str, LineItem]] = None) -> None:
+        actual_cnt = len(items if items is not None else await self.get_line_items())
+        assert actual_cnt == expected_count, f"Expected {expected_count} products, but found {actual_cnt}"
+
+    async def assert_shopping_badge_value_equal_as_cart_cnt(self) -> None:
+        cart_cnt = await self.get_cart_items_count()
+        if await self.wait_for_badge(cart_cnt) is not None:
+            return
+
+        shopping_badge_cnt = await self.shopping_cart_badge_value()
+
+        assert cart_cnt == shopping_badge_cnt, f"Expected {cart_cnt} , but found {shopping_badge_cnt}"
+
+    #---------------actions--------------------
+    async def press_checkout_button(self) -> None:
+        await self.checkout_button.click()
+
+    async def press_continue_shopping(self) -> None:
+        await self.continue_shopping_button.click()
+
+    async def press_remove_button(self, item_name: str) -> None:
+        await self.item_row(item_name).locator(self.REMOVE_BUTTON_FIELD).click()
+
+    #-----------------E2E Flow-------------------
+    async def check_products_data(self, products_in_cart : List[Product]) -> None:
+        items = await self.get_line_items()
+        await self.assert_product_count_in_cart(expected_count=len(products_in_cart), items=items)
+
+        for product in products_in_cart:
+            item_details = await self.get_item_details(item_name=product.name, items=items)
+
+            assert item_details["name"] == product.name, f"Name mismatch for {product.name}"
+            assert item_details["description"] == product.description, f"Description mismatch for {product.name}"
+            assert float(item_details["price"].replace("$", "")) == product.price, f"Price mismatch for {product.name}"
@@ -0,0 +1,24 @@
+from playwright.async_api import Page, expect
+from pages.checkout_page import CheckoutPage
+from pages.aio.shared import AsyncAppPage, shares_selectors
+
+
+@shares_selectors(CheckoutPage)
+class AsyncCheckoutPage(AsyncAppPage):
+
+    __slots__ = ()
+
+    async def is_checkout_page(self) -> None:
+        await expect(self.page).to_have_url(self.CHECKOUT_URL)
+
+    async def fill_details(self, first_name : str, last_name : str, zip_code : str) -> None:
+        if not (first_name and last_name and zip_code) :
+            raise ValueError(f"Details is not given")
+
+        await self.first_name.fill(first_name)
+        await self.last_name.fill(last_name)
+        await self.zip_code.fill(zip_code)
+
+    async def fill_form_and_continue(self, first_name : str = "Jon", last_name : str = "Snow", zip_code : str = "GOT") -> None:
+        await self.fill_details(first_name, last_name, zip_code)
+        await self.continue_button.click()
@@ -0,0 +1,91 @@
+from typing import Optional
+from urllib.parse import urljoin
+from playwright.async_api import Locator, Page, expect
+from pages.cart_observer import CartState
+from pages.dashboard_page import DashboardPage
+from pages.aio.shared import AsyncAppPage, shares_selectors
+from test_data.filter_data import Filter
+
+
+@shares_selectors(DashboardPage)
+class AsyncDashboardPage(AsyncAppPage):
+
+    __slots__ = ()
+
+    #-------------Helper----------------
+    async def get_inventory_items_count(self) -> int:
+        return await self.inventory_items.count()
+
+    #-------------navigations--------------
+    async def open_inventory_page(self, url) -> None:
+        await self.page.goto(urljoin(url, self.INVENTORY_PATH))
+        await self.is_inventory_page()
+
+    async def open_cart_page(self) -> None:
+        await self.shopping_cart_button.click()
+        await expect(self.page).to_have_url(self.CART_URL)
+
+    #-------------assertions--------------
+    async def is_inventory_page(self) -> None:
+        await expect(self.page).to_have_url(self.INVENTORY_URL)
+
+    async def wait_until_page_fields_are_ready(self) -> None:
+        await self.wait_until_ready()
+
+    async def assert_number_of_products(self, expected_count: int = 6) -> None:
+        count = await self.get_inventory_items_count()
+        assert count == expected_count, f"Expected {expected_count} products, but found {count}"
+
+    async def assert_shopping_badge_value(self, expected_value: int) -> None:
+        if await self.wait_for_badge(expected_value) is not None:
+            return
+
+        badge = self.shopping_cart_badge
+        if expected_value == 0:
+            await expect(badge).to_have_count(0)
+
+        else :
+            await expect(badge).to_be_visible()
+            await expect(badge).to_have_text(str(expected_value))
+
+    #--------------actions---------------
+    async def apply_filter(self, filter_option: Filter) -> None:
+        await self.filter_button.click()
+        await self.filter_button.select_option(label=filter_option.value)
+
+    async def add_to_cart_by_product_name(self, product_name: str) -> Optional[CartState]:
+        add_button = self.get_add_to_cart_button_by_name(product_name)
+        await expect(add_button).to_be_visible()
+        return await self.click_and_observe(add_button)
+
+    async def remove_by_product_name(self, product_name: str) -> Optional[CartState]:
+        remove_button = self.get_remove_button_by_name(product_name)
+        await expect(remove_button).to_be_visible()
+        return await self.click_and_observe(remove_button)
+
+    async def logout(self) -> None:
+        await self.burger_menu_button.click()
+        await self.logout_button.click()
+
+    #-------------E2E Flows--------------
+    async def add_every_product_and_assert_allowed(self, allowed_cart: dict) -> None:
+        """
+        1. Already on dashboard page
+        2. Try to add every product to the cart
+        3. Allowed products show a remove button and bump the badge, the others don't
+        """
+        await self.wait_until_page_fields_are_ready()
+        await self.assert_number_of_products(len(allowed_cart))
+
+        cart_count = 0
+        for product, is_allowed in allowed_cart.items():
+            await self.add_to_cart_by_product_name(product)
+            remove_button = self.get_remove_button_by_name(product)
+
+            if is_allowed:
+                cart_count += 1
+                await expect(remove_button).to_be_visible()
+            else:
+                await expect(remove_button).not_to_be_visible()
+
+            await self.assert_shopping_badge_value(cart_count)
@@ -0,0 +1,45 @@
+from playwright.async_api import Page, expect
+from pages.login_page import LoginPage
+from pages.aio.shared import AsyncBasePage, shares_selectors
+
+
+@shares_selectors(LoginPage)
+class AsyncLoginPage(AsyncBasePage):
+
+    __slots__ = ()
+
+    #-------------navigations--------------
+    async def open_page(self, url) -> None:
+        await self.page.goto(url)
+
+    async def open_page_and_wait_until_page_is_ready(self, url) -> None:
+        await self.open_page(url)
+        await self.wait_until_page_fields_are_ready()
+
+    #-------------assertions--------------
+    async def wait_until_page_fields_are_ready(self) -> None:
+        await self.wait_until_ready()
+
+    async def wait_for_login_error(self) -> None:
+        await expect(self.error_message).to_have_text(self.LOGIN_ERROR_MESSAGE)
+
+    #--------------actions---------------
+    async def login(self, username, password = "secret_sauce") -> None:
+        await self.username.fill(username)
+        await self.password.fill(password)
+        await self.submit.click()
+
+    #-------------Post actions--------------
+    async def wait_for_successful_login(self) -> None:
+        await expect(self.page).to_have_url(self.INVENTORY_URL)
+
+    #-------------E2E Flows--------------
+    async def open_and_login(self, url: str, username: str, password: str = "secret_sauce") -> None:
+        """
+        Same flow as LoginPage.open_and_login
+        """
+        await self.open_page_and_wait_until_page_is_ready(url)
+        await self.login(username, password)
+
+        if username != "locked_out_user" :
+            await self.wait_for_successful_login()
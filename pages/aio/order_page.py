@@ -0,0 +1,54 @@
+from typing import Dict, List, Optional
+from playwright.async_api import Locator, Page, expect
+from pages.order_page import OrderPage
+from pages.line_items import LineItem, LineItemReader
+from pages.aio.shared import AsyncAppPage, shares_selectors
+from test_data.product_data import Product
+
+
+@shares_selectors(OrderPage)
+class AsyncOrderPage(AsyncAppPage):
+
+    __slots__ = ()
+
+    #----------------Private--------------
+    async def _get_price_value(self, locator : Locator) -> float:
+        text = await locator.inner_text()
+        return float(text.split("$")[1])
+
+    #---------------------Getter--------------
+    async def get_line_items(self) -> Dict[str, LineItem]:
+        reader = LineItemReader(self.inventory_items, self.ITEM_NAME_FIELD, self.ITEM_DESC_FIELD, self.ITEM_PRICE_FIELD, self.ITEM_QUANTITY_FIELD)
+        return await reader.snapshot_async()
+
+    #-------------------Asserts-----------------
+    async def is_order_page(self) -> None:
+        await expect(self.page).to_have_url(self.URL)
+
+    async def assert_no_of_items_in_cart(self, expected_cnt : int, items: Optional[Dict[str, LineItem]] = None) -> None:
+        actual_cnt = len(items if items is not None else await self.get_line_items())
+        assert actual_cnt == expected_cnt, f"Expected {expected_cnt} products, but found {actual_cnt}"
+
+    #--------------------Actions------------------
+    async def press_cancel_button(self) -> None:
+        await self.cancel_button.click()
+
+    async def press_finish_button(self) -> None:
+        await self.finish_button.click()
+
+    async def check_grand_total(self, products_in_cart : List[Product]) -> None:
+        """
+        Same checks as OrderPage.check_grand_total
+        """
+        items = await self.get_line_items()
+        await self.assert_no_of_items_in_cart(expected_cnt=len(products_in_cart), items=items)
+
+        expected_total = sum(product.price for product in products_in_cart)
+        actual_total = sum(LineItemReader.pick(items, item_name=product.name).price_value for product in products_in_cart)
+
+        assert abs(expected_total - actual_total) < 0.01, f"Expected total {expected_total}, but got {actual_total}"
+
+        tax = await self._get_price_value(self.tax)
+        actual_grand_total = await self._get_price_value(self.grand_total)
+        assert abs(expected_total + tax - actual_grand_total) < 0.01, \
+            f"Expected grand total {expected_total + tax}, but got {actual_grand_total}"
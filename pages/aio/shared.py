@@ -0,0 +1,80 @@
+from typing import Optional
+from playwright.sync_api import Locator, TimeoutError
+from pages.app_state import AppState
+from pages.base_page import AppPage, BasePage, Element
+from pages.cart_observer import CartObserver, CartState
+from pages.layout import LAYOUT_SCRIPT, LayoutSnapshot
+
+
+class AsyncBasePage(BasePage):
+    """
+    BasePage for the async API, the readiness contract and layout snapshot are awaited
+    """
+
+    __slots__ = ()
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> None:
+        contract = self.readiness_contract()
+        try:
+            await self.page.wait_for_function(f"(contract) => ({self.READY_SCRIPT})(contract).length === 0", arg=contract, timeout=timeout)
+        except TimeoutError:
+            raise self.not_ready_error(await self.page.evaluate(self.READY_SCRIPT, contract)) from None
+
+    async def snapshot_layout(self) -> LayoutSnapshot:
+        return LayoutSnapshot(await self.page.evaluate(LAYOUT_SCRIPT, self.layout_checks()))
+
+
+class AsyncAppPage(AsyncBasePage, AppPage):
+    """
+    AppPage for the async API, header, app state and cart event helpers that talk to the browser are awaited
+    """
+
+    __slots__ = ()
+
+    async def shopping_cart_badge_value(self) -> int:
+        return (await self.app_state()).badge
+
+    async def app_state(self) -> AppState:
+        return AppState.from_probe(await self.page.evaluate(AppState.PROBE_SCRIPT, AppState.probe_args()))
+
+    async def assert_state(self, **expected) -> AppState:
+        state = await self.app_state()
+        mismatches = state.mismatches(**expected)
+        assert not mismatches, ", ".join(f"expected {name}={want!r}, found {found!r}" for name, (want, found) in mismatches.items()) + f" in {state.describe()}"
+        return state
+
+    @classmethod
+    async def observe_cart(cls, page) -> None:
+        await CartObserver.install(page, cls.SHOPPING_CART_BADGE, cls.SHOPPING_CART_LINK)
+
+    async def wait_for_badge(self, expected_value: int) -> Optional[CartState]:
+        state = CartObserver.to_state(await self.page.evaluate(CartObserver.WAIT_FOR_BADGE_SCRIPT, [expected_value, CartObserver.TIMEOUT * 1000]))
+        if state is not None and state.timed_out:
+            raise AssertionError(f"Expected the cart badge to show {expected_value}, {state.describe()}")
+        return state
+
+    async def click_and_observe(self, locator) -> Optional[CartState]:
+        await locator.click()
+        return CartObserver.to_state(await self.page.evaluate(CartObserver.WAIT_FOR_CLICK_SCRIPT, CartObserver.TIMEOUT * 1000))
+
+
+def shares_selectors(sync_page: type):
+    """
+    Class decorator for an async twin of a sync page object.
+    Copies the selector constants, the Element declarations, the properties that only build a
+    Locator and the methods marked with @locator_builder (page.locator / get_by_text are not awaited
+    in the async API either). Everything that talks to the browser, even a Locator getter that calls
+    count() first, is written again with await.
+    """
+    def decorate(cls: type) -> type:
+        for name, value in vars(sync_page).items():
+            if name in vars(cls):
+                continue
+            builds_locator = (isinstance(value, property) and value.fget.__annotations__.get("return") is Locator) or \
+                getattr(value, "builds_locator", False)
+            if name.isupper() or isinstance(value, Element) or builds_locator:
+                setattr(cls, name, value)
+        cls.shares_selectors_of = sync_page
+        return cls
+
+    return decorate
@@ -0,0 +1,133 @@
+import json
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple
+from playwright.sync_api import Page
+from utils.cart_seed import CART_STORAGE_KEY
+
+SESSION_COOKIE = "session-username"
+
+
+@dataclass(frozen=True)
+class AppState:
+    """
+    Everything a test usually asks the app one locator at a time, read in one evaluate:
+
+        state = AppState.probe(page)
+        assert state.view == "cart" and state.badge == len(state.cart)
+
+    Pages behind the login build their assertions on it through AppPage.app_state / assert_state.
+    """
+
+    url: str
+    view: str                   # file name of the page without .html, "login" for the root
+    persona: Optional[str]      # username in the session cookie, None when logged out
+    cart: Tuple[int, ...]       # inventory ids in localStorage
+    badge: int                  # cart badge value, 0 when there is no badge
+    title: str                  # secondary header title ("Products", "Your Cart", ...)
+    sort: Optional[str]         # label of the selected sort option, None off the inventory
+    dialogs: Tuple[str, ...]    # open in-page dialogs, "menu" for the burger menu
+    alerts: Tuple[str, ...]     # alert / confirm / prompt messages since the page loaded
+
+    # window.alert and friends are wrapped before the app runs, a native dialog is closed again
+    # by the time an evaluate can run, so the probe can only report it after the fact
+    INIT_SCRIPT = """
+    (() => {
+        if (window.__appDialogs) return;
+        window.__appDialogs = [];
+        for (const name of ["alert", "confirm", "prompt"]) {
+            const original = window[name];
+            window[name] = function (message, ...rest) {
+                window.__appDialogs.push(String(message ?? ""));
+                return original.call(this, message, ...rest);
+            };
+        }
+    })();
+    """
+
+    PROBE_SCRIPT = """
+    ([cartKey, cookie, selectors]) => {
+        const text = (selector) => {
+            const element = document.querySelector(selector);
+            return element ? element.textContent.trim() : "";
+        };
+        const cart = () => {
+            try {
+                const ids = JSON.parse(localStorage.getItem(cartKey) || "[]");
+                return Array.isArray(ids) ? ids : [];
+            } catch (error) {
+                return [];
+            }
+        };
+        const persona = document.cookie.split("; ").find((entry) => entry.startsWith(cookie + "="));
+        const sort = document.querySelector(selectors.sort);
+        const menu = document.querySelector(selectors.menu);
+        const shown = (element) => !element.hidden && element.getAttribute("aria-hidden") !== "true";
+        const dialogs = [...document.querySelectorAll(selectors.dialogs)].filter(shown)
+            .map((element) => element.id || element.getAttribute("aria-label") || element.tagName.toLowerCase());
+        if (menu && shown(menu)) dialogs.unshift("menu");
+        const page = location.pathname.split("/").pop().replace(/\\.html$/, "");
+
+        return {
+            url: location.href,
+            view: page || "login",
+            persona: persona ? decodeURIComponent(persona.slice(cookie.length + 1)) || null : null,
+            cart: cart(),
+            badge: parseInt(text(selectors.badge), 10) || 0,
+            title: text(selectors.title),
+            sort: sort && sort.selectedOptions.length ? sort.selectedOptions[0].textContent.trim() : null,
+            dialogs,
+            alerts: window.__appDialogs || [],
+        };
+    }
+    """
+
+    SELECTORS = {
+        "badge": '[data-test="shopping-cart-badge"]',
+        "title": '[data-test="title"]',
+        "sort": '[data-test="product-sort-container"]',
+        "menu": ".bm-menu-wrap",
+        "dialogs": 'dialog[open], [role="dialog"], [role="alertdialog"], [aria-modal="true"]',
+    }
+
+    @classmethod
+    def install(cls, page: Page):
+        """
+        Records alert / confirm / prompt messages on every document the page loads from now on (await it for an async page)
+        """
+        return page.add_init_script(script=cls.INIT_SCRIPT)
+
+    @classmethod
+    def probe_args(cls) -> list:
+        return [CART_STORAGE_KEY, SESSION_COOKIE, cls.SELECTORS]
+
+    @classmethod
+    def probe(cls, page: Page) -> "AppState":
+        """
+        The whole app state in one round trip, for an async page use from_probe(await page.evaluate(...))
+        """
+        return cls.from_probe(page.evaluate(cls.PROBE_SCRIPT, cls.probe_args()))
+
+    @classmethod
+    def from_probe(cls, result: dict) -> "AppState":
+        return cls(**{field.name: tuple(result[field.name]) if isinstance(result[field.name], list) else result[field.name]
+                      for field in fields(cls)})
+
+    def mismatches(self, **expected) -> dict:
+        """
+        {field: (expected, actual)} for every expected field the state does not have
+        """
+        unknown = expected.keys() - {field.name for field in fields(self)}
+        if unknown:
+            raise TypeError(f"AppState has no field(s) {', '.join(sorted(unknown))}")
+
+        found = {}
+        for name, value in expected.items():
+            actual = getattr(self, name)
+            if isinstance(actual, tuple) and isinstance(value, (list, tuple)):
+                value = tuple(value)
+            if actual != value:
+                found[name] = (value, actual)
+        return found
+
+    def describe(self) -> str:
+        return json.dumps({field.name: getattr(self, field.name) for field in fields(self)})
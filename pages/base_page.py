@@ -0,0 +1,249 @@
+import ast
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from playwright.sync_api import Locator, Page, TimeoutError
+from pages.app_state import AppState
+from pages.cart_observer import CartObserver, CartState
+from pages.layout import LAYOUT_SCRIPT, LayoutSnapshot
+
+Selector = Union[str, "re.Pattern[str]"]
+
+
+def locator_builder(method):
+    """
+    Marks a method that only builds a Locator (no count(), no evaluate), so the async twins
+    can share it, see pages.aio.shared.shares_selectors
+    """
+    method.builds_locator = True
+    return method
+
+
+class Element:
+    """
+    Declares a locator on a page class, built on first access and memoized per page object:
+
+        username = Element(USERNAME_FIELD)
+        page_heading = Element(PAGE_HEADING, by="text")
+    """
+
+    __slots__ = ("selector", "by", "owner", "name")
+
+    # every declaration, for the unused selector report
+    declared: List["Element"] = []
+
+    def __init__(self, selector: Selector, by: str = "css") -> None:
+        self.selector = selector
+        self.by = by
+        self.owner = ""
+        self.name = ""
+        Element.declared.append(self)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner.__name__
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.locator(self.selector, self.by)
+
+    def as_check(self) -> dict:
+        """
+        The element as the readiness script sees it, css chains (a >> b) become descendant selectors
+        """
+        if self.by == "text":
+            pattern = self.selector if isinstance(self.selector, re.Pattern) else re.compile(re.escape(self.selector), re.I)
+            return {"label": self.name, "by": "text", "source": pattern.pattern, "flags": "i" if pattern.flags & re.I else ""}
+        return {"label": self.name, "by": "css", "selector": self.selector.replace(" >> ", " ")}
+
+
+class BasePage:
+    """
+    Page objects are created in nearly every fixture and test, so they carry no __dict__
+    and only build the locators a test actually touches, once.
+    """
+
+    __slots__ = ("page", "_locators")
+
+    #-----------Readiness contract-----------
+    # a page is ready when the URL matches READY_URL (if set) and every READY_ELEMENTS entry is visible
+    READY_URL: Optional["re.Pattern[str]"] = None
+    READY_ELEMENTS: Tuple[Element, ...] = ()
+
+    # returns the labels of what is not there yet, body text stands in for get_by_text
+    READY_SCRIPT = """
+    ({url, checks}) => {
+        const missing = [];
+        if (url && !new RegExp(url.source, url.flags).test(location.href)) missing.push(`url ~ /${url.source}/`);
+        const bodyText = checks.some((check) => check.by === "text") ? document.body?.innerText ?? "" : "";
+        const visible = (element) => {
+            const box = element.getBoundingClientRect();
+            return box.width > 0 && box.height > 0 && getComputedStyle(element).visibility !== "hidden";
+        };
+        for (const check of checks) {
+            const found = check.by === "text"
+                ? new RegExp(check.source, check.flags).test(bodyText)
+                : [...document.querySelectorAll(check.selector)].some(visible);
+            if (!found) missing.push(check.label);
+        }
+        return missing;
+    }
+    """
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+        self._locators = {}
+
+    def locator(self, selector: Selector, by: str = "css") -> Locator:
+        key = (by, selector)
+        locator = self._locators.get(key)
+
+        if locator is None:
+            locator = self.page.get_by_text(selector) if by == "text" else self.page.locator(selector)
+            self._locators[key] = locator
+
+        return locator
+
+    def readiness_contract(self) -> dict:
+        url = self.READY_URL
+        return {
+            "url": {"source": url.pattern, "flags": "i" if url.flags & re.I else ""} if url is not None else None,
+            "checks": [element.as_check() for element in self.READY_ELEMENTS],
+        }
+
+    def not_ready_error(self, missing: List[str]) -> AssertionError:
+        return AssertionError(f"{type(self).__name__} not ready, missing: {', '.join(missing) or 'nothing (page changed while checking)'}")
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the whole readiness contract in one in-page poll
+        """
+        contract = self.readiness_contract()
+        try:
+            self.page.wait_for_function(f"(contract) => ({self.READY_SCRIPT})(contract).length === 0", arg=contract, timeout=timeout)
+        except TimeoutError:
+            raise self.not_ready_error(self.page.evaluate(self.READY_SCRIPT, contract)) from None
+
+    #-----------Layout-----------
+
+    @classmethod
+    def declared_elements(cls) -> Dict[str, Element]:
+        """
+        Every Element of the page class and its bases, by attribute name
+        """
+        elements = {}
+        for page_class in reversed(cls.__mro__):
+            elements.update((name, value) for name, value in vars(page_class).items() if isinstance(value, Element))
+        return elements
+
+    def layout_checks(self) -> List[dict]:
+        return [element.as_check() for element in self.declared_elements().values()]
+
+    def snapshot_layout(self) -> LayoutSnapshot:
+        """
+        Box, colours and text of every declared element in one evaluate, see LayoutSnapshot.diff
+        """
+        return LayoutSnapshot(self.page.evaluate(LAYOUT_SCRIPT, self.layout_checks()))
+
+
+class AppPage(BasePage):
+    """
+    Every page behind the login shares the primary header
+    """
+
+    __slots__ = ()
+
+    #-----------Headers--------------
+    BURGER_MENU_FIELD = '.bm-burger-button > button'
+    SHOPPING_CART_LINK = '[data-test="shopping-cart-link"]'
+    SHOPPING_CART_BADGE = '[data-test="shopping-cart-badge"]'
+    LOGOUT_FIELD = '[data-test="logout-sidebar-link"]'
+    PAGE_HEADING = re.compile(r"Swag Labs", re.I)
+
+    page_heading = Element(PAGE_HEADING, by="text")
+    burger_navigate_button = Element(BURGER_MENU_FIELD)
+    shopping_cart_badge = Element(SHOPPING_CART_BADGE)
+    logout_button = Element(LOGOUT_FIELD)
+
+    @property
+    def shopping_cart_badge_value(self) -> int:
+        return self.app_state.badge
+
+    #-----------App state--------------
+
+    @property
+    def app_state(self) -> AppState:
+        """
+        URL, persona, cart, badge, sort and dialogs in one evaluate, see AppState
+        """
+        return AppState.probe(self.page)
+
+    def assert_state(self, **expected) -> AppState:
+        """
+        Checks any AppState fields in one probe, e.g. assert_state(view="cart", badge=2)
+        """
+        state = self.app_state
+        mismatches = state.mismatches(**expected)
+        assert not mismatches, ", ".join(f"expected {name}={want!r}, found {found!r}" for name, (want, found) in mismatches.items()) + f" in {state.describe()}"
+        return state
+
+    #-----------Cart events--------------
+
+    @classmethod
+    def observe_cart(cls, page: Page) -> None:
+        """
+        Installs the CartObserver on page, before it navigates
+        """
+        CartObserver.install(page, cls.SHOPPING_CART_BADGE, cls.SHOPPING_CART_LINK)
+
+    def wait_for_badge(self, expected_value: int) -> Optional[CartState]:
+        """
+        Waits for the badge to show expected_value as one event, None if the page is not observed
+        """
+        state = CartObserver(self.page).wait_for_badge(expected_value)
+        if state is not None and state.timed_out:
+            raise AssertionError(f"Expected the cart badge to show {expected_value}, {state.describe()}")
+        return state
+
+    def click_and_observe(self, locator: Locator) -> Optional[CartState]:
+        """
+        Clicks and returns the cart once the app settled (state.changed tells if the click did anything)
+        """
+        return CartObserver(self.page).click(locator)
+
+
+#-----------------Unused selector report-----------------
+
+def _referenced_names(roots: Iterable[Path]) -> Set[str]:
+    names = set()
+    for root in roots:
+        for path in Path(root).rglob("*.py"):
+            for node in ast.walk(ast.parse(path.read_text(), filename=str(path))):
+                if isinstance(node, ast.Attribute):
+                    names.add(node.attr)
+                elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                    names.add(node.id)
+    return names
+
+
+def unused_selectors(roots: Iterable[Path]) -> List[str]:
+    """
+    Returns "Class.attribute" for every Element, and every selector constant of a page class,
+    that no source file under roots reads
+    """
+    referenced = _referenced_names(roots)
+    unused = {f"{element.owner}.{element.name}" for element in Element.declared
+              if element.name and element.name not in referenced}
+
+    pending = [BasePage]
+    while pending:
+        page_class = pending.pop()
+        pending.extend(page_class.__subclasses__())
+        if "shares_selectors_of" in vars(page_class):
+            continue    # async twins reuse the sync page's declarations
+        for name, value in vars(page_class).items():
+            if name.isupper() and isinstance(value, (str, re.Pattern)) and name not in referenced:
+                unused.add(f"{page_class.__name__}.{name}")
+
+    return sorted(unused)
@@ -0,0 +1,165 @@
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from playwright.sync_api import Locator, Page
+from utils.cart_seed import CART_STORAGE_KEY
+
+
+@dataclass(frozen=True)
+class CartState:
+    seq: int                    # sequence number of the last recorded change
+    badge: Optional[int]        # badge value, 0 when there is no badge, None before the header rendered
+    cart: Tuple[int, ...]       # inventory ids in localStorage
+    before: Optional[int] = 0   # for a click: badge value when it happened
+    changed: bool = True        # for a click: whether the cart or badge changed because of it
+    timed_out: bool = False
+    events: Tuple[dict, ...] = ()
+
+    def describe(self) -> str:
+        recent = ", ".join(f"#{event['seq']} {event['source']}={event['value']}" for event in self.events[-8:])
+        badge = "not rendered yet" if self.badge is None else self.badge
+        return f"badge {badge}, cart {list(self.cart)}, recent changes: {recent or 'none'}"
+
+
+class CartObserver:
+    """
+    Waits on cart events recorded in the page instead of polling the badge.
+
+    INIT_SCRIPT (added to every test page by the page fixture, see AppPage.observe_cart) hooks
+    localStorage writes of the cart and watches the badge with a MutationObserver. Every change goes into a sequence-numbered buffer
+    and wakes whoever waits on it. After each click it lets the app settle (a short delay and two
+    frames), then records whether that click changed anything, so a click that does nothing
+    (problem_user, error_user) is known at once instead of after a timeout.
+
+    Every wait is one evaluate. Without the init script the waits return None and callers fall back
+    to expect.
+    """
+
+    __slots__ = ("page",)
+
+    SETTLE_MS = 50
+    BUFFER_SIZE = 200
+    TIMEOUT = 5.0               # seconds, as long as expect waits
+
+    INIT_SCRIPT = """
+    (([key, badgeSelector, headerSelector, settleMs, bufferSize]) => {
+        if (window.__cartObserver) return;
+        const readCart = () => {
+            try { return JSON.parse(localStorage.getItem(key) || "[]"); } catch (error) { return []; }
+        };
+        // no badge only means an empty cart once the cart link that holds it is there
+        const readBadge = () => {
+            const badge = document.querySelector(badgeSelector);
+            if (badge) return parseInt(badge.textContent, 10) || 0;
+            return document.querySelector(headerSelector) ? 0 : null;
+        };
+        const observer = {
+            seq: 0, changes: 0, badge: null, cart: [], events: [], waiters: new Set(), lastClick: null,
+            snapshot(extra) {
+                return { seq: this.seq, badge: this.badge, cart: this.cart, events: this.events.slice(-8), ...extra };
+            },
+            record(source, value) {
+                this.seq += 1;
+                if (source === "badge" || source === "cart") this.changes += 1;
+                this.events.push({ seq: this.seq, source, value });
+                if (this.events.length > bufferSize) this.events.shift();
+                for (const waiter of [...this.waiters]) waiter();
+            },
+            wait(done, timeout) {
+                return new Promise((resolve) => {
+                    let timer = null;
+                    const check = () => {
+                        const result = done();
+                        if (!result) return;
+                        this.waiters.delete(check);
+                        clearTimeout(timer);
+                        resolve(result);
+                    };
+                    this.waiters.add(check);
+                    timer = setTimeout(() => { this.waiters.delete(check); resolve(this.snapshot({ timed_out: true })); }, timeout);
+                    check();
+                });
+            },
+            waitForBadge(count, timeout) {
+                return this.wait(() => this.badge === count && this.snapshot(), timeout);
+            },
+            waitForClick(timeout) {
+                return this.wait(() => this.lastClick && this.lastClick.settled && this.snapshot({ before: this.lastClick.before, changed: this.lastClick.changed }), timeout);
+            },
+        };
+        window.__cartObserver = observer;
+        observer.cart = readCart();
+        observer.badge = readBadge();
+
+        for (const name of ["setItem", "removeItem", "clear"]) {
+            const original = Storage.prototype[name];
+            Storage.prototype[name] = function (...args) {
+                const result = original.apply(this, args);
+                if (this === localStorage && (name === "clear" || args[0] === key)) {
+                    const cart = readCart();
+                    if (JSON.stringify(cart) !== JSON.stringify(observer.cart)) {
+                        observer.cart = cart;
+                        observer.record("cart", cart);
+                    }
+                }
+                return result;
+            };
+        }
+
+        new MutationObserver(() => {
+            const badge = readBadge();
+            if (badge !== observer.badge) {
+                // the header rendering the badge for the first time is not a cart change
+                const source = observer.badge === null ? "render" : "badge";
+                observer.badge = badge;
+                observer.record(source, badge);
+            }
+        }).observe(document, { childList: true, subtree: true, characterData: true });
+
+        document.addEventListener("click", () => {
+            const click = { since: observer.changes, before: observer.badge, settled: false, changed: false };
+            observer.lastClick = click;
+            setTimeout(() => requestAnimationFrame(() => requestAnimationFrame(() => {
+                click.changed = observer.changes > click.since;
+                click.settled = true;
+                observer.record("click", click.changed ? "changed" : "no change");
+            })), settleMs);
+        }, true);
+    })(%s);
+    """
+
+    WAIT_FOR_BADGE_SCRIPT = "([count, timeout]) => window.__cartObserver ? window.__cartObserver.waitForBadge(count, timeout) : null"
+    WAIT_FOR_CLICK_SCRIPT = "(timeout) => window.__cartObserver ? window.__cartObserver.waitForClick(timeout) : null"
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+
+    @classmethod
+    def install(cls, page: Page, badge_selector: str, header_selector: str):
+        """
+        Records cart changes on every document the page loads from now on (await it for an async page).
+        The badge counts as unknown, not 0, until header_selector (the cart link holding it) is rendered.
+        """
+        arguments = [CART_STORAGE_KEY, badge_selector, header_selector, cls.SETTLE_MS, cls.BUFFER_SIZE]
+        return page.add_init_script(script=cls.INIT_SCRIPT % json.dumps(arguments))
+
+    def wait_for_badge(self, count: int, timeout: float = TIMEOUT) -> Optional[CartState]:
+        """
+        Resolves as soon as the badge shows count (at once if it already does), timed_out otherwise
+        """
+        return self.to_state(self.page.evaluate(self.WAIT_FOR_BADGE_SCRIPT, [count, timeout * 1000]))
+
+    def click(self, locator: Locator, timeout: float = TIMEOUT) -> Optional[CartState]:
+        """
+        Clicks, then returns the cart once the app settled, with changed=False if the click did nothing
+        """
+        locator.click()
+        return self.to_state(self.page.evaluate(self.WAIT_FOR_CLICK_SCRIPT, timeout * 1000))
+
+    @staticmethod
+    def to_state(result: Optional[dict]) -> Optional[CartState]:
+        if result is None:
+            return None
+        events: List[dict] = result.get("events", [])
+        return CartState(result["seq"], result["badge"], tuple(result["cart"]), result.get("before", result["badge"]),
+                         result.get("changed", True), result.get("timed_out", False), tuple(events))
@@ -1,17 +1,20 @@
 import re
 import pytest
-from typing import List
+from typing import Dict, List, Optional
 from playwright.sync_api import Locator, Page, expect
 from test_data.product_data import PRODUCTS, Product
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
+from pages.line_items import LineItem, LineItemReader, row_selector
+from pages.base_page import AppPage, Element, locator_builder
+from pages.soft_assertions import SoftAssertions
+
+class CartPage(AppPage):
+
+    __slots__ = ()
 
-class CartPage:
     #-----------Headers--------------
     YOUR_CART_FIELD = '[data-test="title"]'
-    BURGER_MENU_FIELD = '.bm-burger-button > button'
-    SHOPPING_CART_LINK = '[data-test="shopping-cart-link"]'
-    SHOPPING_CART_BADGE = '[data-test="shopping-cart-badge"]'
 
     #-----------Selectors-------------
     CART_LIST_FIELD = '[data-test="cart-list"]'
@@ -23,6 +26,7 @@ class CartPage:
     ITEM_NAME_FIELD = '[data-test="inventory-item-name"]'
     ITEM_DESC_FIELD = '[data-test="inventory-item-desc"]'
     ITEM_PRICE_FIELD = '[data-test="inventory-item-price"]'
+    ITEM_QUANTITY_FIELD = '[data-test="item-quantity"]'
     REMOVE_BUTTON_FIELD = '[data-test^="remove-"]'
 
     #------------Footer----------------
@@ -32,86 +36,41 @@ class CartPage:
 
     #----------Validations-----------
     CART_URL = re.compile(r"cart.html", re.I)
-    PAGE_HEADING = re.compile(r"Swag Labs", re.I)
-
-    #----------Navigation buttons---------
-    LOGOUT_FIELD = '[data-test="logout-sidebar-link"]'
-    
-
-    
-    def __init__(self, page: Page):
-        self.page = page
 
     #----------Locators-------------
 
-    @property
-    def page_heading(self) -> Locator:
-        return self.page.get_by_text(self.PAGE_HEADING)
+    your_cart = Element(YOUR_CART_FIELD)
+    shopping_cart = Element(AppPage.SHOPPING_CART_LINK)
+    cart_list = Element(CART_LIST_FIELD)
+    quantity_column = Element(QTY_FIELD)
+    description_col = Element(DESCRIPTION_FIELD)
+    inventory_items = Element(INVENTORY_ITEMS)
+    cart_footer = Element(CART_FOOTER_FIELD)
+    continue_shopping_button = Element(CONTINUE_SHOPPING_FIELD)
+    checkout_button = Element(CHECKOUT_FIELD)
 
-    @property
-    def burger_navigate_button(self) -> Locator:
-        return self.page.locator(self.BURGER_MENU_FIELD)
-
-    @property
-    def your_cart(self) -> Locator:
-        return self.page.locator(self.YOUR_CART_FIELD)
-    
-    @property
-    def shopping_cart(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_LINK)
-    
-    @property
-    def shopping_cart_badge(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_BADGE)
-    
-    @property
-    def shopping_cart_badge_value(self) -> int:
-        badge = self.shopping_cart_badge
-        if badge.count() == 0 : return 0
-        return int(self.shopping_cart_badge.inner_text())
-    
-    @property
-    def cart_list(self) -> Locator:
-        return self.page.locator(self.CART_LIST_FIELD)
-    
-    @property
-    def quantity_column(self) -> Locator:
-        return self.page.locator(self.QTY_FIELD)
+    #----------Readiness-------------
+    READY_URL = CART_URL
+    READY_ELEMENTS = (AppPage.page_heading, your_cart, continue_shopping_button, checkout_button)
 
     @property
     def get_cart_items_count(self) -> int:
         return self.inventory_items.count()
-    
-    @property
-    def description_col(self) -> Locator:
-        return self.page.locator(self.DESCRIPTION_FIELD)
-
-    @property
-    def inventory_items(self) -> Locator:
-        return self.page.locator(self.INVENTORY_ITEMS)
-
-    @property
-    def cart_footer(self) -> Locator:
-        return self.page.locator(self.CART_FOOTER_FIELD)
 
-    @property
-    def continue_shopping_button(self) -> Locator:
-        return self.page.locator(self.CONTINUE_SHOPPING_FIELD)
-    
-    @property
-    def checkout_button(self) -> Locator:
-        return self.page.locator(self.CHECKOUT_FIELD)
-    
-    @property
-    def logout_button(self) -> Locator:
-        return self.page.locator(self.LOGOUT_FIELD)
-    
     @property
     def is_cart_empty(self) -> bool:
         return self.get_cart_items_count == 0
 
 
     #----------Getters------------
+    @locator_builder
+    def item_row(self, item_name: str) -> Locator:
+        """
+        The row of item_name, by its inventory id (a text filter for products outside the catalog)
+        """
+        selector = row_selector(self.INVENTORY_ITEMS, item_name)
+        return self.locator(selector) if selector else self.inventory_items.filter(has_text=item_name)
+
     def get_inventory_item(self, item_name = None , index = None) -> Locator:
         """
         Return a locator of inventory Item of the required item
@@ -120,7 +79,7 @@ class CartPage:
             raise AssertionError("Cart is empty, No Inventory items found")
 
         if item_name:
-            item = self.inventory_items.filter(has_text=item_name)
+            item = self.item_row(item_name)
             if item.count() == 0:
                 raise ValueError(f"Item with name '{item_name}' not found in the cart")
             return item
@@ -134,17 +93,19 @@ class CartPage:
             raise ValueError("Either item_name or index must be provided")
         
 
-    def get_item_details(self, item_name = None, index= None) -> dict:
+    def get_line_items(self) -> Dict[str, LineItem]:
         """
-        Returns a dict containing the product details
+        Returns every cart row by product name, read in one round trip
         """
+        reader = LineItemReader(self.inventory_items, self.ITEM_NAME_FIELD, self.ITEM_DESC_FIELD, self.ITEM_PRICE_FIELD, self.ITEM_QUANTITY_FIELD)
+        return reader.snapshot()
 
-        item = self.get_inventory_item(item_name=item_name, index=index)        
-        return {
-            "name" : item.locator(self.ITEM_NAME_FIELD).inner_text(),
-            "description" : item.locator(self.ITEM_DESC_FIELD).inner_text(),
-            "price" : item.locator(self.ITEM_PRICE_FIELD).inner_text()
-        }
+    def get_item_details(self, item_name = None, index= None, items: Optional[Dict[str, LineItem]] = None) -> dict:
+        """
+        Returns a dict containing the product details, looked up in items when a snapshot is at hand
+        """
+        items = items if items is not None else self.get_line_items()
+        return LineItemReader.pick(items, item_name=item_name, index=index).as_details()
 
     def remove_button(self, item_name = None , index = None) -> Locator:
         return self.get_inventory_item(item_name, index).locator(self.REMOVE_BUTTON_FIELD)
@@ -155,13 +116,16 @@ class CartPage:
         expect(self.page).to_have_url(self.CART_URL)
 
 
-    def assert_product_count_in_cart(self, expected_count) -> None:
-        actual_cnt = self.get_cart_items_count
+    def assert_product_count_in_cart(self, expected_count, items: Optional[Dict[str, LineItem]] = None) -> None:
+        actual_cnt = len(items if items is not None else self.get_line_items())
         assert actual_cnt == expected_count, f"Expected {expected_count} products, but found {actual_cnt}"
 
     
     def assert_shopping_badge_value_equal_as_cart_cnt(self) -> None:
         cart_cnt = self.get_cart_items_count
+        if self.wait_for_badge(cart_cnt) is not None:
+            return
+
         shopping_badge_cnt = self.shopping_cart_badge_value
 
         assert cart_cnt == shopping_badge_cnt, f"Expected {cart_cnt} , but found {shopping_badge_cnt}"
@@ -191,7 +155,9 @@ class CartPage:
     
     def press_remove_button_and_assert_badge_count(self, item_name = None, index = None) -> None:
         current_cnt = self.shopping_cart_badge_value
-        self.press_remove_button(item_name=item_name, index=index)
+        state = self.click_and_observe(self.remove_button(item_name=item_name, index=index))
+        if state is not None and not state.changed:
+            raise AssertionError(f"Remove did not change the cart, {state.describe()}")
         self.assert_product_count_in_cart(expected_count=current_cnt-1)
         self.assert_shopping_badge_value_equal_as_cart_cnt()
 
@@ -215,17 +181,13 @@ class CartPage:
 
 
     def check_products_data(self, products_in_cart : List[Product]) -> None: 
-        expected_count = len(products_in_cart)
-        self.assert_product_count_in_cart(expected_count= expected_count)
-
-        for product in products_in_cart:
-
-            #find the product in inventory
-            item_details = self.get_item_details(item_name=product.name)
+        with SoftAssertions(self.get_line_items, self.page) as soft:
+            soft.equal("Number of products in cart", len, len(products_in_cart))
 
-            assert item_details["name"] == product.name, f"Name mismatch for {product.name}"
-            assert item_details["description"] == product.description, f"Description mismatch for {product.name}"
-            assert float(item_details["price"].replace("$", "")) == product.price, f"Price mismatch for {product.name}"
+            for product in products_in_cart:
+                soft.check(f"{product.name} not found in the cart", lambda items, name=product.name: name in items, found=list)
+                soft.equal(f"Description mismatch for {product.name}", lambda items, name=product.name: items[name].description, product.description)
+                soft.equal(f"Price mismatch for {product.name}", lambda items, name=product.name: items[name].price_value, product.price)
 
     def relogin_and_navigate_to_cart_page(self, username: str = "standard_user", password : str = "secret_sauce"):
         self.press_logout_button()
@@ -4,13 +4,12 @@ from typing import List
 from playwright.sync_api import Locator, Page, expect
 from test_data.product_data import PRODUCTS, Product
 from pages.order_page import OrderPage
+from pages.base_page import AppPage, Element
 
 
-class CheckoutPage :
+class CheckoutPage(AppPage) :
 
-    BURGER_MENU_FIELD = '.bm-burger-button > button'
-    SHOPPING_CART_LINK = '[data-test="shopping-cart-link"]'
-    SHOPPING_CART_BADGE = '[data-test="shopping-cart-badge"]'
+    __slots__ = ()
     
     FIRST_NAME_FIELD = '[data-test="firstName"]'
     LAST_NAME_FIELD = '[data-test="lastName"]'
@@ -26,54 +25,23 @@ class CheckoutPage :
 
     ERROR_FIELD = '[data-test="error"]'
 
-    def __init__(self, page : Page):
-        self.page = page
+    #------------Locators---------------
+    checkout_title = Element(CHECKOUT_FIELD)
+    first_name = Element(FIRST_NAME_FIELD)
+    zip_code = Element(ZIP_CODE_FIELD)
+    last_name = Element(LAST_NAME_FIELD)
+    continue_button = Element(CONTINUE_BUTTON)
+    cancel_button = Element(CANCEL_BUTTON)
+    shopping_cart = Element(AppPage.SHOPPING_CART_LINK)
+    error_message = Element(ERROR_FIELD)
 
-    @property
-    def checkout_text(self) -> str:
-        return self.page.locator(self.CHECKOUT_FIELD).inner_text()
-    
-    @property
-    def first_name(self) -> Locator:
-        return self.page.locator(self.FIRST_NAME_FIELD)
-    
-    @property
-    def zip_code(self) -> Locator:
-        return self.page.locator(self.ZIP_CODE_FIELD)
-    
-    @property
-    def last_name(self) -> Locator:
-        return self.page.locator(self.LAST_NAME_FIELD)
-    
-    @property
-    def continue_button(self) -> Locator:
-        return self.page.locator(self.CONTINUE_BUTTON)
-    
-    @property
-    def cancel_button(self) -> Locator:
-        return self.page.locator(self.CANCEL_BUTTON)
-    
-    @property
-    def burger_navigate_button(self) -> Locator:
-        return self.page.locator(self.BURGER_MENU_FIELD)
-    
-    @property
-    def shopping_cart(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_LINK)
-    
-    @property
-    def shopping_cart_badge(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_BADGE)
-    
-    @property
-    def shopping_cart_badge_value(self) -> int:
-        badge = self.shopping_cart_badge
-        if badge.count() == 0 : return 0
-        return int(self.shopping_cart_badge.inner_text())
+    #------------Readiness---------------
+    READY_URL = CHECKOUT_URL
+    READY_ELEMENTS = (first_name, last_name, zip_code, continue_button)
 
     @property
-    def error_message(self) -> Locator:
-        return self.page.locator(self.ERROR_FIELD)
+    def checkout_text(self) -> str:
+        return self.checkout_title.inner_text()
 
     def is_checkout_page(self):
         expect(self.page).to_have_url(self.CHECKOUT_URL)
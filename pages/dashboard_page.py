@@ -1,13 +1,35 @@
 import re
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import urljoin
+import numpy as np
 from playwright.sync_api import Locator, Page, expect
+from pages.base_page import AppPage, Element, locator_builder
+from pages.cart_observer import CartState
+from pages.soft_assertions import SoftAssertions
 from test_data.filter_data import Filter
+from test_data.product_data import SLUGS, product_slug
+from utils.visual import crop_tiles, tile_layout
 
-class DashboardPage :
+
+@dataclass(frozen=True)
+class InventoryCard:
+    name: str
+    description: str
+    price: str
+    image_src: str
+    button: str     # "add", "remove" or "" when the card has neither
+
+
+class DashboardPage(AppPage) :
+
+    __slots__ = ("dialog_message",)
 
     #------------Headers------------
     PRIMARY_HEADER = '[data-test="primary-header"]'
     BURGER_MENU_BUTTON = f'{PRIMARY_HEADER} >> #react-burger-menu-btn'    
-    SHOPPING_CART_BUTTON = '[data-test="shopping-cart-link"]'
+    SHOPPING_CART_BUTTON = AppPage.SHOPPING_CART_LINK
     LOGOUT_BUTTON = f'{PRIMARY_HEADER} >> #logout_sidebar_link'
 
 
@@ -36,20 +58,19 @@ class DashboardPage :
 
     #-----------selectors------------
 
-    SHOPPING_CART_BADGE = '[data-test="shopping-cart-badge"]'
     REMOVE_BUTTON_FIELD = '[data-test^="remove-"]'
     REMOVE_BUTTON = f'{INVENTORY_ITEMS} >> {REMOVE_BUTTON_FIELD}'
 
+    # per product buttons, by the slug of its name
+    ADD_TO_CART_BY_SLUG = '[data-test="add-to-cart-{slug}"]'
+    REMOVE_BY_SLUG = '[data-test="remove-{slug}"]'
+
     CART_PAGE_CONTINUE_SHOPPING = '[name="continue-shopping"]'
     PRODUCT_PRICES = '[data-test="inventory-item-price"]'
     
-
-    #-----------page texts-----------
-    PAGE_HEADING = re.compile(r"Swag Labs", re.I)
-
-    
     
     #---------------Validations-----------
+    INVENTORY_PATH = "inventory.html"
     CART_URL = re.compile(r"cart.html", re.I)
     INVENTORY_URL = re.compile(r"inventory.html", re.I)
     
@@ -57,104 +78,127 @@ class DashboardPage :
     #----------------Mask-----------------
     PRICE_BAR = '.pricebar'
 
-    def __init__(self, page: Page) -> None:
-        self.page = page
-    
-    
-    
-    #--------------locators---------------
-    @property
-    def burger_menu_button(self) -> Locator:
-        return self.page.locator(self.BURGER_MENU_BUTTON)
-
-    @property
-    def filter_button(self) -> Locator:
-        return self.page.locator(self.FILTER_BUTTON)
+    #---------------Snapshot--------------
+    # reads every card in one round trip, text is whitespace-normalised like expect(...).to_have_text
+    SNAPSHOT_SCRIPT = """
+    (cards, [name, desc, price, img, add, remove]) => {
+        const text = (card, selector) => {
+            const element = card.querySelector(selector);
+            return element ? element.textContent.replace(/\\s+/g, " ").trim() : "";
+        };
+        return cards.map((card) => ({
+            name: text(card, name),
+            description: text(card, desc),
+            price: text(card, price),
+            image_src: card.querySelector(img)?.getAttribute("src") ?? "",
+            button: card.querySelector(remove) ? "remove" : card.querySelector(add) ? "add" : "",
+        }));
+    }
+    """
+    # page coordinates of every card's tile once its images are decoded, null for a card without one
+    TILES_SCRIPT = """
+    async (cards, tile) => {
+        const tiles = cards.map((card) => card.querySelector(tile));
+        const images = tiles.flatMap((element) => element ? [element, ...element.querySelectorAll("img")] : [])
+            .filter((element) => element.tagName === "IMG" && !element.complete);
+        await Promise.all(images.map((image) => image.decode().catch(() => null)));
+        return {
+            scale: window.devicePixelRatio,
+            boxes: tiles.map((element) => {
+                if (!element) return null;
+                const rect = element.getBoundingClientRect();
+                return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+            }),
+        };
+    }
+    """
+    SNAPSHOT_RENDER_TIMEOUT = 2.0
+    SNAPSHOT_RENDER_INTERVAL = 50
 
-    @property
-    def primary_header(self) -> Locator:
-        return self.page.locator(self.PRIMARY_HEADER)
-
-    @property
-    def shopping_cart_button(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_BUTTON)
-    
-    @property
-    def inventory_container(self) -> Locator:
-        return self.page.locator(self.INVENTORY_CONTAINER)
-    
-    @property
-    def shopping_cart_badge(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_BADGE)
-    
-    @property
-    def page_heading(self) -> Locator:
-        return self.page.get_by_text(self.PAGE_HEADING)
-    
-    @property
-    def products_title(self)  -> Locator:
-        return self.page.locator(self.PRODUCTS_TITLE)
-   
-    @property
-    def inventory_items(self) -> Locator:
-        return self.page.locator(self.INVENTORY_ITEMS)
-    
-    @property
-    def cart_page_continue_shopping(self) -> Locator:
-        return self.page.locator(self.CART_PAGE_CONTINUE_SHOPPING)
-    
-    @property
-    def product_prices(self) -> Locator:
-        return self.page.locator(self.PRODUCT_PRICES)
-
-    @property
-    def price_bar_mask(self) -> Locator:
-        return self.page.locator(self.PRICE_BAR)
-    
-    @property
-    def go_back_to_dashboard_button(self) -> Locator:
-        return self.page.locator(self.BACK_TO_PRODUCTS_BUTTON)
-    
-    @property
-    def item_name(self) -> Locator:
-        return self.page.locator(self.ITEM_NAME)   
-    
-    @property
-    def item_desc(self) -> Locator:
-        return self.page.locator(self.ITEM_DESC)   
-    
-    @property
-    def item_price(self) -> Locator:
-        return self.page.locator(self.ITEM_PRICE)
-    
-    @property
-    def details_item_img(self) -> Locator:
-        return self.page.locator(self.DETAILS_ITEM_IMG)
-    
-    @property
-    def logout_button(self) -> Locator:
-        return self.page.locator(self.LOGOUT_BUTTON)
-
-    @property
-    def active_filter(self) -> Locator:
-        return self.page.locator(f'{self.FILTER_BUTTON} option:checked')
+    #--------------locators---------------
+    burger_menu_button = Element(BURGER_MENU_BUTTON)
+    filter_button = Element(FILTER_BUTTON)
+    primary_header = Element(PRIMARY_HEADER)
+    shopping_cart_button = Element(SHOPPING_CART_BUTTON)
+    inventory_container = Element(INVENTORY_CONTAINER)
+    products_title = Element(PRODUCTS_TITLE)
+    inventory_items = Element(INVENTORY_ITEMS)
+    cart_page_continue_shopping = Element(CART_PAGE_CONTINUE_SHOPPING)
+    product_prices = Element(PRODUCT_PRICES)
+    price_bar_mask = Element(PRICE_BAR)
+    go_back_to_dashboard_button = Element(BACK_TO_PRODUCTS_BUTTON)
+    item_name = Element(ITEM_NAME)
+    item_desc = Element(ITEM_DESC)
+    item_price = Element(ITEM_PRICE)
+    details_item_img = Element(DETAILS_ITEM_IMG)
+    logout_button = Element(LOGOUT_BUTTON)
+
+    #--------------readiness---------------
+    READY_URL = INVENTORY_URL
+    READY_ELEMENTS = (AppPage.page_heading, products_title, shopping_cart_button, inventory_container)
 
     #-------------Helper----------------
     def get_inventory_items_count(self) -> int:
         return self.inventory_items.count()
     
+    @locator_builder
     def get_add_to_cart_button(self, index: int) -> Locator:
-        return self.page.locator(self.ADD_TO_CART_BUTTON).nth(index)
+        return self.locator(self.ADD_TO_CART_BUTTON).nth(index)
     
+    @locator_builder
     def get_remove_button(self, index: int) -> Locator:
-        return self.page.locator(self.REMOVE_BUTTON).nth(index)
+        return self.locator(self.REMOVE_BUTTON).nth(index)
     
-    def get_remove_button_by_name(self, product_name) -> None:
-        product_card = self.inventory_items.filter(has_text=product_name)
-        remove_button = product_card.locator(self.REMOVE_BUTTON_FIELD)
-        return remove_button
+    def snapshot_inventory(self) -> List[InventoryCard]:
+        """
+        Returns every product card on the page, in display order, from a single evaluate call
+        """
+        selectors = [self.ITEM_NAME, self.ITEM_DESC, self.ITEM_PRICE, self.ITEM_IMG, self.ADD_TO_CART_BUTTON_FIELD, self.REMOVE_BUTTON_FIELD]
+        cards = self.inventory_items.evaluate_all(self.SNAPSHOT_SCRIPT, selectors)
+        return [InventoryCard(**card) for card in cards]
+
+    def capture_product_tiles(self, tile_selector: str = ITEM_IMG) -> List[np.ndarray]:
+        """
+        Every card's tile_selector element as RGB pixels, in display order. One evaluate reads where
+        the tiles are, one screenshot covers them all and the tiles are cut out of it locally.
+        """
+        layout = self.inventory_items.evaluate_all(self.TILES_SCRIPT, tile_selector)
+        boxes, scale = layout["boxes"], layout["scale"]
+        if not boxes or None in boxes:
+            raise AssertionError(f"Expected a '{tile_selector}' in every product card, found {boxes}")
+
+        (left, top, width, height), tiles = tile_layout(boxes, scale)
+        grid = self.page.screenshot(clip={"x": left, "y": top, "width": width, "height": height}, full_page=True)
+        return crop_tiles(grid, tiles)
+
+    def wait_for_inventory_snapshot(self, expected_count: int) -> List[InventoryCard]:
+        """
+        Snapshots the grid, retrying for a short while only if it has fewer cards than expected
+        """
+        deadline = time.monotonic() + self.SNAPSHOT_RENDER_TIMEOUT
+        cards = self.snapshot_inventory()
+
+        while len(cards) < expected_count and time.monotonic() < deadline:
+            self.page.wait_for_timeout(self.SNAPSHOT_RENDER_INTERVAL)
+            cards = self.snapshot_inventory()
+
+        return cards
+
+    @locator_builder
+    def get_add_to_cart_button_by_name(self, product_name: str) -> Locator:
+        slug = SLUGS.get(product_name) or product_slug(product_name)
+        return self.locator(self.ADD_TO_CART_BY_SLUG.format(slug=slug))
+
+    @locator_builder
+    def get_remove_button_by_name(self, product_name: str) -> Locator:
+        slug = SLUGS.get(product_name) or product_slug(product_name)
+        return self.locator(self.REMOVE_BY_SLUG.format(slug=slug))
 
     #-------------navigations--------------
+    def open_inventory_page(self, url) -> None:
+        self.page.goto(urljoin(url, self.INVENTORY_PATH))
+        self.is_inventory_page()
+
     def open_cart_page(self) -> None :
         self.shopping_cart_button.click()
         self.assert_cart_page()
@@ -182,10 +226,7 @@ class DashboardPage :
         assert actual_count == expected_count, f"Expected {expected_count} products, but found {actual_count}"
 
     def wait_until_page_fields_are_ready(self) -> None:
-        fields = (self.page_heading, self.products_title, self.shopping_cart_button, self.inventory_container)
-
-        for field in fields:
-            expect(field).to_be_visible()
+        self.wait_until_ready()
 
     def assert_number_of_products(self) -> None :
         count = self.get_inventory_items_count()
@@ -198,6 +239,9 @@ class DashboardPage :
         assert self.get_add_to_cart_button(index).is_visible(), f"Add to cart button for product at index {index} is not visible"
 
     def assert_shopping_badge_value(self, expected_value: int) -> None:
+        if self.wait_for_badge(expected_value) is not None:
+            return
+
         badge = self.shopping_cart_badge
         if expected_value == 0:
             expect(badge).to_have_count(0)
@@ -210,7 +254,7 @@ class DashboardPage :
         expect(self.page).to_have_url(self.CART_URL)
 
     def assert_filter_applied(self, expected_filter: str) -> None:
-        selected_option = self.active_filter.inner_text()
+        selected_option = self.app_state.sort
 
         try :
             assert selected_option == expected_filter, f"Expected filter option '{expected_filter}' to be applied, but found '{selected_option}'"
@@ -226,7 +270,9 @@ class DashboardPage :
             raise IndexError(f"Index {index} is out of bounds for inventory items count {self.get_inventory_items_count()}")
         
         self.assert_add_to_cart_visible(index)
-        self.get_add_to_cart_button(index).click()
+        state = self.click_and_observe(self.get_add_to_cart_button(index))
+        if state is not None and not state.changed:
+            raise AssertionError(f"Add to cart did not change the cart, {state.describe()}")
         self.assert_remove_button_visible()
 
     def click_remove_button(self, index: int = 0) -> None:
@@ -234,27 +280,27 @@ class DashboardPage :
             raise IndexError(f"Index {index} is out of bounds for inventory items count {self.get_inventory_items_count()}")
         
         self.assert_remove_button_visible()
-        self.get_remove_button(index).click()   
+        state = self.click_and_observe(self.get_remove_button(index))
+        if state is not None and not state.changed:
+            raise AssertionError(f"Remove did not change the cart, {state.describe()}")
         self.assert_add_to_cart_visible(index)
     
-    def get_filter(self, option: str) -> Locator:
-        return self.page.locator(self.FILTER_BUTTON).select_option(label=option)
+    def get_filter(self, option: str) -> List[str]:
+        return self.filter_button.select_option(label=option)
 
     def apply_filter(self, filter_option: Filter) -> None:
         self.filter_button.click()
         filter_option_locator = self.get_filter(filter_option.value)
 
-    def add_to_cart_by_product_name(self, product_name: str) -> None:
-        product_card = self.inventory_items.filter(has_text=product_name)
-        add_button = product_card.locator(self.ADD_TO_CART_BUTTON_FIELD)
+    def add_to_cart_by_product_name(self, product_name: str) -> Optional[CartState]:
+        add_button = self.get_add_to_cart_button_by_name(product_name)
         expect(add_button).to_be_visible()
-        add_button.click()
+        return self.click_and_observe(add_button)
 
-    def remove_by_product_name(self, product_name: str) -> None:
-        product_card = self.inventory_items.filter(has_text=product_name)
-        remove_button = product_card.locator(self.REMOVE_BUTTON_FIELD)
+    def remove_by_product_name(self, product_name: str) -> Optional[CartState]:
+        remove_button = self.get_remove_button_by_name(product_name)
         expect(remove_button).to_be_visible()
-        remove_button.click()
+        return self.click_and_observe(remove_button)
 
 
     def logout(self) -> None:
@@ -285,7 +331,7 @@ class DashboardPage :
         # Verify product details page
         expect(self.item_name).to_have_text(product.name)
         expect(self.item_desc).to_contain_text(product.description)
-        expect(self.item_price).to_have_text(f"${product.price:.2f}")
+        expect(self.item_price).to_have_text(product.price_text)
         expect(self.details_item_img).to_have_attribute("src", product.image_path)
 
         # Navigate back to dashboard page
@@ -369,15 +415,12 @@ class DashboardPage :
         2. Assert Filter sorting didn't worked for problem_user
         3. Check The product details
         """
-        expected_count = len(products)
-        
-        for i in range(expected_count):
-            product_card = self.inventory_items.nth(i)
-            product = products[i]
-
-            expect(product_card.locator(self.ITEM_NAME)).to_have_text(product.name)
+        cards = self.wait_for_inventory_snapshot(len(products))
+        assert len(cards) >= len(products), f"Expected {len(products)} products, but found {len(cards)}"
 
-            expect(product_card.locator(self.ITEM_IMG)).to_have_attribute("src", re.compile(r"sl-404", re.I))
+        for card, product in zip(cards, products):
+            assert card.name == product.name, f"Expected '{product.name}' but found '{card.name}'"
+            assert re.search(r"sl-404", card.image_src, re.I), f"Expected a broken image for {product.name}, but found '{card.image_src}'"
 
 
 
@@ -388,19 +431,20 @@ class DashboardPage :
         3. If product is added to cart, assert remove button is visible
         """
 
-        expected_count = len(products)
+        added_names = {getattr(product, "name", product) for product in added_products}
 
-        for i in range(expected_count):
-            product_card = self.inventory_items.nth(i)
-            product = products[i]
+        with SoftAssertions(self.snapshot_inventory, self.page, self.SNAPSHOT_RENDER_TIMEOUT, self.SNAPSHOT_RENDER_INTERVAL) as soft:
+            soft.check(f"Expected {len(products)} products", lambda cards: len(cards) >= len(products), found=len)
 
-            product_name = product_card.locator(self.ITEM_NAME).inner_text()
+            for index, product in enumerate(products):
+                card = lambda cards, index=index: cards[index]
 
-            if product_name in added_products:
-                expect(product_card.locator(self.REMOVE_BUTTON_FIELD)).to_be_visible()
+                soft.check(f"Expected a remove button for product {index}",
+                           lambda cards, card=card: card(cards).name not in added_names or card(cards).button == "remove",
+                           found=lambda cards, card=card: card(cards).button)
 
-            # assert product details
-            expect(product_card.locator(self.ITEM_IMG)).to_have_attribute("src", product.image_path)
-            expect(product_card.locator(self.ITEM_NAME)).to_have_text(product.name)
-            expect(product_card.locator(self.ITEM_DESC)).to_contain_text(product.description)
-            expect(product_card.locator(self.ITEM_PRICE)).to_have_text(f"${product.price:.2f}")
+                # assert product details
+                soft.equal(f"Image mismatch for {product.name}", lambda cards, card=card: card(cards).image_src, product.image_path)
+                soft.equal(f"Name mismatch at index {index}", lambda cards, card=card: card(cards).name, product.name)
+                soft.contains(f"Description mismatch for {product.name}", lambda cards, card=card: card(cards).description, product.description)
+                soft.equal(f"Price mismatch for {product.name}", lambda cards, card=card: card(cards).price, product.price_text)
@@ -0,0 +1,144 @@
+import functools
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from playwright.sync_api import Page, Response
+from pages.soft_assertions import SoftAssertions
+from test_data.catalog import Product, image_file_name
+
+REFERENCE_DIR = Path(__file__).parent.parent / "assets" / "product_images"
+
+
+@functools.lru_cache(maxsize=4)
+def reference_hashes(image_dir: Path = REFERENCE_DIR) -> Dict[str, str]:
+    """
+    sha256 of every reference image, by file name ("sauce_labs_backpack.jpg")
+    """
+    return {path.name: hashlib.sha256(path.read_bytes()).hexdigest() for path in Path(image_dir).glob("*.jpg")}
+
+
+@dataclass(frozen=True)
+class ImageState:
+    path: str           # url path of the image the element shows
+    complete: bool
+    natural_width: int
+    natural_height: int
+
+    @property
+    def loaded(self) -> bool:
+        return self.complete and self.natural_width > 0
+
+
+@dataclass(frozen=True)
+class ImageReport:
+    images: Tuple[ImageState, ...]
+    bodies: Dict[str, str]      # url path -> sha256 of the response body
+    sizes: Dict[str, int]       # url path -> bytes in the response body
+
+    def by_path(self, path: str) -> List[ImageState]:
+        return [image for image in self.images if image.path == path]
+
+
+class ImageIntegrity:
+    """
+    Checks images by what reached the browser instead of by screenshots: one evaluate reads
+    complete / naturalWidth of every <img>, and every image response is hashed.
+
+    The hashes are compared with the reference files in reference_dir only when it is given. These
+    files are what the local stand-in serves, the real site serves its own (larger) encodings, so
+    against it reference_dir=None keeps the load and non-empty body checks only.
+
+    Responses are only seen once it is listening, so attach it before the page navigates.
+    """
+
+    IMAGES_SCRIPT = """
+    (selector) => Array.from(document.querySelectorAll(selector), (image) => ({
+        path: image.currentSrc || image.src ? new URL(image.currentSrc || image.src).pathname : "",
+        complete: image.complete,
+        natural_width: image.naturalWidth,
+        natural_height: image.naturalHeight,
+    }))
+    """
+
+    def __init__(self, page: Page, reference_dir: Optional[Path] = REFERENCE_DIR) -> None:
+        self.page = page
+        self.reference_dir = reference_dir
+        self._responses: Dict[str, Response] = {}
+        self._bodies: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        page.on("response", self._on_response)
+
+    #-------------Snapshot--------------
+
+    def images(self, selector: str = "img") -> Tuple[ImageState, ...]:
+        return tuple(ImageState(**image) for image in self.page.evaluate(self.IMAGES_SCRIPT, selector))
+
+    def body_hashes(self) -> Dict[str, str]:
+        """
+        sha256 of each image response body by url path, every body is fetched from the browser once
+        """
+        for path, response in list(self._responses.items()):
+            if path not in self._bodies:
+                body = response.body()
+                self._bodies[path] = hashlib.sha256(body).hexdigest()
+                self._sizes[path] = len(body)
+        return dict(self._bodies)
+
+    def report(self, selector: str = "img") -> ImageReport:
+        return ImageReport(self.images(selector), self.body_hashes(), dict(self._sizes))
+
+    #-------------Assertions--------------
+
+    def assert_product_images_intact(self, products: Iterable[Product], selector: str = "img") -> None:
+        """
+        Every product image is shown, decoded and served with a non-empty body, and with a
+        reference_dir byte for byte its reference file
+        """
+        references = reference_hashes(self.reference_dir) if self.reference_dir is not None else None
+        with SoftAssertions(functools.partial(self.report, selector), self.page) as soft:
+            for product in products:
+                self._check_loaded(soft, product)
+                soft.check(f"Image body of {product.name} is not empty", lambda report, path=product.image_path: report.sizes.get(path, 0) > 0,
+                           lambda report, path=product.image_path: report.sizes.get(path))
+                if references is not None:
+                    soft.equal(f"Image bytes of {product.name}", lambda report, path=product.image_path: report.bodies.get(path),
+                               references.get(image_file_name(product.name)))
+
+    def assert_product_images_broken(self, products: Iterable[Product], selector: str = "img") -> None:
+        """
+        No product shows its own image: each image matching selector loads (the placeholder does),
+        but its url is not a product's (and with a reference_dir, neither are its bytes)
+        """
+        products = list(products)
+        product_paths = {product.image_path for product in products}
+
+        def shown(report: ImageReport) -> List[ImageState]:
+            return [image for image in report.images if image.path and image.path not in product_paths]
+
+        with SoftAssertions(functools.partial(self.report, selector), self.page) as soft:
+            soft.check(f"Expected {len(products)} placeholder images", lambda report: len(shown(report)) >= len(products),
+                       lambda report: [image.path for image in report.images])
+            soft.check("Every placeholder image loaded", lambda report: all(image.loaded for image in shown(report)),
+                       lambda report: [image.path for image in shown(report) if not image.loaded])
+            if self.reference_dir is not None:
+                reference_bodies = set(reference_hashes(self.reference_dir).values())
+                soft.check("No placeholder is a product image", lambda report: all(
+                    report.bodies.get(image.path) not in reference_bodies | {None} for image in shown(report)),
+                    lambda report: {image.path: report.bodies.get(image.path) for image in shown(report)})
+
+    #-------------Private--------------
+
+    def _check_loaded(self, soft: SoftAssertions, product: Product) -> None:
+        def states(report: ImageReport) -> List[Tuple[bool, int]]:
+            return [(image.complete, image.natural_width) for image in report.by_path(product.image_path)]
+
+        soft.check(f"Image of {product.name} loaded",
+                   lambda report: bool(report.by_path(product.image_path)) and all(image.loaded for image in report.by_path(product.image_path)),
+                   states)
+
+    def _on_response(self, response: Response) -> None:
+        # a 304 still has the cached body
+        if response.request.resource_type == "image" and response.status < 400:
+            self._responses[urlsplit(response.url).path] = response
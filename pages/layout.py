@@ -0,0 +1,162 @@
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+# every declared element of a page: boxes, colours and text, one entry per match
+LAYOUT_SCRIPT = """
+(checks) => {
+    const round = (value) => Math.round(value * 10) / 10;
+    const byText = (source, flags) => {
+        const pattern = new RegExp(source, flags);
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            if (pattern.test(node.textContent)) return [node.parentElement];
+        }
+        return [];
+    };
+    const describe = (element) => {
+        const box = element.getBoundingClientRect();
+        const style = getComputedStyle(element);
+        return {
+            x: round(box.left + window.scrollX),
+            y: round(box.top + window.scrollY),
+            width: round(box.width),
+            height: round(box.height),
+            visible: box.width > 0 && box.height > 0 && style.visibility !== "hidden",
+            color: style.color,
+            background: style.backgroundColor,
+            text: (element.innerText || element.value || "").replace(/\\s+/g, " ").trim().slice(0, 120),
+        };
+    };
+    return Object.fromEntries(checks.map((check) => [
+        check.label,
+        (check.by === "text" ? byText(check.source, check.flags) : [...document.querySelectorAll(check.selector)]).map(describe),
+    ]));
+}
+"""
+
+RGB = re.compile(r"rgba?\(([^)]*)\)")
+
+
+@dataclass(frozen=True)
+class ElementBox:
+    x: float
+    y: float
+    width: float
+    height: float
+    visible: bool
+    color: str
+    background: str
+    text: str
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    position: float = 2.0       # px the top left corner may move
+    size: float = 2.0           # px the width / height may change
+    color: int = 8              # per channel, 0..255
+    text: bool = True           # compare the text at all
+
+
+@dataclass(frozen=True)
+class LayoutChange:
+    label: str
+    index: int
+    field: str
+    expected: object
+    actual: object
+
+    def __str__(self) -> str:
+        return f"{self.label}[{self.index}].{self.field}: expected {self.expected!r}, found {self.actual!r}"
+
+
+class LayoutSnapshot:
+    """
+    Where every element of a page sits and how it looks, diffed numerically:
+
+        baseline = dashboard_page.snapshot_layout()
+        ...
+        changes = dashboard_page.snapshot_layout().diff(baseline)
+
+    A few hundred numbers per page instead of a screenshot, so it is cheap to take, store and compare.
+    """
+
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: Dict[str, Iterable[Union[ElementBox, dict]]]) -> None:
+        self.elements: Dict[str, Tuple[ElementBox, ...]] = {
+            label: tuple(box if isinstance(box, ElementBox) else ElementBox(**box) for box in boxes)
+            for label, boxes in elements.items()
+        }
+
+    def diff(self, expected: "LayoutSnapshot", tolerance: Tolerance = Tolerance(), ignore_text: Iterable[str] = (),
+             ignore: Iterable[str] = ()) -> List[LayoutChange]:
+        """
+        Every difference from expected beyond tolerance, labels in ignore_text only compare geometry and colour,
+        labels in ignore are not compared at all
+        """
+        ignore_text = set(ignore_text)
+        changes = []
+
+        for label in sorted((expected.elements.keys() | self.elements.keys()) - set(ignore)):
+            wanted, found = expected.elements.get(label, ()), self.elements.get(label, ())
+            if len(wanted) != len(found):
+                changes.append(LayoutChange(label, 0, "count", len(wanted), len(found)))
+
+            for index, (before, after) in enumerate(zip(wanted, found)):
+                changes.extend(LayoutChange(label, index, field, old, new)
+                               for field, old, new in _compare(before, after, tolerance, tolerance.text and label not in ignore_text))
+
+        return changes
+
+    def assert_matches(self, expected: "LayoutSnapshot", tolerance: Tolerance = Tolerance(), ignore_text: Iterable[str] = (),
+                       ignore: Iterable[str] = ()) -> None:
+        changes = self.diff(expected, tolerance, ignore_text, ignore)
+        assert not changes, f"{len(changes)} layout change(s):\n" + "\n".join(f"  - {change}" for change in changes)
+
+    #-------------Storage--------------
+
+    def to_records(self) -> Dict[str, List[dict]]:
+        return {label: [asdict(box) for box in boxes] for label, boxes in self.elements.items()}
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.to_records(), indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LayoutSnapshot":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+#-------------Helper----------------
+
+def _channels(color: str) -> Optional[Tuple[float, ...]]:
+    match = RGB.match(color)
+    if match is None:
+        return None
+    values = [float(value) for value in match.group(1).replace("/", ",").replace(" ", ",").split(",") if value]
+    return tuple(values[:3]) + (values[3] * 255 if len(values) > 3 else 255.0,)
+
+
+def _colors_differ(before: str, after: str, tolerance: int) -> bool:
+    old, new = _channels(before), _channels(after)
+    if old is None or new is None:
+        return before != after
+    return any(abs(a - b) > tolerance for a, b in zip(old, new))
+
+
+def _compare(before: ElementBox, after: ElementBox, tolerance: Tolerance, with_text: bool) -> Iterable[Tuple[str, object, object]]:
+    if before.visible != after.visible:
+        yield "visible", before.visible, after.visible
+    if abs(before.x - after.x) > tolerance.position or abs(before.y - after.y) > tolerance.position:
+        yield "position", (before.x, before.y), (after.x, after.y)
+    if abs(before.width - after.width) > tolerance.size or abs(before.height - after.height) > tolerance.size:
+        yield "size", (before.width, before.height), (after.width, after.height)
+    if _colors_differ(before.color, after.color, tolerance.color):
+        yield "color", before.color, after.color
+    if _colors_differ(before.background, after.background, tolerance.color):
+        yield "background", before.background, after.background
+    if with_text and before.text != after.text:
+        yield "text", before.text, after.text
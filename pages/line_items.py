@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from playwright.sync_api import Locator
+from test_data.product_data import INVENTORY_IDS
+
+
+# every cart / overview row links to its product by inventory id
+ROW_BY_INVENTORY_ID = '{rows}:has([data-test="item-{inventory_id}-title-link"])'
+
+
+def row_selector(rows_selector: str, item_name: str) -> Optional[str]:
+    """
+    Selector of the row holding item_name, None for products outside the catalog
+    """
+    inventory_id = INVENTORY_IDS.get(item_name)
+    return None if inventory_id is None else ROW_BY_INVENTORY_ID.format(rows=rows_selector, inventory_id=inventory_id)
+
+
+@dataclass(frozen=True)
+class LineItem:
+    name: str
+    description: str
+    price: str          # as displayed, e.g. "$29.99"
+    quantity: int
+
+    @property
+    def price_value(self) -> float:
+        return float(self.price.replace("$", ""))
+
+    def as_details(self) -> dict:
+        return {"name": self.name, "description": self.description, "price": self.price}
+
+
+class LineItemReader:
+    """
+    Reads every row of a cart list (cart page, checkout overview) in one evaluate call,
+    indexed by product name in display order.
+    """
+
+    ROWS_SCRIPT = """
+    (rows, [name, desc, price, quantity, labels]) => {
+        const text = (root, selector) => {
+            const element = root.querySelector(selector);
+            return element ? element.textContent.replace(/\\s+/g, " ").trim() : "";
+        };
+        return {
+            rows: rows.map((row) => ({
+                name: text(row, name),
+                description: text(row, desc),
+                price: text(row, price),
+                quantity: parseInt(text(row, quantity) || "1", 10),
+            })),
+            labels: Object.fromEntries(Object.entries(labels).map(([key, selector]) => [key, text(document, selector)])),
+        };
+    }
+    """
+
+    def __init__(self, rows: Locator, name_selector: str, desc_selector: str, price_selector: str, quantity_selector: str) -> None:
+        self.rows = rows
+        self.selectors = [name_selector, desc_selector, price_selector, quantity_selector]
+
+    def snapshot(self) -> Dict[str, LineItem]:
+        return self.snapshot_with_labels({})[0]
+
+    def snapshot_with_labels(self, labels: Dict[str, str]) -> Tuple[Dict[str, LineItem], Dict[str, str]]:
+        """
+        Same as snapshot, and reads the text of page-level labels ({key: selector}) in the same round trip
+        """
+        return self.parse(self.rows.evaluate_all(self.ROWS_SCRIPT, [*self.selectors, labels]))
+
+    async def snapshot_async(self) -> Dict[str, LineItem]:
+        """
+        snapshot for a reader built on an async Locator
+        """
+        return self.parse(await self.rows.evaluate_all(self.ROWS_SCRIPT, [*self.selectors, {}]))[0]
+
+    @staticmethod
+    def parse(result: dict) -> Tuple[Dict[str, LineItem], Dict[str, str]]:
+        return {row["name"]: LineItem(**row) for row in result["rows"]}, result["labels"]
+
+    @staticmethod
+    def pick(items: Dict[str, LineItem], item_name: Optional[str] = None, index: Optional[int] = None) -> LineItem:
+        """
+        Same lookup rules the page objects' get_inventory_item used to apply, on a snapshot
+        """
+        if not items:
+            raise AssertionError("Cart is empty, No Inventory items found")
+
+        if item_name:
+            if item_name not in items:
+                raise ValueError(f"Item with name '{item_name}' not found in the cart")
+            return items[item_name]
+
+        if index is not None:
+            if index >= len(items):
+                raise ValueError("Item index out of range")
+            return list(items.values())[index]
+
+        raise ValueError("Either item_name or index must be provided")
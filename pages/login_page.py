@@ -1,8 +1,11 @@
 from playwright.sync_api import Locator, Page, expect
 import re
 import pytest
+from pages.base_page import BasePage, Element
 
-class LoginPage :
+class LoginPage(BasePage) :
+
+    __slots__ = ()
 
     #-----------selectors----------------
     USERNAME_FIELD = 'input[name="user-name"]'
@@ -17,30 +20,16 @@ class LoginPage :
     #---------------Validations-----------
     INVENTORY_URL = re.compile(r"inventory.html", re.I)
 
-    def __init__(self, page: Page) -> None:
-        self.page = page
-
 
     #--------------locators---------------
-    @property
-    def username(self) -> Locator:
-        return self.page.locator(self.USERNAME_FIELD)
-    
-    @property
-    def password(self) -> Locator:
-        return self.page.locator(self.PASSWORD_FIELD)
-    
-    @property
-    def submit(self) -> Locator:
-        return self.page.locator(self.SUBMIT_BUTTON)
-    
-    @property
-    def login_heading(self) -> Locator:
-        return self.page.get_by_text(self.LOGIN_HEADING)
-    
-    @property
-    def error_message(self) -> Locator:
-        return self.page.locator(self.ERROR_MESSAGE_FIELD)
+    username = Element(USERNAME_FIELD)
+    password = Element(PASSWORD_FIELD)
+    submit = Element(SUBMIT_BUTTON)
+    login_heading = Element(LOGIN_HEADING, by="text")
+    error_message = Element(ERROR_MESSAGE_FIELD)
+
+    #--------------readiness---------------
+    READY_ELEMENTS = (username, password, login_heading)
 
     #-------------navigations--------------
     def open_page(self, url) -> None:
@@ -52,10 +41,7 @@ class LoginPage :
 
     #-------------assertions--------------
     def wait_until_page_fields_are_ready(self) -> None:
-        fields = (self.username, self.password, self.login_heading)
-
-        for field in fields:
-            expect(field).to_be_visible()
+        self.wait_until_ready()
     
     def wait_for_login_error(self) -> None:
         expect(self.error_message).to_have_text(self.LOGIN_ERROR_MESSAGE)
@@ -1,17 +1,28 @@
 import re
 import pytest
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from playwright.sync_api import Locator, Page, expect
 from test_data.product_data import PRODUCTS, Product
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
+from pages.line_items import LineItem, LineItemReader, row_selector
+from pages.base_page import AppPage, Element, locator_builder
+from pages.soft_assertions import SoftAssertions
 
 
-class OrderPage :
+@dataclass(frozen=True)
+class OrderSnapshot:
+    items: Dict[str, LineItem]
+    labels: Dict[str, str]      # summary labels as displayed, e.g. {"tax": "Tax: $2.40"}
 
-    BURGER_MENU_FIELD = '.bm-burger-button > button'
-    SHOPPING_CART_LINK = '[data-test="shopping-cart-link"]'
-    SHOPPING_CART_BADGE = '[data-test="shopping-cart-badge"]'
+    def amount(self, label: str) -> float:
+        return float(self.labels[label].split("$")[1])
+
+
+class OrderPage(AppPage) :
+
+    __slots__ = ()
 
     OVERVIEW_FIELD = '[data-test="title"]'
     CART_LIST_FIELD = '[data-test="cart-list"]'
@@ -19,6 +30,7 @@ class OrderPage :
     ITEM_NAME_FIELD = '[data-test="inventory-item-name"]'
     ITEM_DESC_FIELD = '[data-test="inventory-item-desc"]'
     ITEM_PRICE_FIELD = '[data-test="inventory-item-price"]'
+    ITEM_QUANTITY_FIELD = '[data-test="item-quantity"]'
 
     PAYMENT_INFO = '[data-test="payment-info-label"]'
     SHIPPING_INFO = '[data-test="shipping-info-label"]'
@@ -27,90 +39,46 @@ class OrderPage :
     ITEM_TOTAL = '[data-test="subtotal-label"]'
     TAX_FIELD = '[data-test="tax-label"]'
     GRAND_TOTAL = '[data-test="total-label"]'
+    SUMMARY_LABELS = {"subtotal": ITEM_TOTAL, "tax": TAX_FIELD, "total": GRAND_TOTAL}
 
     FINISH_BUTTON_FIELD = '[data-test="finish"]'
     CANCEL_BUTTON_FIELD = '[data-test="cancel"]'
 
     URL = re.compile(r"two.html",re.I)
 
-    def __init__(self, page : Page):
-        self.page = page
-
 
     #------------Locators---------------
+    shopping_cart_link = Element(AppPage.SHOPPING_CART_LINK)
+    shopping_badge = Element(AppPage.SHOPPING_CART_BADGE)
+    checkout_overview = Element(OVERVIEW_FIELD)
+    cart_list = Element(CART_LIST_FIELD)
+    inventory_items = Element(INVENTORY_ITEMS)
+    payment_info = Element(PAYMENT_INFO)
+    ship_info = Element(SHIPPING_INFO)
+    item_total = Element(ITEM_TOTAL)
+    grand_total = Element(GRAND_TOTAL)
+    tax = Element(TAX_FIELD)
+    finish_button = Element(FINISH_BUTTON_FIELD)
+    cancel_button = Element(CANCEL_BUTTON_FIELD)
+
+    #------------Readiness---------------
+    READY_URL = URL
+    READY_ELEMENTS = (AppPage.burger_navigate_button, shopping_cart_link, checkout_overview, cart_list, payment_info, ship_info, item_total, tax, grand_total)
 
-    @property
-    def burger_navigate_button(self) -> Locator:
-        return self.page.locator(self.BURGER_MENU_FIELD)
-    
-    @property
-    def shopping_cart_link(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_LINK)
-    
-    @property
-    def shopping_badge(self) -> Locator:
-        return self.page.locator(self.SHOPPING_CART_BADGE)
-    
-    @property
-    def checkout_overview(self) -> Locator:
-        return self.page.locator(self.OVERVIEW_FIELD)
-    
-    @property
-    def cart_list(self) -> Locator:
-        return self.page.locator(self.CART_LIST_FIELD)
-    
-    @property
-    def inventory_items(self) -> Locator:
-        return self.page.locator(self.INVENTORY_ITEMS)
-    
-    @property
-    def payment_info(self) -> Locator:
-        return self.page.locator(self.PAYMENT_INFO)
-    
-    @property
-    def ship_info(self) -> Locator:
-        return self.page.locator(self.SHIPPING_INFO)
-    
-    @property
-    def item_total(self) -> Locator:
-        return self.page.locator(self.ITEM_TOTAL)
-    
-    @property
-    def grand_total(self) -> Locator:
-        return self.page.locator(self.GRAND_TOTAL)
-    
-    @property
-    def tax(self) -> Locator:
-        return self.page.locator(self.TAX_FIELD)
-    
-    @property
-    def finish_button(self) -> Locator:
-        return self.page.locator(self.FINISH_BUTTON_FIELD)
-    
-    @property
-    def cancel_button(self) -> Locator:
-        return self.page.locator(self.CANCEL_BUTTON_FIELD)
-    
-    @property
-    def shopping_cart_badge_value(self) -> int:
-        badge = self.shopping_badge
-        if badge.count() == 0 : return 0
-        return int(self.shopping_badge.inner_text())
-    
     @property
     def get_cart_items_count(self) -> int:
         return self.inventory_items.count()
     
-    #----------------Private--------------
-
-    def _get_price_value(self, locator : Locator) -> float:
-        text = locator.inner_text()
-        price = float(text.split("$")[1])
-        return price
-
-
     #---------------------Getter--------------
     
+    @locator_builder
+    def item_row(self, item_name: str) -> Locator:
+        """
+        The row of item_name, by its inventory id (a text filter for products outside the catalog)
+        """
+        selector = row_selector(self.INVENTORY_ITEMS, item_name)
+        return self.locator(selector) if selector else self.inventory_items.filter(has_text=item_name)
+
     def get_inventory_item(self, item_name = None , index = None) -> Locator:
         """
         Return a locator of inventory Item of the required item
@@ -119,7 +87,7 @@ class OrderPage :
             raise AssertionError("Cart is empty, No Inventory items found")
 
         if item_name:
-            item = self.inventory_items.filter(has_text=item_name)
+            item = self.item_row(item_name)
             if item.count() == 0:
                 raise ValueError(f"Item with name '{item_name}' not found in the cart")
             return item
@@ -132,25 +100,33 @@ class OrderPage :
         else :
             raise ValueError("Either item_name or index must be provided")
 
-    def get_item_details(self, item_name = None, index= None) -> Locator:
+    def get_line_items(self) -> Dict[str, LineItem]:
         """
-        Returns a dict containing the product details
+        Returns every item of the order by product name, read in one round trip
         """
+        reader = LineItemReader(self.inventory_items, self.ITEM_NAME_FIELD, self.ITEM_DESC_FIELD, self.ITEM_PRICE_FIELD, self.ITEM_QUANTITY_FIELD)
+        return reader.snapshot()
 
-        item = self.get_inventory_item(item_name=item_name, index=index)        
-        return {
-            "name" : item.locator(self.ITEM_NAME_FIELD).inner_text(),
-            "description" : item.locator(self.ITEM_DESC_FIELD).inner_text(),
-            "price" : item.locator(self.ITEM_PRICE_FIELD).inner_text()
-        }
+    def snapshot_order(self) -> OrderSnapshot:
+        """
+        Returns the items and the summary labels of the order, read in one round trip
+        """
+        reader = LineItemReader(self.inventory_items, self.ITEM_NAME_FIELD, self.ITEM_DESC_FIELD, self.ITEM_PRICE_FIELD, self.ITEM_QUANTITY_FIELD)
+        return OrderSnapshot(*reader.snapshot_with_labels(self.SUMMARY_LABELS))
+
+    def get_item_details(self, item_name = None, index= None, items: Optional[Dict[str, LineItem]] = None) -> dict:
+        """
+        Returns a dict containing the product details, looked up in items when a snapshot is at hand
+        """
+        items = items if items is not None else self.get_line_items()
+        return LineItemReader.pick(items, item_name=item_name, index=index).as_details()
     
-    def get_item_price(self, item_name = None, index = None) -> float:
+    def get_item_price(self, item_name = None, index = None, items: Optional[Dict[str, LineItem]] = None) -> float:
         """
         Returns the price of any item , by its name or index
         """
-        item = self.get_inventory_item(item_name=item_name, index=index) 
-        price = item.locator(self.ITEM_PRICE_FIELD).inner_text()  
-        return float(price.replace("$", ""))
+        items = items if items is not None else self.get_line_items()
+        return LineItemReader.pick(items, item_name=item_name, index=index).price_value
     #-------------------Asserts-----------------
 
     def is_cart_empty(self) -> bool:
@@ -168,26 +144,26 @@ class OrderPage :
         Make sures page and the locators are fully loaded
         """
 
-        fields = (self.burger_navigate_button, self.shopping_cart_link, self.checkout_overview, self.cart_list, self.payment_info, self.ship_info, self.item_total, self.tax, self.grand_total)
-
-        for field in fields:
-            expect(field).to_be_visible()
+        self.wait_until_ready()
 
     def assert_shopping_badge_value_equal_as_cart_cnt(self) -> None:
         """
         Checks if the Number of items in cart is equal as the shopping cart badge value
         """
         cart_cnt = self.get_cart_items_count
+        if self.wait_for_badge(cart_cnt) is not None:
+            return
+
         shopping_badge_cnt = self.shopping_cart_badge_value
 
         assert cart_cnt == shopping_badge_cnt, f"Expected {cart_cnt} , but found {shopping_badge_cnt}"
 
-    def assert_no_of_items_in_cart(self, expected_cnt : int) -> None:
+    def assert_no_of_items_in_cart(self, expected_cnt : int, items: Optional[Dict[str, LineItem]] = None) -> None:
         """
         Checks if the count of products in cart is equal as expected count
         """
         
-        actual_cnt = self.get_cart_items_count
+        actual_cnt = len(items if items is not None else self.get_line_items())
         assert actual_cnt == expected_cnt, f"Expected {expected_cnt} products, but found {actual_cnt}"
 
     #--------------------Actions------------------
@@ -202,17 +178,13 @@ class OrderPage :
         """
         Asserts the data of product added to the cart is same as the Products list
         """
-        expected_count = len(products_in_cart)
-        self.assert_no_of_items_in_cart(expected_cnt = expected_count)
+        with SoftAssertions(self.get_line_items, self.page) as soft:
+            soft.equal("Number of items in the order", len, len(products_in_cart))
 
-        for product in products_in_cart:
-
-            #find the product in inventory
-            item_details = self.get_item_details(item_name=product.name)
-
-            assert item_details["name"] == product.name, f"Name mismatch for {product.name}"
-            assert item_details["description"] == product.description, f"Description mismatch for {product.name}"
-            assert float(item_details["price"].replace("$", "")) == product.price, f"Price mismatch for {product.name}"
+            for product in products_in_cart:
+                soft.check(f"{product.name} not found in the order", lambda items, name=product.name: name in items, found=list)
+                soft.equal(f"Description mismatch for {product.name}", lambda items, name=product.name: items[name].description, product.description)
+                soft.equal(f"Price mismatch for {product.name}", lambda items, name=product.name: items[name].price_value, product.price)
 
     def check_grand_total(self, products_in_cart : List[Product]) -> None:
         """
@@ -220,24 +192,13 @@ class OrderPage :
         And Asserts if the the grand total summation is correct
         """
 
-        self.assert_no_of_items_in_cart(expected_cnt=len(products_in_cart))
-        
-        expected_total = 0.0
-        actual_total = 0.0
-        for product in products_in_cart:
-            expected_total += product.price
-            item_price = self.get_item_price(item_name=product.name)
-            actual_total += item_price
-
-
-        assert abs(expected_total - actual_total) < 0.01, \
-        f"Expected total {expected_total}, but got {actual_total}"
+        expected_total = sum(product.price for product in products_in_cart)
 
-        tax = self._get_price_value(self.tax)
-        expected_grand_total = expected_total + tax
+        def items_total(order: OrderSnapshot) -> float:
+            return sum(self.get_item_price(item_name=product.name, items=order.items) for product in products_in_cart)
 
-        actual_grand_total = self._get_price_value(self.grand_total)
-    
-        assert abs(expected_grand_total - actual_grand_total) < 0.01, \
-            f"Expected grand total {expected_grand_total}, but got {actual_grand_total}"
+        with SoftAssertions(self.snapshot_order, self.page) as soft:
+            soft.equal("Number of items in the order", lambda order: len(order.items), len(products_in_cart))
+            soft.close_to("Items total", items_total, expected_total)
+            soft.close_to("Grand total", lambda order: order.amount("total"), lambda order: expected_total + order.amount("tax"))
         
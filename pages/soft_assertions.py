@@ -0,0 +1,99 @@
+import time
+from typing import Any, Callable, Generic, List, Optional, TypeVar, Union
+from playwright.sync_api import Page
+
+T = TypeVar("T")
+Value = Union[Any, Callable[[T], Any]]
+
+
+class SoftAssertions(Generic[T]):
+    """
+    Collects checks against one snapshot of the page and reports every failure at once:
+
+        with SoftAssertions(self.snapshot_inventory, self.page) as soft:
+            soft.equal("Product count", len, 6)
+            soft.equal("First product", lambda cards: cards[0].name, "Sauce Labs Backpack")
+
+    On exit the probe is called and every check is evaluated against its result. While any
+    check fails and the timeout lasts, the probe is called again and every check re-evaluated.
+    """
+
+    def __init__(self, probe: Callable[[], T], page: Page, timeout: float = 2.0, interval: float = 50) -> None:
+        self.probe = probe
+        self.page = page
+        self.timeout = timeout
+        self.interval = interval
+        self.snapshot: Optional[T] = None
+        self._checks: List[Callable[[T], Optional[str]]] = []
+
+    #-------------Checks--------------
+
+    def check(self, description: str, passed: Callable[[T], bool], found: Optional[Callable[[T], Any]] = None) -> None:
+        def run(snapshot: T) -> Optional[str]:
+            if passed(snapshot):
+                return None
+            return f"{description}, found {found(snapshot)!r}" if found else description
+        self._add(description, run)
+
+    def equal(self, description: str, actual: Callable[[T], Any], expected: Value) -> None:
+        def run(snapshot: T) -> Optional[str]:
+            value, wanted = actual(snapshot), self._resolve(expected, snapshot)
+            return None if value == wanted else f"{description}: expected {wanted!r}, found {value!r}"
+        self._add(description, run)
+
+    def contains(self, description: str, actual: Callable[[T], Any], member: Value) -> None:
+        def run(snapshot: T) -> Optional[str]:
+            value, wanted = actual(snapshot), self._resolve(member, snapshot)
+            return None if wanted in value else f"{description}: {wanted!r} not in {value!r}"
+        self._add(description, run)
+
+    def close_to(self, description: str, actual: Callable[[T], float], expected: Value, tolerance: float = 0.01) -> None:
+        def run(snapshot: T) -> Optional[str]:
+            value, wanted = actual(snapshot), self._resolve(expected, snapshot)
+            return None if abs(value - wanted) < tolerance else f"{description}: expected {wanted}, found {value}"
+        self._add(description, run)
+
+    #-------------Evaluation--------------
+
+    def verify(self) -> T:
+        """
+        Returns the snapshot every check passed on, or raises one AssertionError listing every failure
+        """
+        deadline = time.monotonic() + self.timeout
+        attempts = 0
+
+        while True:
+            self.snapshot = self.probe()
+            attempts += 1
+            failures = [message for message in (check(self.snapshot) for check in self._checks) if message]
+
+            if not failures:
+                return self.snapshot
+            if time.monotonic() >= deadline:
+                break
+            self.page.wait_for_timeout(self.interval)
+
+        lines = "\n".join(f"  - {failure}" for failure in failures)
+        raise AssertionError(f"{len(failures)} of {len(self._checks)} checks failed ({attempts} snapshots in {self.timeout} s):\n{lines}")
+
+    def __enter__(self) -> "SoftAssertions[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if exc_type is None:
+            self.verify()
+        return False
+
+    #-------------Private--------------
+
+    def _add(self, description: str, run: Callable[[T], Optional[str]]) -> None:
+        def safe(snapshot: T) -> Optional[str]:
+            try:
+                return run(snapshot)
+            except (AssertionError, LookupError, ValueError, TypeError, AttributeError) as error:
+                return f"{description}: could not be read ({type(error).__name__}: {error})"
+        self._checks.append(safe)
+
+    @staticmethod
+    def _resolve(value: Value, snapshot: T) -> Any:
+        return value(snapshot) if callable(value) else value
@@ -0,0 +1,142 @@
+import csv
+import functools
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+from test_data.filter_data import Filter
+
+
+def product_slug(name: str) -> str:
+    """
+    The app's data-test ids use this, "Sauce Labs Backpack" -> "add-to-cart-sauce-labs-backpack"
+    """
+    return name.lower().replace(" ", "-")
+
+
+_IMAGE_NAME_TABLE = str.maketrans({" ": "_", "(": "", ")": "", ".": ""})
+
+
+def image_file_name(name: str) -> str:
+    """
+    Local file name of a product image, "Sauce Labs Bolt T-Shirt" -> "sauce_labs_bolt_t-shirt.jpg"
+    """
+    return name.lower().translate(_IMAGE_NAME_TABLE) + ".jpg"
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    id : int
+    name: str
+    price : float
+    description: str
+    image_path: str
+    inventory_id: int   # id the app uses in its urls and localStorage cart
+
+    # worked out once, as the app displays them
+    price_text: str = field(init=False, repr=False, compare=False)
+    slug: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "price_text", f"${self.price:.2f}")
+        object.__setattr__(self, "slug", product_slug(self.name))
+
+    @classmethod
+    def sort_products(cls, products: Iterable["Product"], filter_option: "Filter") -> List["Product"]:
+        catalog = products if isinstance(products, Catalog) else _catalog_of(tuple(products))
+        return list(catalog.sorted(filter_option))
+
+
+class Catalog:
+    """
+    Products indexed by id, name, slug and inventory id, with the order every Filter
+    shows them in worked out once. Loads from JSON or CSV records.
+    """
+
+    __slots__ = ("products", "by_id", "by_name", "by_slug", "by_inventory_id", "_orders")
+
+    # Filter -> (sort key, reverse)
+    SORT_KEYS = {
+        Filter.NAME_ASC: ("name", False),
+        Filter.NAME_DESC: ("name", True),
+        Filter.PRICE_ASC: ("price", False),
+        Filter.PRICE_DESC: ("price", True),
+    }
+
+    def __init__(self, products: Iterable[Product]) -> None:
+        self.products: Tuple[Product, ...] = tuple(products)
+        self.by_id: Dict[int, Product] = self._index("id")
+        self.by_name: Dict[str, Product] = self._index("name")
+        self.by_slug: Dict[str, Product] = self._index("slug")
+        self.by_inventory_id: Dict[int, Product] = self._index("inventory_id")
+        self._orders: Dict[Filter, Tuple[Product, ...]] = {
+            filter_option: tuple(sorted(self.products, key=lambda product, key=key: getattr(product, key), reverse=reverse))
+            for filter_option, (key, reverse) in self.SORT_KEYS.items()
+        }
+
+    def sorted(self, filter_option: Filter) -> Tuple[Product, ...]:
+        return self._orders.get(filter_option, self.products)  # fallback if unknown filter
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self.products)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.by_name
+
+    #-------------Loaders--------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "Catalog":
+        return cls(
+            Product(
+                id=int(record["id"]),
+                name=record["name"],
+                price=float(record["price"]),
+                description=record["description"],
+                image_path=record["image_path"],
+                inventory_id=int(record["inventory_id"]),
+            )
+            for record in records
+        )
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path]) -> "Catalog":
+        """
+        A list of product records, or {"products": [...]}
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls.from_records(data["products"] if isinstance(data, dict) else data)
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path]) -> "Catalog":
+        """
+        One product per row, with a header row naming the Product fields
+        """
+        with open(path, newline="", encoding="utf-8") as file:
+            return cls.from_records(csv.DictReader(file))
+
+    def to_records(self) -> List[dict]:
+        return [
+            {"id": product.id, "name": product.name, "price": product.price, "description": product.description,
+             "image_path": product.image_path, "inventory_id": product.inventory_id}
+            for product in self.products
+        ]
+
+    #-------------Private--------------
+
+    def _index(self, attribute: str) -> dict:
+        index = {}
+        for product in self.products:
+            key = getattr(product, attribute)
+            if key in index:
+                raise ValueError(f"Duplicate product {attribute} {key!r}")
+            index[key] = product
+        return index
+
+
+@functools.lru_cache(maxsize=16)
+def _catalog_of(products: Tuple[Product, ...]) -> Catalog:
+    return Catalog(products)
@@ -1,14 +1,131 @@
+import os
 import random
 import re
 import pytest
 
-from config import URL
-from playwright.sync_api import sync_playwright
+from pathlib import Path
+from config import URL, VIEWPORT, ISOLATION_LEVELS
+from playwright.sync_api import Error, sync_playwright
+from playwright.async_api import async_playwright
+from pages.aio import AsyncDashboardPage, AsyncLoginPage
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
+from pages.app_state import AppState
+from pages.base_page import AppPage, unused_selectors
+from pages.image_integrity import ImageIntegrity
 from test_data.product_data import PRODUCTS, allowed_cart
+from utils.auth_cache import CACHED_PERSONAS, StorageStateCache
+from utils.cart_seed import seed_cart
+from utils.local_app import LocalSwagLabs
+from utils.resource_policy import ResourceMonitor, policy_for
+from utils.har import HAR_MODES, HarArchive
+from utils.aio_runner import AsyncRunner
+from utils.instrumentation import Instrumentation
+from utils.fixture_timing import FixtureTimer
+from utils.visual import BaselineStore, SnapshotAssertion
+
+AUTH_CACHE_DIR = Path(__file__).parent.parent / ".auth"
+HAR_DIR = Path(__file__).parent / "har"
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+INSTRUMENT_DIR = Path(__file__).parent / "instrumentation"
+SOURCE_DIRS = [Path(__file__).parent.parent / name for name in ("pages", "tests", "utils", "benchmarks")]
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ResourceMonitor(), "resource_monitor")
+    config.pluginmanager.register(HarArchive(config.getoption("har_mode"), config.getoption("har_dir")), "har_archive")
+
+    if config.getoption("instrument"):
+        instrumentation = Instrumentation(config.getoption("instrument_dir"), config.getoption("instrument_top"))
+        instrumentation.install()
+        config.pluginmanager.register(instrumentation, "instrumentation")
+    if config.getoption("fixture_timing"):
+        config.pluginmanager.register(FixtureTimer(), "fixture_timer")
+
+
+def pytest_report_collectionfinish(config, start_path, items):
+    unused = unused_selectors(SOURCE_DIRS)
+    if unused:
+        return [f"{len(unused)} page selector(s) declared but never used: " + ", ".join(unused)]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--app",
+        action="store",
+        default=os.getenv("SWAG_LABS_APP", "remote"),
+        choices=("remote", "local"),
+        help="remote: run against config.URL, local: run against the bundled stand-in server (offline)",
+    )
+    parser.addoption(
+        "--isolation",
+        action="store",
+        default=os.getenv("ISOLATION", "test-context"),
+        choices=ISOLATION_LEVELS,
+        help="test-browser: new browser per test, test-context: shared browser and new context per test, "
+             "module-context: one context shared by every test of a module",
+    )
+    parser.addoption(
+        "--har-mode",
+        action="store",
+        default=os.getenv("HAR_MODE", "off"),
+        choices=HAR_MODES,
+        help="record: save the traffic into one HAR per persona, replay: answer every request from those HARs",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        type=Path,
+        default=HAR_DIR,
+        help="Where the per persona HAR archives live",
+    )
+    parser.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Log every test in through the login form instead of reusing a cached storage_state",
+    )
+    parser.addoption(
+        "--auth-cache-ttl",
+        action="store",
+        type=float,
+        default=540,
+        help="Seconds a cached login stays valid (the app's session cookie lives 10 minutes)",
+    )
+    parser.addoption(
+        "--instrument",
+        action="store_true",
+        default=bool(os.getenv("INSTRUMENT")),
+        help="Time every Playwright round trip per call type and page object method",
+    )
+    parser.addoption(
+        "--instrument-dir",
+        action="store",
+        type=Path,
+        default=INSTRUMENT_DIR,
+        help="Where --instrument writes one JSON report per test",
+    )
+    parser.addoption(
+        "--instrument-top",
+        action="store",
+        type=int,
+        default=10,
+        help="Rows of the --instrument session summary",
+    )
+    parser.addoption(
+        "--fixture-timing",
+        action="store_true",
+        default=bool(os.getenv("FIXTURE_TIMING")),
+        help="Report each fixture's setup and teardown time, and fixture setup versus test body",
+    )
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Rewrite the assert_snapshot baselines under tests/snapshots",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -16,27 +133,105 @@ def playwright():
     with sync_playwright() as p:
         yield p
 
+# base url of the app under test, the local stand-in is started once per worker
+@pytest.fixture(scope="session")
+def app_url(pytestconfig):
+    if pytestconfig.getoption("app") == "remote":
+        yield URL
+        return
+
+    with LocalSwagLabs() as app:
+        yield app.url
+
+@pytest.fixture(scope="session")
+def isolation(pytestconfig) -> str:
+    return pytestconfig.getoption("isolation")
+
+def _launch_browser(playwright):
+    return playwright.chromium.launch(headless=False)
+
+# session scope -> one browser per xdist worker
+@pytest.fixture(scope="session")
+def shared_browser(playwright):
+    browser = _launch_browser(playwright)
+    yield browser
+    browser.close()
+
 @pytest.fixture(scope="function")
-def browser(playwright):
-    browser = playwright.chromium.launch(headless=False)
+def browser(request, playwright, isolation):
+    if isolation != "test-browser":
+        yield request.getfixturevalue("shared_browser")
+        return
+
+    browser = _launch_browser(playwright)
     yield browser
     browser.close()
 
+@pytest.fixture(scope="module")
+def module_context(request):
+    context = request.getfixturevalue("shared_browser").new_context(viewport=VIEWPORT)
+    yield context
+    context.close()
+
 @pytest.fixture(scope="function")
-def context(browser):
-    context = browser.new_context(viewport={"width": 1280, "height": 720})
+def context(request, browser, isolation):
+    if isolation == "module-context":
+        context = request.getfixturevalue("module_context")
+        yield context
+        context.clear_cookies()
+        return
+
+    context = browser.new_context(viewport=VIEWPORT)
     yield context
     context.close()
 
+@pytest.fixture(scope="session")
+def resource_monitor(pytestconfig) -> ResourceMonitor:
+    return pytestconfig.pluginmanager.get_plugin("resource_monitor")
+
+# @pytest.mark.resources("no-images") aborts images, fonts, media and third party requests
 @pytest.fixture(scope="function")
-def page(context):
+def page(request, context, isolation, resource_monitor, app_url):
     page = context.new_page()
+    resources = resource_monitor.watch(page, policy_for(request.node), app_url, request.node)
+    AppPage.observe_cart(page)      # badge waits and add / remove clicks resolve on cart events
+    AppState.install(page)          # app_state reports the alerts the page raised
     yield page
+    resource_monitor.finish(resources)
+
+    # the context outlives the test, so drop the cart / session it would leak into the next one
+    if isolation == "module-context":
+        try:
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        except Error:
+            pass
     page.close()
 
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig) -> HarArchive:
+    return pytestconfig.pluginmanager.get_plugin("har_archive")
+
+# one UI login per persona per worker, every other test starts with its cookies
+@pytest.fixture(scope="session")
+def auth_cache(pytestconfig, har_archive):
+    if pytestconfig.getoption("no_auth_cache"):
+        return None
+    return StorageStateCache(AUTH_CACHE_DIR, ttl=pytestconfig.getoption("auth_cache_ttl"), prepare_context=har_archive.attach)
+
 @pytest.fixture(scope="function")
-def login(page):
-    def login_user(username: str, password: str = "secret_sauce", url = URL) :
+def login(request, browser, context, page, auth_cache, app_url, har_archive):
+    use_cache = auth_cache is not None and request.node.get_closest_marker("ui_login") is None
+
+    def login_user(username: str, password: str = "secret_sauce", url = None) :
+        url = url or app_url
+        har_archive.attach(context, username, request.node)
+
+        if use_cache and username in CACHED_PERSONAS and password == "secret_sauce":
+            state = auth_cache.get(browser, username, url, password)
+            context.add_cookies(state["cookies"])
+            DashboardPage(page).open_inventory_page(url)
+            return page
+
         login_page = LoginPage(page)
         login_page.open_and_login(url, username, password)
         return page
@@ -72,15 +267,16 @@ def add_no_products(user):
 
 
 
+# the add_* fixtures write the cart straight into localStorage, tests that exercise
+# "Add to cart" itself still go through DashboardPage
 @pytest.fixture(scope="function")
 def add_all_products(user):
     page = user
+    seed_cart(page, PRODUCTS)
+
     dashboard_page = DashboardPage(page)
     dashboard_page.is_inventory_page()
     dashboard_page.wait_until_page_fields_are_ready()
-    
-    for product in PRODUCTS:
-        dashboard_page.add_to_cart_by_product_name(product.name)
 
     return page, PRODUCTS
 
@@ -88,14 +284,12 @@ def add_all_products(user):
 @pytest.fixture(scope="function")
 def add_some_products(user):
     page = user
+    random_products = random.sample(PRODUCTS, 3)  # Select 3 random products    
+    seed_cart(page, random_products)
+
     dashboard_page = DashboardPage(page)
     dashboard_page.is_inventory_page()
     dashboard_page.wait_until_page_fields_are_ready()
-    
-    random_products = random.sample(PRODUCTS, 3)  # Select 3 random products    
-
-    for product in random_products:
-        dashboard_page.add_to_cart_by_product_name(product.name)
 
     return page, random_products
 
@@ -103,13 +297,11 @@ def add_some_products(user):
 @pytest.fixture
 def add_allowed_items(user):
     page = user
+    seed_cart(page, [product for product in PRODUCTS if allowed_cart[product.name]])
+
     dashboard_page = DashboardPage(page)
     dashboard_page.wait_until_page_fields_are_ready()
 
-    for product, isAllowed in allowed_cart.items():
-        if isAllowed:
-            dashboard_page.add_to_cart_by_product_name(product_name=product)
-
     return page
 
 # cart_state fixture resolves the cart content
@@ -156,6 +348,26 @@ def checkout_page_navigate(cart_page_navigate):
     return page
 
 
+# one manifest read per worker, baselines are shared by content hash
+@pytest.fixture(scope="session")
+def snapshot_store() -> BaselineStore:
+    return BaselineStore(SNAPSHOT_DIR)
+
+# assert_snapshot(screenshot_bytes, name="product_1_image.png") against the "<module>/<test>/<name>" baseline
+@pytest.fixture(scope="function")
+def assert_snapshot(pytestconfig, request, snapshot_store):
+    return SnapshotAssertion(request.node, snapshot_store, pytestconfig.getoption("update_snapshots"))
+
+
+# listens for image responses, so request it before the login fixture that navigates
+# byte for byte only on --app=local, the real site does not serve the files in assets/product_images
+@pytest.fixture(scope="function")
+def image_integrity(page, pytestconfig) -> ImageIntegrity:
+    if pytestconfig.getoption("app") == "local":
+        return ImageIntegrity(page)
+    return ImageIntegrity(page, reference_dir=None)
+
+
 @pytest.fixture(autouse=True)
 def show_browser(browser_name):
     print(f"\n=== Running on {browser_name.upper()} ===")
@@ -173,5 +385,39 @@ def order_page_navigate(cart_page_with_products):
     return page, added_products
 
 
+#-----------------Async-----------------
+# async page objects run on their own loop thread, tests drive them with aio.run / aio.run_all
+@pytest.fixture(scope="session")
+def aio():
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+@pytest.fixture(scope="session")
+def async_browser(aio):
+    playwright = aio.run(async_playwright().start())
+    browser = aio.run(playwright.chromium.launch(headless=False))
+    yield browser
+    aio.run(browser.close())
+    aio.run(playwright.stop())
+
+@pytest.fixture
+def async_login(aio, async_browser, app_url):
+    """
+    await async_login("problem_user") -> an async Page logged in on its own context
+    """
+    contexts = []
+
+    async def login_user(username: str, password: str = "secret_sauce"):
+        context = await async_browser.new_context(viewport=VIEWPORT)
+        contexts.append(context)
+        page = await context.new_page()
+        await AsyncDashboardPage.observe_cart(page)
+        await AppState.install(page)
+        await AsyncLoginPage(page).open_and_login(app_url, username, password)
+        return page
 
+    yield login_user
 
+    for context in contexts:
+        aio.run(context.close())
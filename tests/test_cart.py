@@ -6,7 +6,7 @@ from pages.cart_page import CartPage
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 
-pytestmark = pytest.mark.cart
+pytestmark = [pytest.mark.cart, pytest.mark.resources("no-images")]
 
 @pytest.mark.parametrize("user", ["login_as_standard_user"], indirect=True)
 @pytest.mark.smoke
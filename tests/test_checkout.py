@@ -8,7 +8,7 @@ from pages.checkout_page import CheckoutPage
 from test_data.product_data import  Product, PRODUCTS
 from test_data.filter_data import Filter
 
-pytestmark = pytest.mark.checkout
+pytestmark = [pytest.mark.checkout, pytest.mark.resources("no-images")]
 
 #---------remove param , -> Login as st user----------
 @pytest.mark.parametrize(
@@ -8,7 +8,7 @@ from test_data.product_data import  Product, PRODUCTS
 from test_data.filter_data import Filter
 
 #-----------------Parametrize over cart_state and filter_option --> Indirect param -----------------
-pytestmark = pytest.mark.filters
+pytestmark = [pytest.mark.filters, pytest.mark.resources("no-images")]
 
 
 
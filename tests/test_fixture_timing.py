@@ -0,0 +1,64 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+CONFTEST = """
+from utils.fixture_timing import FixtureTimer
+
+def pytest_configure(config):
+    config.pluginmanager.register(FixtureTimer(), "fixture_timer")
+"""
+
+TESTS = """
+import time
+import pytest
+
+@pytest.fixture
+def inner():
+    time.sleep(0.3)
+    return "inner"
+
+@pytest.fixture
+def outer(request):
+    value = request.getfixturevalue("inner")
+    time.sleep(0.2)
+    return value
+
+def test_nested(outer):
+    time.sleep(0.1)
+"""
+
+
+def _run_with_timer(directory: Path) -> str:
+    (directory / "conftest.py").write_text(CONFTEST)
+    (directory / "test_nested.py").write_text(TESTS)
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "--rootdir", str(directory), str(directory)],
+        # only the timer is needed, installed plugins (pytest-playwright-visual, ...) stay out of the run
+        cwd=directory, capture_output=True, text=True, env={"PYTHONPATH": str(ROOT), "PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1"},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+@pytest.mark.unit
+def test_fixture_timing_counts_nested_fixtures_once(tmp_path):
+    """
+    outer pulls inner through getfixturevalue: each reports only its own setup time,
+    and the phases of the summary add up to the wall time
+    """
+    output = _run_with_timer(tmp_path)
+
+    shares = {label: float(share) for label, share in re.findall(r"^  (fixture setup|test body|fixture teardown|hooks and other)\s+[-\d.]+ s\s+(-?[\d.]+)%", output, re.M)}
+    assert len(shares) == 4, output
+    assert all(0 <= share <= 100 for share in shares.values()), output
+    assert sum(shares.values()) == pytest.approx(100, abs=0.5), output
+
+    own = {name: float(seconds) for name, seconds in re.findall(r"^(inner|outer)\s+function\s+1\s+([\d.]+)", output, re.M)}
+    assert own["inner"] == pytest.approx(0.3, abs=0.1), output
+    assert own["outer"] == pytest.approx(0.2, abs=0.1), output
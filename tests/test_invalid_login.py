@@ -3,6 +3,7 @@ import pytest
 from playwright.sync_api import Locator, expect
 from pages.login_page import LoginPage
 
+@pytest.mark.ui_login
 @pytest.mark.negative
 def test_login_not_work(login_as_locked_out_user):
     page = login_as_locked_out_user
@@ -9,7 +9,7 @@ from pages.order_page import OrderPage
 from test_data.product_data import  Product, PRODUCTS
 from test_data.filter_data import Filter
 
-pytestmark = pytest.mark.order
+pytestmark = [pytest.mark.order, pytest.mark.resources("no-images")]
 
 @pytest.mark.smoke
 def test_order_page_visibility(user, order_page_navigate):
@@ -40,13 +40,14 @@ def test_order_page_product_details(order_page_navigate):
     page, products_in_cart = order_page_navigate
     order_page = OrderPage(page)
 
-    order_page.assert_no_of_items_in_cart(expected_cnt= len(products_in_cart))
+    items = order_page.get_line_items()
+    order_page.assert_no_of_items_in_cart(expected_cnt= len(products_in_cart), items=items)
     order_page.assert_shopping_badge_value_equal_as_cart_cnt()
 
     for product in products_in_cart:
 
         #find the product in inventory
-        item_details = order_page.get_item_details(item_name=product.name)
+        item_details = order_page.get_item_details(item_name=product.name, items=items)
         
         assert item_details["name"] == product.name, f"Name mismatch for {product.name}"
         
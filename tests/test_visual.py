@@ -0,0 +1,88 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from utils.visual import BaselineStore, compare_images, crop_tiles, decode, enclosing_box, tile_layout
+
+WHITE, BLACK = 255, 0
+
+
+def _page(width: int = 64, height: int = 48) -> np.ndarray:
+    """
+    A white page with a black block and a few one pixel lines, hard edges like text and borders
+    """
+    image = np.full((height, width, 3), WHITE, dtype=np.uint8)
+    image[10:30, 12:40] = BLACK
+    image[36, 4:60] = BLACK
+    image[4:44, 50] = BLACK
+    return image
+
+
+@pytest.mark.unit
+def test_identical_images_match():
+    assert compare_images(_page(), _page()).matches
+
+
+@pytest.mark.unit
+def test_shifted_image_fails():
+    expected = _page()
+    actual = np.full_like(expected, WHITE)
+    actual[:, 1:] = expected[:, :-1]
+
+    diff = compare_images(actual, expected)
+
+    assert not diff.matches, diff.describe()
+    assert diff.mismatched > diff.antialiased
+
+
+@pytest.mark.unit
+def test_antialiased_edge_is_forgiven():
+    expected = _page()
+    actual = expected.copy()
+    actual[10:30, 40] = 128     # the block's right edge smoothed by one gray column
+
+    diff = compare_images(actual, expected)
+
+    assert diff.matches, diff.describe()
+    assert diff.antialiased == 20
+    assert not compare_images(actual, expected, antialiasing=False).matches
+
+
+@pytest.mark.unit
+def test_baseline_objects_are_png(tmp_path):
+    pixels = _page()
+    jpeg = BytesIO()
+    Image.fromarray(pixels).save(jpeg, format="JPEG")
+
+    store = BaselineStore(tmp_path)
+    entry = store.put("test_module/test/tile.png", jpeg.getvalue(), decode(jpeg.getvalue()))
+
+    path = store.object_path(entry["sha256"])
+    assert path.read_bytes()[:4] == b"\x89PNG"
+    assert np.array_equal(decode(path), decode(jpeg.getvalue()))
+
+
+# fractional CSS boxes and the pixels Playwright's element screenshot covers for each
+# (left / top floored, right / bottom ceiled, with its 1e-3 slack)
+FRACTIONAL_BOXES = [(10.4, 20.6, 30.5, 40.2), (50.5, 20.6, 30.5, 40.2), (90.6, 70.49, 30.5, 40.2), (10.0, 70.9995, 29.75, 40.0)]
+ELEMENT_RECTS = [(10, 20, 31, 41), (50, 20, 31, 41), (90, 70, 32, 41), (10, 71, 30, 40)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("scale", [1, 2])
+def test_tiles_cut_like_element_screenshots(scale):
+    """
+    Tiles cut from one clip of a synthetic grid equal the element screenshots of their fractional boxes
+    """
+    page = np.random.default_rng(7).integers(0, 256, (160 * scale, 160 * scale, 3), dtype=np.uint8)
+
+    (left, top, width, height), tiles = tile_layout(FRACTIONAL_BOXES, scale)
+    grid = page[top * scale:(top + height) * scale, left * scale:(left + width) * scale]
+    buffer = BytesIO()
+    Image.fromarray(grid).save(buffer, format="PNG")
+
+    assert [enclosing_box(*box) for box in FRACTIONAL_BOXES] == ELEMENT_RECTS
+    for (x, y, w, h), tile in zip(ELEMENT_RECTS, crop_tiles(buffer.getvalue(), tiles)):
+        assert np.array_equal(tile, page[y * scale:(y + h) * scale, x * scale:(x + w) * scale]), (x, y, w, h)
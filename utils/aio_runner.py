@@ -0,0 +1,32 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, List, Optional
+
+
+class AsyncRunner:
+    """
+    Owns an event loop on a background thread, so sync tests can drive async Playwright
+    without clashing with the loop sync_playwright keeps on the main thread.
+
+        runner.run(flow())
+        runner.run_all(flow_a(), flow_b())   # concurrently on the one loop
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-playwright", daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def run_all(self, *coroutines: Coroutine, timeout: Optional[float] = None) -> List[Any]:
+        async def gather():
+            return await asyncio.gather(*coroutines)
+
+        return self.run(gather(), timeout)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+from config import VIEWPORT
+from pages.login_page import LoginPage
+
+# personas that end up on inventory.html after login, locked_out_user never does
+CACHED_PERSONAS = ("standard_user", "problem_user", "error_user", "visual_user")
+
+# the session cookie must outlive the test that uses it
+EXPIRY_MARGIN = 60
+
+
+class StorageStateCache:
+    """
+    Logs in through the UI once per persona and base URL, and keeps the resulting
+    Playwright storage_state in memory and on disk until it expires.
+    Files are per xdist worker so parallel workers never race on the same file.
+    prepare_context(context, persona) runs on the login context before it navigates.
+    """
+
+    def __init__(self, directory: Path, ttl: float, worker: Optional[str] = None,
+                 prepare_context: Optional[Callable[[BrowserContext, str], None]] = None) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.worker = worker or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.prepare_context = prepare_context
+        self._entries: dict = {}
+
+    def path_for(self, persona: str, base_url: str) -> Path:
+        url_key = hashlib.sha1(base_url.encode()).hexdigest()[:12]
+        return self.directory / f"{persona}-{url_key}-{self.worker}.json"
+
+    def get(self, browser: Browser, persona: str, base_url: str, password: str = "secret_sauce") -> dict:
+        """
+        Returns a storage_state that is logged in as persona
+        """
+        key = (persona, base_url)
+        entry = self._entries.get(key)
+
+        if entry is None or self._expired(entry):
+            entry = self._load(persona, base_url)
+
+        if entry is None:
+            entry = self._login(browser, persona, base_url, password)
+            self._save(entry)
+
+        self._entries[key] = entry
+        return entry["state"]
+
+    def invalidate(self, persona: str, base_url: str) -> None:
+        self._entries.pop((persona, base_url), None)
+        self.path_for(persona, base_url).unlink(missing_ok=True)
+
+    #----------------Private--------------
+
+    def _expired(self, entry: dict) -> bool:
+        return entry["expires"] - EXPIRY_MARGIN <= time.time()
+
+    def _load(self, persona: str, base_url: str) -> Optional[dict]:
+        path = self.path_for(persona, base_url)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("persona") != persona or entry.get("base_url") != base_url or self._expired(entry):
+            return None
+        return entry
+
+    def _login(self, browser: Browser, persona: str, base_url: str, password: str) -> dict:
+        context = browser.new_context(viewport=VIEWPORT)
+        try:
+            if self.prepare_context is not None:
+                self.prepare_context(context, persona)
+            LoginPage(context.new_page()).open_and_login(base_url, persona, password)
+            state = context.storage_state()
+        finally:
+            context.close()
+
+        created = time.time()
+        expires = created + self.ttl
+        cookie_expiries = [cookie["expires"] for cookie in state["cookies"] if cookie.get("expires", -1) > 0]
+        if cookie_expiries:
+            expires = min(expires, *cookie_expiries)
+
+        return {"persona": persona, "base_url": base_url, "created": created, "expires": expires, "state": state}
+
+    def _save(self, entry: dict) -> None:
+        path = self.path_for(entry["persona"], entry["base_url"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, path)
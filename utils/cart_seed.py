@@ -0,0 +1,35 @@
+import json
+import uuid
+from typing import Iterable
+
+from playwright.sync_api import Page
+
+from test_data.product_data import Product
+
+# the app keeps the cart as a JSON list of inventory ids under this key
+CART_STORAGE_KEY = "cart-contents"
+
+# runs before the app's own scripts, but only once per tab so later reloads keep what the test did
+_SEED_SCRIPT = """
+(([key, ids, marker]) => {
+    if (window.top !== window || sessionStorage.getItem(marker)) return;
+    sessionStorage.setItem(marker, "1");
+    localStorage.setItem(key, JSON.stringify(ids));
+})(%s);
+"""
+
+
+def cart_ids(products: Iterable[Product]) -> list:
+    return [product.inventory_id for product in products]
+
+
+def seed_cart(page: Page, products: Iterable[Product], reload: bool = True) -> None:
+    """
+    Puts the products in the cart without touching the UI.
+    With reload=False the cart is written on the page's next navigation instead.
+    """
+    marker = f"cart-seed-{uuid.uuid4().hex}"
+    page.add_init_script(script=_SEED_SCRIPT % json.dumps([CART_STORAGE_KEY, cart_ids(products), marker]))
+
+    if reload:
+        page.reload()
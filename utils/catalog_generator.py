@@ -0,0 +1,86 @@
+"""
+Deterministic synthetic catalogs, with one image per product, for the local stand-in app.
+
+    python -m utils.catalog_generator --size 5000 --out .catalogs/5000
+
+writes <out>/catalog.json (Catalog.from_json) and <out>/images/ (LocalSwagLabs(image_dir=...)).
+"""
+import argparse
+import json
+import random
+import zlib
+from pathlib import Path
+
+from test_data.catalog import Catalog, Product, image_file_name
+
+ADJECTIVES = ("Sleek", "Rugged", "Classic", "Midweight", "Reinforced", "Water-resistant", "Ringspun", "Streamlined")
+NOUNS = ("Backpack", "Bike Light", "Bolt T-Shirt", "Fleece Jacket", "Onesie", "Water Bottle", "Sticker Pack", "Beanie")
+
+IMAGE_SIZE = (120, 150)
+
+
+def generate_catalog(size: int, seed: int = 0) -> Catalog:
+    """
+    The same size and seed always give the same products, names are unique
+    """
+    rng = random.Random(seed)
+    products = []
+
+    for index in range(size):
+        adjective, noun = rng.choice(ADJECTIVES), rng.choice(NOUNS)
+        products.append(Product(
+            id=index + 1,
+            name=f"Sauce Labs {adjective} {noun} {index:05d}",
+            price=rng.randint(3, 79) + 0.99,
+            description=f"{adjective} {noun.lower()} number {index}, generated for catalog scaling tests.",
+            image_path=f"/static/media/generated-{index:05d}.jpg",
+            inventory_id=index,
+        ))
+
+    return Catalog(products)
+
+
+def render_images(catalog: Catalog, image_dir: Path) -> None:
+    """
+    One flat colored JPEG per product, named the way LocalSwagLabs looks images up
+    """
+    from PIL import Image, ImageDraw
+
+    image_dir.mkdir(parents=True, exist_ok=True)
+    for product in catalog:
+        path = image_dir / image_file_name(product.name)
+        if path.is_file():
+            continue
+
+        checksum = zlib.crc32(product.name.encode())
+        color = (checksum & 0xFF, (checksum >> 8) & 0xFF, (checksum >> 16) & 0xFF)
+        image = Image.new("RGB", IMAGE_SIZE, color)
+        ImageDraw.Draw(image).text((8, 8), str(product.inventory_id), fill=(255 - color[0], 255 - color[1], 255 - color[2]))
+        image.save(path, "JPEG", quality=80)
+
+
+def write_catalog(directory: Path, size: int, seed: int = 0) -> Catalog:
+    """
+    Generates the catalog into directory, images that already exist are kept
+    """
+    directory = Path(directory)
+    catalog = generate_catalog(size, seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "catalog.json").write_text(json.dumps({"seed": seed, "products": catalog.to_records()}))
+    render_images(catalog, directory / "images")
+    return catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, required=True)
+    options = parser.parse_args()
+
+    catalog = write_catalog(options.out, options.size, options.seed)
+    print(f"Wrote {len(catalog)} products to {options.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import pytest
+
+TIMING_PROPERTY = "fixture_timing"
+
+
+class FixtureStats:
+    __slots__ = ("scope", "setups", "setup", "teardowns", "teardown")
+
+    def __init__(self, scope: str) -> None:
+        self.scope = scope
+        self.setups = 0
+        self.setup = 0.0
+        self.teardowns = 0
+        self.teardown = 0.0
+
+
+class FixtureTimer:
+    """
+    Times every fixture's setup and teardown, and the test body, per test.
+    Each fixture gets only its own time: arguments are resolved before its setup starts, and a
+    fixture pulled in through getfixturevalue during the setup is subtracted from it.
+    Timings travel in the teardown report's user_properties so the xdist controller
+    can aggregate what the workers measured.
+    """
+
+    def __init__(self, top: int = 15) -> None:
+        self.top = top
+        self.current: Dict = {}
+        self.setup_stack: List[List[float]] = []    # children's setup seconds of every fixture being set up
+        self.fixtures: Dict[str, FixtureStats] = {}
+        self.phases: Dict[str, float] = defaultdict(float)
+        self.body = 0.0
+        self.tests = 0
+
+    #-----------------Measuring-----------------
+
+    def _add(self, kind: str, argname: str, scope: str, seconds: float) -> None:
+        timings = self.current.setdefault(kind, {})
+        entry = timings.setdefault(argname, [scope, 0, 0.0])
+        entry[1] += 1
+        entry[2] += seconds
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.current = {"setup": {}, "teardown": {}, "body": 0.0}
+        item.user_properties.append((TIMING_PROPERTY, self.current))
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        argname, scope = fixturedef.argname, fixturedef.scope
+        teardown_started = []
+
+        # finalizers run last in first out, so these two bracket the fixture's own teardown
+        def teardown_finished() -> None:
+            if teardown_started:
+                self._add("teardown", argname, scope, time.perf_counter() - teardown_started.pop())
+
+        fixturedef.addfinalizer(teardown_finished)
+        children = [0.0]
+        self.setup_stack.append(children)
+        started = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - started
+        self.setup_stack.pop()
+        if self.setup_stack:
+            self.setup_stack[-1][0] += elapsed
+        self._add("setup", argname, scope, elapsed - children[0])
+        fixturedef.addfinalizer(lambda: teardown_started.append(time.perf_counter()))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        started = time.perf_counter()
+        yield
+        self.current["body"] = time.perf_counter() - started
+
+    #-----------------Hooks-----------------
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.phases[report.when] += report.duration
+        if report.when != "teardown":
+            return
+
+        for name, timings in report.user_properties:
+            if name != TIMING_PROPERTY:
+                continue
+            self.tests += 1
+            self.body += timings["body"]
+            for kind in ("setup", "teardown"):
+                for argname, (scope, count, seconds) in timings[kind].items():
+                    stats = self.fixtures.setdefault(argname, FixtureStats(scope))
+                    setattr(stats, kind + "s", getattr(stats, kind + "s") + count)
+                    setattr(stats, kind, getattr(stats, kind) + seconds)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.tests:
+            return
+
+        wall = sum(self.phases.values()) or 1.0
+        setup = sum(stats.setup for stats in self.fixtures.values())
+        teardown = sum(stats.teardown for stats in self.fixtures.values())
+
+        terminalreporter.section("fixture timing")
+        terminalreporter.write_line(f"{self.tests} tests, {wall:.2f} s in setup / call / teardown")
+        for label, seconds in (("fixture setup", setup), ("test body", self.body), ("fixture teardown", teardown)):
+            terminalreporter.write_line(f"  {label:<17} {seconds:9.2f} s  {seconds / wall:6.1%}")
+        other = wall - setup - self.body - teardown
+        terminalreporter.write_line(f"  {'hooks and other':<17} {other:9.2f} s  {other / wall:6.1%}")
+
+        terminalreporter.write_line("")
+        terminalreporter.write_line(f"{'fixture':<28} {'scope':<9} {'setups':>6} {'setup s':>9} {'mean ms':>8} {'teardown s':>10} {'of wall':>7}")
+        ranked: List = sorted(self.fixtures.items(), key=lambda item: -(item[1].setup + item[1].teardown))
+        for argname, stats in ranked[:self.top]:
+            mean = stats.setup / stats.setups * 1000 if stats.setups else 0.0
+            share = (stats.setup + stats.teardown) / wall
+            terminalreporter.write_line(
+                f"{argname:<28} {stats.scope:<9} {stats.setups:6d} {stats.setup:9.2f} {mean:8.1f} {stats.teardown:10.2f} {share:7.1%}"
+            )
@@ -0,0 +1,156 @@
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Set
+
+from playwright.sync_api import BrowserContext, Route
+
+HAR_MODES = ("off", "record", "replay")
+
+
+class HarArchive:
+    """
+    Records the app's traffic into one HAR per persona, or replays it through context.route_from_har.
+
+    record -> every context writes its own HAR into <directory>/.recording, they are merged into
+              <directory>/<persona>.har once the session (or the xdist controller) finishes
+    replay -> requests are answered from <directory>/<persona>.har, anything missing from it is
+              aborted and reported in the terminal summary
+    """
+
+    def __init__(self, mode: str, directory: Path) -> None:
+        self.mode = mode
+        self.directory = Path(directory)
+        self.recording_dir = self.directory / ".recording"
+        self.misses: Dict[str, List[str]] = {}
+        self.discarded: Dict[str, List[str]] = {}
+        self._attached: Dict[int, str] = {}     # id(context) -> persona it is routed for
+        self._mixed: Set[int] = set()           # recording contexts a second persona logged in on
+
+    def path_for(self, persona: str) -> Path:
+        return self.directory / f"{persona}.har"
+
+    def attach(self, context: BrowserContext, persona: str, node=None) -> None:
+        """
+        Routes the context through the persona's HAR, again only when the context changes persona.
+
+        A context records into one HAR until it closes, so when a second persona logs in on it
+        (test_visual_user_layout) the recording would hold both personas' traffic, it is thrown
+        away on close instead. On replay the previous persona's routes are dropped first.
+        """
+        if self.mode == "off":
+            return
+
+        previous = self._attached.get(id(context))
+        if previous == persona:
+            return
+        self._attached[id(context)] = persona
+        if previous is None:
+            context.once("close", lambda _: self._attached.pop(id(context), None))
+
+        if self.mode == "record":
+            if previous is None:
+                self.recording_dir.mkdir(parents=True, exist_ok=True)
+                path = self.recording_dir / f"{persona}--{uuid.uuid4().hex}.har"
+                context.route_from_har(path, update=True, update_content="embed")
+                context.once("close", lambda _: self._discard_if_mixed(context, path))
+            else:
+                self._mixed.add(id(context))
+                if node is not None:
+                    node.user_properties.append(("har_discarded", [previous, persona]))
+            return
+
+        har_path = self.path_for(persona)
+        if not har_path.is_file():
+            raise FileNotFoundError(f"No HAR recorded for '{persona}' at {har_path}, run once with --har-mode=record")
+
+        if previous is not None:
+            context.unroute_all(behavior="ignoreErrors")
+
+        misses: List[str] = []
+        if node is not None:
+            node.user_properties.append(("har_misses", misses))
+
+        # routes are matched newest first, so this only sees what the HAR could not answer
+        def on_miss(route: Route) -> None:
+            misses.append(f"{route.request.method} {route.request.url}")
+            route.abort("internetdisconnected")
+
+        context.route("**/*", on_miss)
+        context.route_from_har(har_path, not_found="fallback")
+
+    def merge_recordings(self) -> List[Path]:
+        """
+        Folds every recorded HAR into its persona's archive, newer entries win
+        """
+        if not self.recording_dir.is_dir():
+            return []
+
+        recordings: Dict[str, List[Path]] = {}
+        for path in sorted(self.recording_dir.glob("*.har"), key=lambda p: p.stat().st_mtime):
+            recordings.setdefault(path.name.split("--")[0], []).append(path)
+
+        written = []
+        for persona, paths in recordings.items():
+            target = self.path_for(persona)
+            archive = None
+            entries = {}
+
+            for path in [target, *paths]:
+                if not path.is_file():
+                    continue
+                har = json.loads(path.read_text())
+                archive = archive or har
+                for entry in har["log"]["entries"]:
+                    request = entry["request"]
+                    entries[(request["method"], request["url"], request.get("postData", {}).get("text"))] = entry
+
+            if archive is None:
+                continue
+            archive["log"]["entries"] = list(entries.values())
+            tmp_path = target.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(archive))
+            os.replace(tmp_path, target)
+            written.append(target)
+
+            for path in paths:
+                path.unlink()
+
+        return written
+
+    def _discard_if_mixed(self, context: BrowserContext, path: Path) -> None:
+        # the HAR is saved before the close event fires
+        if id(context) in self._mixed:
+            self._mixed.discard(id(context))
+            path.unlink(missing_ok=True)
+
+    #-----------------Hooks-----------------
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == "har_misses" and value:
+                self.misses[report.nodeid] = list(value)
+            elif name == "har_discarded":
+                self.discarded[report.nodeid] = list(value)
+
+    def pytest_sessionfinish(self, session) -> None:
+        # with xdist only the controller merges, after every worker closed its contexts
+        if self.mode == "record" and not hasattr(session.config, "workerinput"):
+            self.merge_recordings()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.mode == "record":
+            terminalreporter.write_line(f"HAR archives recorded under {self.directory}")
+            for nodeid, personas in self.discarded.items():
+                terminalreporter.write_line(f"    not recorded, {' and '.join(personas)} shared a context: {nodeid}")
+        if not self.misses:
+            return
+
+        terminalreporter.section("HAR replay misses")
+        for nodeid, misses in self.misses.items():
+            terminalreporter.write_line(f"{nodeid}: {len(misses)} request(s) not in the archive")
+            for miss in misses:
+                terminalreporter.write_line(f"    {miss}")
@@ -1,49 +1,158 @@
-import requests
-import os
-from dotenv import load_dotenv
+"""
+Download every product image into IMAGE_PATH (the local stand-in app serves them from there).
 
+    python -m utils.image_downloader
+    python -m utils.image_downloader --base-url http://127.0.0.1:8000 --workers 4
 
+Images are fetched concurrently over one pooled session and streamed to disk. Their ETag and
+Last-Modified are kept in <out>/.manifest.json, so a rerun sends conditional requests and an
+unchanged image costs one 304 and no write.
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from test_data.catalog import Product, image_file_name
 from test_data.product_data import PRODUCTS
 
 load_dotenv()
 BASE_URL = os.getenv("BASE_URL")
 IMAGE_PATH = os.getenv("IMAGE_PATH")
 
-IMAGE_DIR = Path(IMAGE_PATH)
-IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+MANIFEST = ".manifest.json"
+CHUNK_SIZE = 64 * 1024
+TIMEOUT = 10
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    name: str
+    status: int         # 200 downloaded, 304 unchanged
+    size: int           # bytes written, 0 when unchanged
+
+
+class ImageDownloader:
+    """
+    One requests.Session shared by a bounded thread pool, its connection pool is as large as the
+    pool so every worker keeps its connection alive.
+    """
+
+    def __init__(self, base_url: str, image_dir: Path, workers: int = 8) -> None:
+        self.base_url = base_url
+        self.image_dir = Path(image_dir)
+        self.workers = workers
+        self.manifest_path = self.image_dir / MANIFEST
+        self.manifest: Dict[str, dict] = {}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def download_all(self, products: Iterable[Product] = PRODUCTS, force: bool = False) -> List[DownloadResult]:
+        self.image_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = {} if force else self._read_manifest()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self.download, products))
+
+        if any(result.status != 304 for result in results):
+            self._write_manifest()
+        return results
+
+    def download(self, product: Product) -> DownloadResult:
+        name = image_file_name(product.name)
+        path = self.image_dir / name
+        url = urljoin(self.base_url, product.image_path)
+
+        with self.session.get(url, headers=self._conditional_headers(name, path), stream=True, timeout=TIMEOUT) as response:
+            if response.status_code == 304:
+                return DownloadResult(name, 304, 0)
+            response.raise_for_status()
+
+            # streamed into a temporary file, the previous image stays intact if this one fails
+            partial = path.with_name(f".{name}.part")
+            size = 0
+            with open(partial, "wb") as file:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    file.write(chunk)
+                    size += len(chunk)
+            os.replace(partial, path)
+
+            # each worker writes its own key, the manifest is saved once all are done
+            self.manifest[name] = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "size": size,
+            }
+            return DownloadResult(name, response.status_code, size)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "ImageDownloader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    #-------------Private--------------
+
+    def _conditional_headers(self, name: str, path: Path) -> Dict[str, str]:
+        entry: Optional[dict] = self.manifest.get(name)
+        if entry is None or not path.is_file() or path.stat().st_size != entry.get("size"):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _read_manifest(self) -> Dict[str, dict]:
+        if not self.manifest_path.is_file():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
 
-def normalize_image_name(name: str) -> str: 
-    import pdb
-    pdb.set_trace()
-    #takes O(k * n * m ) times
-    # return (name.lower().replace(" ", "_").replace("(", "").replace(")", "").replace(".", "")) + ".jpg"
+    def _write_manifest(self) -> None:
+        self.manifest_path.write_text(json.dumps(dict(sorted(self.manifest.items())), indent=2) + "\n", encoding="utf-8")
 
-    #takes O(n) time as lookup takes O(n * m ) , since m = 1 , Only O(n) time compl
-    table = str.maketrans({
-        " ": "_",
-        "(": "",
-        ")": "",
-        ".": ""
-    })
 
-    cleaned = name.lower().translate(table) + ".jpg"
-    return cleaned
+def download_all_product_images(base_url: Optional[str] = None, image_dir: Optional[Path] = None, workers: int = 8,
+                                force: bool = False, products: Iterable[Product] = PRODUCTS) -> List[DownloadResult]:
+    with ImageDownloader(base_url or BASE_URL, Path(image_dir or IMAGE_PATH), workers) as downloader:
+        return downloader.download_all(products, force)
 
-def download_all_product_images():
-    for product in PRODUCTS:
-        image_url = BASE_URL + product.image_path
-        filename = normalize_image_name(product.name)
 
-        save_path = IMAGE_DIR / filename
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=BASE_URL, help="defaults to BASE_URL from .env")
+    parser.add_argument("--out", type=Path, default=IMAGE_PATH, help="defaults to IMAGE_PATH from .env")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and download everything again")
+    options = parser.parse_args()
 
-        response = requests.get(image_url, timeout=10)
-        response.raise_for_status()
+    results = download_all_product_images(options.base_url, options.out, options.workers, options.force)
+    for result in results:
+        print(f"{'Saved' if result.status == 200 else 'Unchanged'}: {options.out / result.name}")
 
-        save_path.write_bytes(response.content)
-        print(f"Saved: {save_path}")       
-    
+    written = [result for result in results if result.status == 200]
+    print(f"{len(written)} downloaded ({sum(result.size for result in written)} bytes), {len(results) - len(written)} unchanged")
 
 
 if __name__ == "__main__":
-    download_all_product_images()
\ No newline at end of file
+    main()
@@ -0,0 +1,257 @@
+import contextvars
+import functools
+import inspect
+import json
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import playwright.async_api as async_api
+import playwright.sync_api as sync_api
+
+# methods that only build a locator or register a listener, no browser round trip
+NO_ROUND_TRIP = {
+    "locator", "filter", "nth", "and_", "or_", "describe", "frame_locator", "frame",
+    "on", "once", "remove_listener", "is_closed", "set_default_timeout", "set_default_navigation_timeout",
+}
+
+NAVIGATION = {"goto", "reload", "go_back", "go_forward", "wait_for_url", "wait_for_load_state", "set_content"}
+WAITS = {"wait_for", "wait_for_timeout", "wait_for_selector", "wait_for_function", "wait_for_event"}
+ACTIONS = {
+    "click", "dblclick", "tap", "fill", "type", "press", "press_sequentially", "clear", "check", "uncheck",
+    "set_checked", "select_option", "select_text", "hover", "focus", "blur", "drag_to", "drag_and_drop",
+    "dispatch_event", "set_input_files", "scroll_into_view_if_needed",
+}
+
+CATEGORIES = ("expect", "action", "query", "wait", "navigation")
+
+# (api namespace, class name, category override), expect classes are all "expect"
+INSTRUMENTED = [
+    (api, name, "expect" if name.endswith("Assertions") else None)
+    for api in (sync_api, async_api)
+    for name in ("Page", "Locator", "LocatorAssertions", "PageAssertions")
+]
+
+_depth = contextvars.ContextVar("instrumentation_depth", default=0)
+
+
+def category_of(method: str) -> str:
+    if method in NAVIGATION:
+        return "navigation"
+    if method in WAITS:
+        return "wait"
+    if method in ACTIONS:
+        return "action"
+    return "query"
+
+
+def caller_of(frame) -> str:
+    """
+    Nearest page object method on the stack ("DashboardPage.assert_product_visible"),
+    else the first frame outside playwright ("tests.conftest.login_user")
+    """
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("pages."):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            return f"{type(owner).__name__}.{name}" if owner is not None else f"{module}.{name}"
+        if fallback is None and not module.startswith(("playwright", "greenlet", "asyncio", __name__)):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback or "<unknown>"
+
+
+class CallStats:
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+
+    def add(self, seconds: float, calls: int = 1) -> None:
+        self.calls += calls
+        self.seconds += seconds
+
+    def as_dict(self) -> dict:
+        return {"calls": self.calls, "seconds": round(self.seconds, 6)}
+
+
+class CallLog:
+    """
+    Every instrumented call made while one test (setup, body and teardown) ran
+    """
+
+    def __init__(self, nodeid: str) -> None:
+        self.nodeid = nodeid
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.by_category: Dict[str, CallStats] = defaultdict(CallStats)
+        self.by_api: Dict[str, CallStats] = defaultdict(CallStats)
+        self.by_method: Dict[Tuple[str, str], CallStats] = defaultdict(CallStats)
+
+    def add(self, api: str, category: str, caller: str, seconds: float) -> None:
+        self.by_category[category].add(seconds)
+        self.by_api[api].add(seconds)
+        self.by_method[(caller, category)].add(seconds)
+
+    def as_dict(self) -> dict:
+        methods: Dict[str, dict] = {}
+        for (caller, category), stats in sorted(self.by_method.items(), key=lambda item: -item[1].seconds):
+            entry = methods.setdefault(caller, {"calls": 0, "seconds": 0.0, "by_category": {}})
+            entry["calls"] += stats.calls
+            entry["seconds"] = round(entry["seconds"] + stats.seconds, 6)
+            entry["by_category"][category] = stats.as_dict()
+
+        return {
+            "nodeid": self.nodeid,
+            "duration": round(self.duration, 6),
+            "round_trips": sum(stats.calls for stats in self.by_category.values()),
+            "by_category": {name: stats.as_dict() for name, stats in self.by_category.items()},
+            "by_api": {name: stats.as_dict() for name, stats in sorted(self.by_api.items(), key=lambda item: -item[1].seconds)},
+            "by_method": methods,
+        }
+
+
+class Instrumentation:
+    """
+    Wraps the Playwright Page / Locator / expect methods, sync and async, and times every
+    call that goes to the browser, per call type and per page object method.
+    Writes <directory>/<test>.json for every test and a top-N table at the end of the session.
+    """
+
+    def __init__(self, directory: Path, top: int = 10) -> None:
+        self.directory = Path(directory)
+        self.top = top
+        self.current: Optional[CallLog] = None
+        self.tests: List[CallLog] = []
+        self.session_started = time.time()
+        self._lock = threading.Lock()
+        self._originals: List[Tuple[type, str, Callable]] = []
+
+    #-----------------Patching-----------------
+
+    def install(self) -> None:
+        for api, class_name, category in INSTRUMENTED:
+            cls = getattr(api, class_name)
+            for name, func in list(vars(cls).items()):
+                if name.startswith("_") or name in NO_ROUND_TRIP or name.startswith(("get_by_", "expect_")):
+                    continue
+                if not inspect.isfunction(func):
+                    continue
+                self._originals.append((cls, name, func))
+                setattr(cls, name, self._wrap(func, f"{class_name}.{name}", category or category_of(name)))
+
+    def uninstall(self) -> None:
+        for cls, name, func in reversed(self._originals):
+            setattr(cls, name, func)
+        self._originals.clear()
+
+    def _wrap(self, func: Callable, api: str, category: str) -> Callable:
+        record = self._record
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                token = _depth.set(_depth.get() + 1)
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _depth.reset(token)
+                    if _depth.get() == 0:
+                        record(api, category, sys._getframe(), time.perf_counter() - started)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            token = _depth.set(_depth.get() + 1)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _depth.reset(token)
+                if _depth.get() == 0:
+                    record(api, category, sys._getframe(), time.perf_counter() - started)
+        return wrapper
+
+    def _record(self, api: str, category: str, frame, seconds: float) -> None:
+        current = self.current
+        if current is None:
+            return
+        caller = caller_of(frame.f_back)
+        with self._lock:
+            current.add(api, category, caller, seconds)
+
+    #-----------------Reports-----------------
+
+    def report_path(self, nodeid: str) -> Path:
+        return self.directory / (re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + ".json")
+
+    def _session_reports(self) -> List[dict]:
+        if self.tests:
+            return [test.as_dict() for test in self.tests]
+        # xdist controller, the workers wrote the reports
+        reports = []
+        for path in self.directory.glob("*.json"):
+            if path.stat().st_mtime >= self.session_started:
+                reports.append(json.loads(path.read_text()))
+        return reports
+
+    #-----------------Hooks-----------------
+
+    def pytest_runtest_logstart(self, nodeid, location) -> None:
+        self.current = CallLog(nodeid)
+
+    def pytest_runtest_logfinish(self, nodeid, location) -> None:
+        current, self.current = self.current, None
+        if current is None:
+            return
+        current.duration = time.perf_counter() - current.started
+        # the xdist controller sees every test but makes no calls, the workers write the reports
+        if not current.by_category:
+            return
+        self.tests.append(current)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.report_path(nodeid).write_text(json.dumps(current.as_dict(), indent=2))
+
+    def pytest_unconfigure(self, config) -> None:
+        self.uninstall()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        reports = self._session_reports()
+        if not reports:
+            return
+
+        by_category: Dict[str, CallStats] = defaultdict(CallStats)
+        by_method: Dict[str, CallStats] = defaultdict(CallStats)
+        by_api: Dict[str, CallStats] = defaultdict(CallStats)
+        for report in reports:
+            for name, stats in report["by_category"].items():
+                by_category[name].add(stats["seconds"], stats["calls"])
+            for name, stats in report["by_method"].items():
+                by_method[name].add(stats["seconds"], stats["calls"])
+            for name, stats in report["by_api"].items():
+                by_api[name].add(stats["seconds"], stats["calls"])
+
+        terminalreporter.section("browser round trips")
+        total = sum(stats.seconds for stats in by_category.values()) or 1.0
+        for name in CATEGORIES:
+            stats = by_category.get(name)
+            if stats:
+                terminalreporter.write_line(f"{name:<11} {stats.calls:7d} calls  {stats.seconds:9.2f} s  {stats.seconds / total:6.1%}")
+
+        for title, table in (("page object methods", by_method), ("playwright calls", by_api)):
+            terminalreporter.write_line("")
+            terminalreporter.write_line(f"top {self.top} {title} by time")
+            for name, stats in sorted(table.items(), key=lambda item: -item[1].seconds)[:self.top]:
+                terminalreporter.write_line(f"  {stats.seconds:9.2f} s  {stats.calls:7d} calls  {name}")
+
+        terminalreporter.write_line("")
+        terminalreporter.write_line(f"per test reports in {self.directory}")
@@ -0,0 +1,38 @@
+"""
+Serve the local Swag Labs stand-in until interrupted.
+
+    python -m utils.local_app --port 8000
+    python -m utils.local_app --catalog .catalogs/5000/catalog.json --images .catalogs/5000/images
+"""
+import argparse
+from pathlib import Path
+
+from test_data.catalog import Catalog
+from test_data.product_data import PRODUCTS
+from utils.local_app import LocalSwagLabs
+from utils.local_app.server import IMAGE_DIR
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--catalog", type=Path, help="JSON or CSV catalog, see utils.catalog_generator")
+    parser.add_argument("--images", type=Path, default=IMAGE_DIR)
+    options = parser.parse_args()
+
+    products = PRODUCTS
+    if options.catalog is not None:
+        products = Catalog.from_csv(options.catalog) if options.catalog.suffix == ".csv" else Catalog.from_json(options.catalog)
+
+    app = LocalSwagLabs(products, host=options.host, port=options.port, image_dir=options.images)
+    print(f"Serving Swag Labs on {app.url}")
+    app.start()
+    try:
+        app._thread.join()
+    except KeyboardInterrupt:
+        app.stop()
+
+
+if __name__ == "__main__":
+    main()
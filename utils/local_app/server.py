@@ -0,0 +1,172 @@
+import hashlib
+import json
+import mimetypes
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+from test_data.catalog import image_file_name
+from test_data.product_data import PRODUCTS, Product
+
+STATIC_DIR = Path(__file__).parent / "static"
+IMAGE_DIR = Path(__file__).parent.parent.parent / "assets" / "product_images"
+
+# problem_user (every product) and visual_user (the first product) see this instead of the product image
+BROKEN_IMAGE_PATH = "/static/media/sl-404.168b1cce.jpg"
+
+# every client side route is served the same app shell
+APP_ROUTES = (
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+)
+
+
+class _Route:
+    __slots__ = ("content_type", "body", "cache", "etag", "modified", "last_modified")
+
+    def __init__(self, content_type: str, body: bytes, cache: bool, modified: Optional[float] = None) -> None:
+        self.content_type = content_type
+        self.body = body
+        self.cache = cache
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.modified = int(modified if modified is not None else time.time())
+        self.last_modified = formatdate(self.modified, usegmt=True)
+
+    def not_modified(self, headers) -> bool:
+        """
+        If-None-Match wins over If-Modified-Since, as in RFC 9110
+        """
+        if_none_match = headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = headers.get("If-Modified-Since")
+        if if_modified_since is None:
+            return False
+        try:
+            return self.modified <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+class LocalSwagLabs:
+    """
+    A local stand-in for https://www.saucedemo.com.
+    Pages, data-test attributes, persona quirks and the localStorage cart are mimicked by
+    static/app.js, every response is prepared in memory when the server starts.
+
+        with LocalSwagLabs() as app:
+            page.goto(app.url)
+    """
+
+    def __init__(self, products: Iterable[Product] = PRODUCTS, host: str = "127.0.0.1", port: int = 0,
+                 image_dir: Path = IMAGE_DIR) -> None:
+        self.products = products
+        self.image_dir = Path(image_dir)
+        self._routes = self._build_routes()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "LocalSwagLabs":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-swag-labs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalSwagLabs":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    #----------------Private--------------
+
+    def _catalog(self) -> list:
+        return [
+            {
+                "id": product.inventory_id,
+                "name": product.name,
+                "desc": product.description,
+                "price": product.price,
+                "image": product.image_path,
+            }
+            for product in self.products
+        ]
+
+    def _build_routes(self) -> dict:
+        catalog = json.dumps(self._catalog()).replace("</", "<\\/")
+        shell = (STATIC_DIR / "index.html").read_text().replace("{{catalog}}", catalog).encode()
+
+        routes = {path: _Route("text/html; charset=utf-8", shell, cache=False) for path in APP_ROUTES}
+        routes["/static/app.js"] = _Route("text/javascript", (STATIC_DIR / "app.js").read_bytes(), cache=True)
+        routes["/static/app.css"] = _Route("text/css", (STATIC_DIR / "app.css").read_bytes(), cache=True)
+        routes[BROKEN_IMAGE_PATH] = _Route("image/jpeg", (STATIC_DIR / "sl-404.jpg").read_bytes(), cache=True)
+
+        for product in self.products:
+            image = self.image_dir / image_file_name(product.name)
+            if image.is_file():
+                content_type = mimetypes.guess_type(image.name)[0] or "application/octet-stream"
+                routes[product.image_path] = _Route(content_type, image.read_bytes(), cache=True, modified=image.stat().st_mtime)
+
+        return routes
+
+    def _handler_class(self) -> type:
+        routes = self._routes
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self._respond(send_body=True)
+
+            def do_HEAD(self) -> None:
+                self._respond(send_body=False)
+
+            def _respond(self, send_body: bool) -> None:
+                route = routes.get(urlsplit(self.path).path)
+                if route is None:
+                    self.send_error(404)
+                    return
+
+                # conditional requests (the image downloader, browser revalidation) get a bodyless 304
+                not_modified = route.not_modified(self.headers)
+                self.send_response(304 if not_modified else 200)
+                self.send_header("ETag", route.etag)
+                self.send_header("Last-Modified", route.last_modified)
+                self.send_header("Cache-Control", "public, max-age=3600" if route.cache else "no-cache")
+                if not_modified:
+                    self.end_headers()
+                    return
+
+                self.send_header("Content-Type", route.content_type)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(route.body)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
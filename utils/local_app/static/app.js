@@ -0,0 +1,496 @@
+// Stand-in for the Swag Labs single page app, see utils/local_app/server.py
+(function () {
+    "use strict";
+
+    const CATALOG = window.SWAG_LABS_CATALOG;
+    const PRODUCTS = new Map(CATALOG.map((product) => [product.id, product]));
+
+    const CART_KEY = "cart-contents";
+    const SESSION_COOKIE = "session-username";
+    const SESSION_SECONDS = 600;
+    const LOGIN_ERROR_KEY = "login-error";
+    const PASSWORD = "secret_sauce";
+    const USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+    const BROKEN_IMAGE = "/static/media/sl-404.168b1cce.jpg";
+    const TAX_RATE = 0.08;
+
+    const SORT_OPTIONS = [
+        ["az", "Name (A to Z)"],
+        ["za", "Name (Z to A)"],
+        ["lohi", "Price (low to high)"],
+        ["hilo", "Price (high to low)"],
+    ];
+
+    // problem_user and error_user: "Add to cart" does nothing for these, "Remove" does nothing for any product
+    const UNADDABLE_IDS = new Set([1, 3, 5]);
+
+    const PROTECTED_PAGES = {
+        "/inventory.html": renderInventory,
+        "/inventory-item.html": renderItem,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderCheckoutInfo,
+        "/checkout-step-two.html": renderOverview,
+        "/checkout-complete.html": renderComplete,
+    };
+
+    const root = document.getElementById("root");
+    const state = { sort: "az", menuOpen: false, visualPrices: new Map() };
+
+    //------------helpers------------
+    function escape(text) {
+        return String(text).replace(/[&<>"']/g, (char) => (
+            { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[char]
+        ));
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    function user() {
+        const match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(username) {
+        document.cookie = `${SESSION_COOKIE}=${encodeURIComponent(username)}; path=/; max-age=${SESSION_SECONDS}`;
+    }
+
+    function clearUser() {
+        document.cookie = `${SESSION_COOKIE}=; path=/; max-age=0`;
+    }
+
+    function is(...personas) {
+        return personas.includes(user());
+    }
+
+    function cart() {
+        try {
+            const ids = JSON.parse(localStorage.getItem(CART_KEY) || "[]");
+            return Array.isArray(ids) ? ids.filter((id) => PRODUCTS.has(id)) : [];
+        } catch (error) {
+            return [];
+        }
+    }
+
+    function saveCart(ids) {
+        if (ids.length) {
+            localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function imageFor(product, index) {
+        if (is("problem_user")) return BROKEN_IMAGE;
+        if (is("visual_user") && index === 0) return BROKEN_IMAGE;
+        return product.image;
+    }
+
+    function priceFor(product) {
+        if (!is("visual_user")) return product.price;
+        if (!state.visualPrices.has(product.id)) {
+            state.visualPrices.set(product.id, Math.round(Math.random() * 10000) / 100);
+        }
+        return state.visualPrices.get(product.id);
+    }
+
+    function sorted(products) {
+        const list = [...products];
+        // code point order, the order Catalog.sorted gives the page objects (localeCompare depends on the browser's ICU)
+        const byName = (a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : 0);
+        const byPrice = (a, b) => a.price - b.price;
+        const compare = { az: byName, za: (a, b) => byName(b, a), lohi: byPrice, hilo: (a, b) => byPrice(b, a) }[state.sort];
+        return list.sort(compare);
+    }
+
+    //------------layout------------
+    function header(title, secondary = "") {
+        const count = cart().length;
+        const badge = count ? `<span class="shopping_cart_badge" data-test="shopping-cart-badge">${count}</span>` : "";
+
+        return `
+        <div class="header_container" data-test="header-container" id="header_container">
+            <div class="primary_header" data-test="primary-header">
+                <div id="menu_button_container">
+                    <div class="bm-burger-button"><button type="button" id="react-burger-menu-btn" data-action="open-menu">Open Menu</button></div>
+                    <div class="bm-menu-wrap" aria-hidden="${!state.menuOpen}" ${state.menuOpen ? "" : "hidden"}>
+                        <nav class="bm-item-list">
+                            <a id="inventory_sidebar_link" class="bm-item menu-item" data-test="inventory-sidebar-link" href="/inventory.html">All Items</a>
+                            <a id="about_sidebar_link" class="bm-item menu-item" data-test="about-sidebar-link" href="https://saucelabs.com/">About</a>
+                            <a id="logout_sidebar_link" class="bm-item menu-item" data-test="logout-sidebar-link" href="#" data-action="logout">Logout</a>
+                            <a id="reset_sidebar_link" class="bm-item menu-item" data-test="reset-sidebar-link" href="#" data-action="reset">Reset App State</a>
+                        </nav>
+                        <button type="button" id="react-burger-cross-btn" data-action="close-menu">Close Menu</button>
+                    </div>
+                </div>
+                <div class="header_label"><div class="app_logo">Swag Labs</div></div>
+                <div id="shopping_cart_container" class="shopping_cart_container">
+                    <a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html">${badge}</a>
+                </div>
+            </div>
+            <div class="header_secondary_container" data-test="secondary-header">
+                <span class="title" data-test="title">${escape(title)}</span>
+                ${secondary}
+            </div>
+        </div>`;
+    }
+
+    function footer() {
+        return `
+        <footer class="footer" data-test="footer">
+            <div class="footer_copy" data-test="footer-copy">© 2026 Sauce Labs. All Rights Reserved.</div>
+        </footer>`;
+    }
+
+    function page(title, body, secondary = "") {
+        return `
+        <div id="page_wrapper" class="page_wrapper">
+            <div id="contents_wrapper">${header(title, secondary)}${body}</div>
+            ${footer()}
+        </div>`;
+    }
+
+    function addOrRemoveButton(product, extraClass, ids) {
+        const inCart = ids.includes(product.id);
+        const prefix = inCart ? "remove" : "add-to-cart";
+        const id = extraClass === "btn_inventory" ? `${prefix}-${slug(product.name)}` : prefix;
+        const style = inCart ? "btn_secondary" : "btn_primary";
+        const label = inCart ? "Remove" : "Add to cart";
+        const action = inCart ? "remove" : "add";
+
+        return `<button class="btn ${style} btn_small ${extraClass}" data-test="${id}" id="${id}" name="${id}"
+                        data-action="${action}" data-id="${product.id}">${label}</button>`;
+    }
+
+    function lineItem(product, withRemove) {
+        const remove = withRemove
+            ? `<button class="btn btn_secondary btn_small cart_button" data-test="remove-${slug(product.name)}"
+                       id="remove-${slug(product.name)}" name="remove-${slug(product.name)}"
+                       data-action="remove-from-cart" data-id="${product.id}">Remove</button>`
+            : "";
+
+        return `
+        <div class="cart_item" data-test="inventory-item">
+            <div class="cart_quantity" data-test="item-quantity">1</div>
+            <div class="cart_item_label">
+                <a href="/inventory-item.html?id=${product.id}" id="item_${product.id}_title_link" data-test="item-${product.id}-title-link">
+                    <div class="inventory_item_name" data-test="inventory-item-name">${escape(product.name)}</div>
+                </a>
+                <div class="inventory_item_desc" data-test="inventory-item-desc">${escape(product.desc)}</div>
+                <div class="item_pricebar" data-test="item-pricebar">
+                    <div class="inventory_item_price" data-test="inventory-item-price">${money(priceFor(product))}</div>
+                    ${remove}
+                </div>
+            </div>
+        </div>`;
+    }
+
+    function cartList(ids, withRemove) {
+        const items = ids.map((id) => lineItem(PRODUCTS.get(id), withRemove)).join("");
+        return `
+        <div class="cart_list" data-test="cart-list">
+            <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>
+            <div class="cart_desc_label" data-test="cart-desc-label">Description</div>
+            ${items}
+        </div>`;
+    }
+
+    //------------pages------------
+    function renderLogin() {
+        const error = sessionStorage.getItem(LOGIN_ERROR_KEY);
+        const errorBlock = error
+            ? `<h3 data-test="error">${escape(error)}<button class="error-button" data-test="error-button" data-action="dismiss-login-error">×</button></h3>`
+            : "";
+        const errorClass = error ? "input_error form_input error" : "input_error form_input";
+
+        root.innerHTML = `
+        <div class="login_container">
+            <div class="login_logo">Swag Labs</div>
+            <div class="login_wrapper">
+                <form id="login_form">
+                    <div class="form_group">
+                        <input class="${errorClass}" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none">
+                    </div>
+                    <div class="form_group">
+                        <input class="${errorClass}" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none">
+                    </div>
+                    <div class="error-message-container${error ? " error" : ""}">${errorBlock}</div>
+                    <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+                </form>
+            </div>
+            <div class="login_credentials_wrap" data-test="login-credentials-container">
+                <div class="login_credentials" data-test="login-credentials"><h4>Accepted usernames are:</h4>${USERS.join("<br>")}</div>
+                <div class="login_password" data-test="login-password"><h4>Password for all users:</h4>${PASSWORD}</div>
+            </div>
+        </div>`;
+    }
+
+    function renderInventory() {
+        const ids = cart();
+        const options = SORT_OPTIONS.map(([value, label]) =>
+            `<option value="${value}"${value === state.sort ? " selected" : ""}>${label}</option>`).join("");
+        const activeLabel = SORT_OPTIONS.find(([value]) => value === state.sort)[1];
+        const sortControl = `
+            <div class="right_component">
+                <span class="select_container">
+                    <span class="active_option" data-test="active-option">${activeLabel}</span>
+                    <select class="product_sort_container" data-test="product-sort-container">${options}</select>
+                </span>
+            </div>`;
+
+        const cards = sorted(CATALOG).map((product, index) => `
+            <div class="inventory_item" data-test="inventory-item">
+                <div class="inventory_item_img">
+                    <a href="/inventory-item.html?id=${product.id}" id="item_${product.id}_img_link" data-test="item-${product.id}-img-link" data-action="open-item" data-id="${product.id}">
+                        <img alt="${escape(product.name)}" class="inventory_item_img" src="${imageFor(product, index)}" data-test="inventory-item-${slug(product.name)}-img">
+                    </a>
+                </div>
+                <div class="inventory_item_description" data-test="inventory-item-description">
+                    <div class="inventory_item_label">
+                        <a href="/inventory-item.html?id=${product.id}" id="item_${product.id}_title_link" data-test="item-${product.id}-title-link" data-action="open-item" data-id="${product.id}">
+                            <div class="inventory_item_name" data-test="inventory-item-name">${escape(product.name)}</div>
+                        </a>
+                        <div class="inventory_item_desc" data-test="inventory-item-desc">${escape(product.desc)}</div>
+                    </div>
+                    <div class="pricebar">
+                        <div class="inventory_item_price" data-test="inventory-item-price">${money(priceFor(product))}</div>
+                        ${addOrRemoveButton(product, "btn_inventory", ids)}
+                    </div>
+                </div>
+            </div>`).join("");
+
+        root.innerHTML = page("Products", `
+            <div id="inventory_container" class="inventory_container" data-test="inventory-container">
+                <div class="inventory_list" data-test="inventory-list">${cards}</div>
+            </div>`, sortControl);
+    }
+
+    function renderItem() {
+        const id = Number(new URLSearchParams(window.location.search).get("id"));
+        const product = PRODUCTS.get(id);
+        const back = `<button class="btn btn_secondary back btn_large inventory_details_back_button" data-test="back-to-products" id="back-to-products" name="back-to-products" data-action="back-to-products">Back to products</button>`;
+
+        if (!product) {
+            root.innerHTML = page("", `<div class="inventory_details" data-test="inventory-container">
+                <div class="inventory_details_name large_size" data-test="inventory-item-name">ITEM NOT FOUND</div></div>`, back);
+            return;
+        }
+
+        root.innerHTML = page("", `
+            <div class="inventory_details" data-test="inventory-container">
+                <img alt="${escape(product.name)}" class="inventory_details_img" src="${is("problem_user") ? BROKEN_IMAGE : product.image}" data-test="item-${slug(product.name)}-img">
+                <div class="inventory_details_desc_container">
+                    <div class="inventory_details_name large_size" data-test="inventory-item-name">${escape(product.name)}</div>
+                    <div class="inventory_details_desc large_size" data-test="inventory-item-desc">${escape(product.desc)}</div>
+                    <div class="inventory_details_price" data-test="inventory-item-price">${money(priceFor(product))}</div>
+                    ${addOrRemoveButton(product, "btn_inventory_details", cart())}
+                </div>
+            </div>`, back);
+    }
+
+    function renderCart() {
+        root.innerHTML = page("Your Cart", `
+            <div id="cart_contents_container" class="cart_contents_container" data-test="cart-contents-container">
+                ${cartList(cart(), true)}
+                <div class="cart_footer">
+                    <button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" name="continue-shopping" data-action="continue-shopping">Continue Shopping</button>
+                    <button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout" name="checkout" data-action="checkout">Checkout</button>
+                </div>
+            </div>`);
+    }
+
+    function renderCheckoutInfo(error = "") {
+        const errorBlock = error
+            ? `<h3 data-test="error">${escape(error)}<button class="error-button" data-test="error-button" data-action="dismiss-checkout-error">×</button></h3>`
+            : "";
+
+        root.innerHTML = page("Checkout: Your Information", `
+            <div id="checkout_info_container" class="checkout_info_container" data-test="checkout-info-container">
+                <form id="checkout_form">
+                    <div class="checkout_info">
+                        <div class="form_group"><input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName"></div>
+                        <div class="form_group"><input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName"></div>
+                        <div class="form_group"><input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode"></div>
+                        <div class="error-message-container${error ? " error" : ""}">${errorBlock}</div>
+                    </div>
+                    <div class="checkout_buttons">
+                        <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel" type="button" data-action="cancel-checkout">Cancel</button>
+                        <input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">
+                    </div>
+                </form>
+            </div>`);
+    }
+
+    function renderOverview() {
+        const ids = cart();
+        const subtotal = ids.reduce((total, id) => total + priceFor(PRODUCTS.get(id)), 0);
+        const tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+
+        root.innerHTML = page("Checkout: Overview", `
+            <div id="checkout_summary_container" class="checkout_summary_container" data-test="checkout-summary-container">
+                ${cartList(ids, false)}
+                <div class="summary_info">
+                    <div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>
+                    <div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>
+                    <div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>
+                    <div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>
+                    <div class="summary_info_label" data-test="total-info-label">Price Total</div>
+                    <div class="summary_subtotal_label" data-test="subtotal-label">Item total: ${money(subtotal)}</div>
+                    <div class="summary_tax_label" data-test="tax-label">Tax: ${money(tax)}</div>
+                    <div class="summary_info_label summary_total_label" data-test="total-label">Total: ${money(subtotal + tax)}</div>
+                    <div class="cart_footer">
+                        <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel" data-action="cancel-overview">Cancel</button>
+                        <button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" name="finish" data-action="finish">Finish</button>
+                    </div>
+                </div>
+            </div>`);
+    }
+
+    function renderComplete() {
+        root.innerHTML = page("Checkout: Complete!", `
+            <div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">
+                <h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>
+                <div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>
+                <button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" name="back-to-products" data-action="back-to-products">Back Home</button>
+            </div>`);
+    }
+
+    function render() {
+        const path = window.location.pathname;
+        const protectedPage = PROTECTED_PAGES[path];
+        document.body.classList.toggle("visual_failure", is("visual_user"));
+
+        if (!protectedPage) {
+            if (user() && (path === "/" || path === "/index.html")) {
+                sessionStorage.removeItem(LOGIN_ERROR_KEY);
+            }
+            renderLogin();
+            return;
+        }
+
+        if (!user()) {
+            sessionStorage.setItem(LOGIN_ERROR_KEY, `Epic sadface: You can only access '${path}' when you are logged in.`);
+            go("/");
+            return;
+        }
+
+        protectedPage();
+    }
+
+    //------------actions------------
+    function login(form) {
+        const username = form.elements["user-name"].value;
+        const password = form.elements.password.value;
+        let error = null;
+
+        if (!username) error = "Epic sadface: Username is required";
+        else if (!password) error = "Epic sadface: Password is required";
+        else if (!USERS.includes(username) || password !== PASSWORD) error = "Epic sadface: Username and password do not match any user in this service";
+        else if (username === "locked_out_user") error = "Epic sadface: Sorry, this user has been locked out.";
+
+        if (error) {
+            sessionStorage.setItem(LOGIN_ERROR_KEY, error);
+            renderLogin();
+            document.getElementById("user-name").value = username;
+            document.getElementById("password").value = password;
+            return;
+        }
+
+        sessionStorage.removeItem(LOGIN_ERROR_KEY);
+        setUser(username);
+        go("/inventory.html");
+    }
+
+    function continueCheckout(form) {
+        const [first, last, zip] = ["firstName", "lastName", "postalCode"].map((name) => form.elements[name].value);
+        let error = "";
+
+        if (!first) error = "Error: First Name is required";
+        else if (!last && !is("error_user")) error = "Error: Last Name is required";
+        else if (!zip) error = "Error: Postal Code is required";
+
+        if (error) {
+            renderCheckoutInfo(error);
+            return;
+        }
+        go("/checkout-step-two.html");
+    }
+
+    function addToCart(id) {
+        if (is("problem_user", "error_user") && UNADDABLE_IDS.has(id)) {
+            if (is("error_user")) console.error("Failed to add item to the cart.");
+            return;
+        }
+        const ids = cart();
+        if (!ids.includes(id)) saveCart([...ids, id]);
+        render();
+    }
+
+    function removeFromCart(id, fromCart) {
+        if (!fromCart && is("problem_user", "error_user")) {
+            if (is("error_user")) console.error("Failed to remove item from cart.");
+            return;
+        }
+        saveCart(cart().filter((itemId) => itemId !== id));
+        render();
+    }
+
+    const ACTIONS = {
+        "open-menu": () => { state.menuOpen = true; render(); },
+        "close-menu": () => { state.menuOpen = false; render(); },
+        "logout": () => { clearUser(); go("/"); },
+        "reset": () => { saveCart([]); render(); },
+        "open-item": (target) => go(`/inventory-item.html?id=${is("problem_user") ? Number(target.dataset.id) + 1 : target.dataset.id}`),
+        "back-to-products": () => go("/inventory.html"),
+        "add": (target) => addToCart(Number(target.dataset.id)),
+        "remove": (target) => removeFromCart(Number(target.dataset.id), false),
+        "remove-from-cart": (target) => removeFromCart(Number(target.dataset.id), true),
+        "continue-shopping": () => go("/inventory.html"),
+        "checkout": () => go("/checkout-step-one.html"),
+        "cancel-checkout": () => go("/cart.html"),
+        "cancel-overview": () => go("/inventory.html"),
+        "finish": () => {
+            if (is("error_user")) return;
+            saveCart([]);
+            go("/checkout-complete.html");
+        },
+        "dismiss-login-error": () => { sessionStorage.removeItem(LOGIN_ERROR_KEY); renderLogin(); },
+        "dismiss-checkout-error": () => renderCheckoutInfo(),
+    };
+
+    document.addEventListener("click", (event) => {
+        const target = event.target.closest("[data-action]");
+        if (!target) return;
+        event.preventDefault();
+        ACTIONS[target.dataset.action](target);
+    });
+
+    document.addEventListener("submit", (event) => {
+        event.preventDefault();
+        if (event.target.id === "login_form") login(event.target);
+        if (event.target.id === "checkout_form") continueCheckout(event.target);
+    });
+
+    document.addEventListener("change", (event) => {
+        if (!event.target.matches(".product_sort_container")) return;
+
+        if (is("error_user")) {
+            window.alert("Sorting is broken! This error has been reported to a backend developer.");
+        }
+        if (!is("problem_user", "error_user")) {
+            state.sort = event.target.value;
+        }
+        render();
+    });
+
+    render();
+})();
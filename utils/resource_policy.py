@@ -0,0 +1,173 @@
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from playwright.sync_api import Page, Request, Response, Route
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    name: str
+    blocked_types: frozenset = frozenset()
+    block_third_party: bool = False
+
+    def blocks(self, request: Request, app_host: Optional[str]) -> bool:
+        if request.resource_type in self.blocked_types:
+            return True
+        return self.block_third_party and app_host is not None and urlsplit(request.url).hostname != app_host
+
+
+POLICIES: Dict[str, ResourcePolicy] = {
+    "all": ResourcePolicy("all"),
+    "no-images": ResourcePolicy("no-images", frozenset({"image", "font", "media"}), block_third_party=True),
+}
+DEFAULT_POLICY = "all"
+
+# tests using these fixtures compare pixels or image bytes, so they always get every resource
+VISUAL_FIXTURES = ("assert_snapshot", "image_integrity")
+
+
+def policy_for(item) -> ResourcePolicy:
+    if any(name in item.fixturenames for name in VISUAL_FIXTURES):
+        return POLICIES[DEFAULT_POLICY]
+
+    marker = item.get_closest_marker("resources")
+    name = marker.args[0] if marker and marker.args else DEFAULT_POLICY
+    if name not in POLICIES:
+        raise ValueError(f"Unknown resource policy '{name}', expected one of {sorted(POLICIES)}")
+    return POLICIES[name]
+
+
+RECORD_PROPERTY = "resource_record"
+HEAD_TIMEOUT = 5
+
+
+class ResourceMonitor:
+    """
+    Applies a ResourcePolicy to a page and reports, per test, what blocking saved.
+
+    Each test's record travels in its report's user_properties, so the xdist controller reports what
+    every worker measured. The browser never fetches a blocked request, so once the page is done each
+    one is sized by a HEAD request's Content-Length (once per url and process). Load time saved is
+    worked out against the median load of the same page in tests that fetch everything.
+    """
+
+    def __init__(self) -> None:
+        self.sizes: Dict[str, Optional[int]] = {}       # url -> Content-Length, None when the server does not say
+        self.baseline_loads: Dict[str, List[float]] = defaultdict(list)
+        self.records: List[dict] = []
+        self._session: Optional[requests.Session] = None
+        self._unreachable: Set[str] = set()             # hosts a HEAD failed for, not asked again
+
+    def watch(self, page: Page, policy: ResourcePolicy, app_url: Optional[str], node) -> dict:
+        blocking = bool(policy.blocked_types or policy.block_third_party)
+        # blocked urls, their sizes and (url path, seconds from document request to load) of every page load
+        record = {"nodeid": node.nodeid, "policy": policy.name, "baseline": not blocking, "blocked": [], "sizes": {}, "loads": []}
+        node.user_properties.append((RECORD_PROPERTY, record))
+        app_host = urlsplit(app_url).hostname if app_url else None
+        document_started: Dict[str, float] = {}
+
+        def on_request(request: Request) -> None:
+            if request.resource_type == "document" and request.frame == page.main_frame:
+                document_started["current"] = time.perf_counter()
+                document_started["path"] = urlsplit(request.url).path
+
+        def on_load(_) -> None:
+            if "current" in document_started:
+                elapsed = time.perf_counter() - document_started.pop("current")
+                record["loads"].append((document_started["path"], elapsed))
+
+        def on_response(response: Response) -> None:
+            length = response.headers.get("content-length")
+            if length and length.isdigit():
+                self.sizes[response.url] = int(length)
+
+        def on_route(route: Route) -> None:
+            if policy.blocks(route.request, app_host):
+                record["blocked"].append(route.request.url)
+                route.abort("blockedbyclient")
+            else:
+                route.fallback()
+
+        page.on("request", on_request)
+        page.on("load", on_load)
+        page.on("response", on_response)
+        if blocking:
+            page.route("**/*", on_route)
+
+        return record
+
+    def finish(self, record: dict) -> None:
+        """
+        Sizes the record's blocked requests, call it while the app is still up
+        """
+        for url in dict.fromkeys(record["blocked"]):
+            if url not in self.sizes:
+                self.sizes[url] = self._content_length(url)
+            if self.sizes[url] is not None:
+                record["sizes"][url] = self.sizes[url]
+
+    def savings(self, record: dict) -> Tuple[int, int, Optional[float]]:
+        """
+        Returns (bytes saved, blocked requests of unknown size, seconds of page load saved or None)
+        """
+        known = [record["sizes"][url] for url in record["blocked"] if url in record["sizes"]]
+        unknown = len(record["blocked"]) - len(known)
+
+        load_saved = None
+        for path, elapsed in record["loads"]:
+            baseline = self.baseline_loads.get(path)
+            if baseline:
+                load_saved = (load_saved or 0.0) + statistics.median(baseline) - elapsed
+
+        return sum(known), unknown, load_saved
+
+    #-----------------Private-----------------
+
+    def _content_length(self, url: str) -> Optional[int]:
+        host = urlsplit(url).hostname
+        if host in self._unreachable:
+            return None
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            length = self._session.head(url, allow_redirects=True, timeout=HEAD_TIMEOUT).headers.get("content-length")
+        except requests.RequestException:
+            self._unreachable.add(host)
+            return None
+        return int(length) if length and length.isdigit() else None
+
+    #-----------------Hooks-----------------
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when != "teardown":
+            return
+        for name, record in report.user_properties:
+            if name != RECORD_PROPERTY:
+                continue
+            self.records.append(record)
+            if record["baseline"]:
+                for path, elapsed in record["loads"]:
+                    self.baseline_loads[path].append(elapsed)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        blocking = [record for record in self.records if record["blocked"]]
+        if not blocking:
+            return
+
+        terminalreporter.section("resource policy")
+        total_bytes = 0
+        for record in blocking:
+            saved_bytes, unknown, load_saved = self.savings(record)
+            total_bytes += saved_bytes
+            load = f"{load_saved * 1000:8.0f} ms" if load_saved is not None else "       n/a"
+            unknown_note = f" (+{unknown} of unknown size)" if unknown else ""
+            terminalreporter.write_line(
+                f"{record['policy']:<10} blocked {len(record['blocked']):3d}  saved {saved_bytes / 1024:9.1f} KiB{unknown_note:<22}"
+                f"  load {load}  {record['nodeid']}"
+            )
+        terminalreporter.write_line(f"total saved {total_bytes / 1024:.1f} KiB over {len(blocking)} tests")
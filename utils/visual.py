@@ -0,0 +1,408 @@
+"""
+Screenshot comparison for assert_snapshot. Both images are decoded once into NumPy arrays and
+compared in a few whole-array operations instead of pixel by pixel.
+"""
+import functools
+import hashlib
+import json
+import math
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+Box = Tuple[int, int, int, int]     # x, y, width, height
+
+FAILURE_DIR = "snapshot_tests_failures"
+
+REGION_CELL = 16                    # changed pixels closer than about this merge into one region
+MISMATCH_COLOR = (255, 0, 0)
+ANTIALIAS_COLOR = (255, 255, 0)
+REGION_COLOR = (255, 0, 255)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def decode(image: Union[bytes, Path]) -> np.ndarray:
+    """
+    PNG / JPEG -> (height, width, 3) uint8 RGB, transparency composited onto white
+    """
+    source = BytesIO(image) if isinstance(image, (bytes, bytearray)) else image
+    with Image.open(source) as decoded:
+        if decoded.mode == "RGB":
+            return np.asarray(decoded)
+        rgba = np.asarray(decoded.convert("RGBA"), dtype=np.float32)
+
+    alpha = rgba[..., 3:] / 255
+    return (rgba[..., :3] * alpha + 255 * (1 - alpha)).round().astype(np.uint8)
+
+
+def enclosing_box(x: float, y: float, width: float, height: float) -> Box:
+    """
+    The whole pixels a fractional CSS box covers: left / top floored, right / bottom ceiled,
+    as Playwright rounds an element screenshot's clip (helper.enclosingIntRect)
+    """
+    left, top = math.floor(x + 1e-3), math.floor(y + 1e-3)
+    return left, top, math.ceil(x + width - 1e-3) - left, math.ceil(y + height - 1e-3) - top
+
+
+def tile_layout(boxes: Iterable[Tuple[float, float, float, float]], scale: float = 1.0) -> Tuple[Box, List[Box]]:
+    """
+    For fractional page boxes: the clip of one screenshot covering them all (CSS px) and each
+    box inside that screenshot (device px), cut the way an element screenshot of it would be
+    """
+    pixels = [enclosing_box(*box) for box in boxes]
+    left, top = min(x for x, _, _, _ in pixels), min(y for _, y, _, _ in pixels)
+    right, bottom = max(x + w for x, _, w, _ in pixels), max(y + h for _, y, _, h in pixels)
+    return (left, top, right - left, bottom - top), [
+        (round((x - left) * scale), round((y - top) * scale), round(w * scale), round(h * scale)) for x, y, w, h in pixels
+    ]
+
+
+def crop_tiles(image: bytes, boxes: Iterable[Box]) -> List[np.ndarray]:
+    """
+    Decodes one screenshot and cuts the boxes out of it, as views into the same array
+    """
+    pixels = decode(image)
+    return [pixels[y:y + h, x:x + w] for x, y, w, h in boxes]
+
+
+@dataclass
+class SnapshotDiff:
+    width: int
+    height: int
+    mismatched: int                 # pixels that differ beyond the threshold
+    antialiased: int = 0            # differing pixels forgiven as anti-aliasing
+    boxes: List[Box] = field(default_factory=list)
+    image: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def matches(self) -> bool:
+        return self.mismatched == 0
+
+    def describe(self) -> str:
+        regions = ", ".join(f"{w}x{h} at ({x}, {y})" for x, y, w, h in self.boxes)
+        text = f"{self.mismatched} of {self.width * self.height} pixels differ"
+        if self.antialiased:
+            text += f" ({self.antialiased} anti-aliased pixels ignored)"
+        return f"{text}, {len(self.boxes)} changed region(s): {regions}" if self.boxes else text
+
+
+def compare_images(actual: np.ndarray, expected: np.ndarray, threshold: float = 0.1,
+                   antialiasing: bool = True, fail_fast: bool = False) -> SnapshotDiff:
+    """
+    A pixel differs when any channel moved by more than threshold (0..1) of its range.
+    With antialiasing, a differing pixel that is an anti-aliased edge pixel in either image is
+    not counted (pixelmatch's rule, see _antialiased). A whole edge drawn a pixel over still is.
+    fail_fast skips the regions and the diff image.
+    """
+    if actual.shape != expected.shape:
+        raise ValueError(f"Image sizes differ: {_size(actual)} actual, {_size(expected)} expected")
+
+    height, width = actual.shape[:2]
+    tolerance = threshold * 255
+    actual16, expected16 = actual.astype(np.int16), expected.astype(np.int16)
+
+    changed = (np.abs(actual16 - expected16) > tolerance).any(axis=2)
+    if not changed.any():
+        return SnapshotDiff(width, height, 0)
+
+    antialiased = np.zeros_like(changed)
+    if antialiasing:
+        ys, xs = np.nonzero(changed)
+        forgiven = _antialiased(actual16, expected16, ys, xs) | _antialiased(expected16, actual16, ys, xs)
+        antialiased[ys[forgiven], xs[forgiven]] = True
+        changed &= ~antialiased
+
+    mismatched, forgiven = int(changed.sum()), int(antialiased.sum())
+    if fail_fast or not mismatched:
+        return SnapshotDiff(width, height, mismatched, forgiven)
+
+    boxes = changed_regions(changed)
+    return SnapshotDiff(width, height, mismatched, forgiven, boxes, _diff_image(expected, changed, antialiased, boxes))
+
+
+def changed_regions(mask: np.ndarray, cell: int = REGION_CELL) -> List[Box]:
+    """
+    Bounding boxes of the groups of changed pixels. The mask is reduced to cell x cell
+    tiles first, so only the (few) changed tiles are walked in Python.
+    """
+    height, width = mask.shape
+    rows, cols = -(-height // cell), -(-width // cell)
+    padded = np.zeros((rows * cell, cols * cell), dtype=bool)
+    padded[:height, :width] = mask
+    tiles = padded.reshape(rows, cell, cols, cell).any(axis=(1, 3))
+
+    seen = np.zeros_like(tiles)
+    boxes = []
+    for row, col in np.argwhere(tiles).tolist():
+        if seen[row, col]:
+            continue
+
+        seen[row, col] = True
+        pending = [(row, col)]
+        top, bottom, left, right = row, row, col, col
+        while pending:
+            y, x = pending.pop()
+            top, bottom, left, right = min(top, y), max(bottom, y), min(left, x), max(right, x)
+            for ny in range(max(y - 1, 0), min(y + 2, rows)):
+                for nx in range(max(x - 1, 0), min(x + 2, cols)):
+                    if tiles[ny, nx] and not seen[ny, nx]:
+                        seen[ny, nx] = True
+                        pending.append((ny, nx))
+
+        # exact bounds of the changed pixels inside the group's tiles
+        ys, xs = np.nonzero(padded[top * cell:(bottom + 1) * cell, left * cell:(right + 1) * cell])
+        x0, y0 = left * cell + int(xs.min()), top * cell + int(ys.min())
+        boxes.append((x0, y0, left * cell + int(xs.max()) + 1 - x0, top * cell + int(ys.max()) + 1 - y0))
+
+    return sorted(boxes, key=lambda box: (box[1], box[0]))
+
+
+class BaselineStore:
+    """
+    Content addressed baselines: tests/snapshots/objects/<hash[:2]>/<hash>.png holds each distinct
+    image once, tests/snapshots/manifest.json maps "<test module>/<test>/<name>" to its hash.
+
+    Hashes are of the decoded pixels, so the same image encoded twice is still one object. Each
+    entry also keeps a 64 bit difference hash (perceptual) and the image size. Baselines still in
+    the old <test module>/<test>/<name> files are adopted into the store the first time they are read.
+    """
+
+    MANIFEST = "manifest.json"
+    OBJECTS = "objects"
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.manifest_path = self.root / self.MANIFEST
+        self.entries: Dict[str, dict] = self._read_manifest()
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self.entries.get(key)
+        legacy = self.root / key
+        if entry is None and legacy.is_file():
+            data = legacy.read_bytes()
+            entry = self.put(key, data, decode(data))
+            legacy.unlink(missing_ok=True)
+        return entry
+
+    def put(self, key: str, img: Union[bytes, np.ndarray], pixels: np.ndarray) -> dict:
+        digest = pixel_hash(pixels)
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write(path, img, pixels)
+
+        entry = {"sha256": digest, "phash": f"{perceptual_hash(pixels):016x}", "size": _size(pixels)}
+        self.entries[key] = entry
+        self._write_manifest(key, entry)
+        return entry
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / self.OBJECTS / digest[:2] / f"{digest}.png"
+
+    def pixels(self, entry: dict) -> np.ndarray:
+        return _decode_object(self.object_path(entry["sha256"]))
+
+    #-------------Private--------------
+
+    def _read_manifest(self) -> Dict[str, dict]:
+        if not self.manifest_path.is_file():
+            return {}
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def _write_manifest(self, key: str, entry: dict) -> None:
+        # xdist workers share the file, merge into what is on disk and swap it in whole
+        entries = self._read_manifest()
+        entries[key] = entry
+        self.root.mkdir(parents=True, exist_ok=True)
+        temporary = self.manifest_path.with_name(f".{self.MANIFEST}.{os.getpid()}")
+        temporary.write_text(json.dumps(dict(sorted(entries.items())), indent=2) + "\n", encoding="utf-8")
+        os.replace(temporary, self.manifest_path)
+
+
+class SnapshotAssertion:
+    """
+    The assert_snapshot fixture: assert_snapshot(png_or_jpeg_bytes, name="product_1_image.png"),
+    or an already decoded RGB array such as a crop_tiles tile.
+
+    Baselines are looked up in the BaselineStore under "<test module>/<test>/<name>". A capture
+    whose pixel hash equals the baseline's passes without a pixel diff (perceptual=True also lets
+    an equal perceptual hash pass). A missing baseline is stored and the test fails so it gets
+    reviewed, --update-snapshots rewrites them all. On a mismatch Actual_, Expected_ and Diff_
+    images (plus the changed regions as JSON) go to
+    tests/snapshot_tests_failures/<test module>/<test>[<platform>]/.
+    """
+
+    def __init__(self, node, store: BaselineStore, update: bool = False) -> None:
+        test_file = Path(node.path)
+        module = test_file.name.strip(".py")     # same folder names the previous snapshot plugin used
+        self.store = store
+        self.update = update
+        self.test_name = f"{node.name}[{sys.platform}]"
+        self.key_prefix = f"{module}/{node.name.split('[', 1)[0]}"
+        self.failure_dir = test_file.parent.resolve() / FAILURE_DIR / module / self.test_name
+
+        # cleared once per test, every snapshot of this run keeps its failure images
+        if self.failure_dir.exists():
+            shutil.rmtree(self.failure_dir)
+
+    def __call__(self, img: Union[bytes, np.ndarray], *, threshold: float = 0.1, name: Optional[str] = None, fail_fast: bool = False,
+                 antialiasing: bool = True, perceptual: bool = False) -> None:
+        name = name or f"{self.test_name}.png"
+        key = f"{self.key_prefix}/{name}"
+        actual = img if isinstance(img, np.ndarray) else decode(img)
+
+        if self.update:
+            self.store.put(key, img, actual)
+            pytest.fail("--> Snapshots updated. Please review images")
+        baseline = self.store.get(key)
+        if baseline is None:
+            self.store.put(key, img, actual)
+            pytest.fail("--> New snapshot(s) created. Please review images")
+
+        if pixel_hash(actual) == baseline["sha256"]:
+            return
+        if perceptual and f"{perceptual_hash(actual):016x}" == baseline["phash"]:
+            return
+
+        try:
+            diff = compare_images(actual, self.store.pixels(baseline), threshold, antialiasing, fail_fast)
+        except ValueError as error:
+            self._save_failure(name, img, actual, baseline)
+            pytest.fail(f"--> Snapshots DO NOT match! {error}")
+
+        if diff.matches:
+            return
+
+        self._save_failure(name, img, actual, baseline, diff)
+        pytest.fail(f"--> Snapshots DO NOT match! {diff.describe()}")
+
+    #-------------Private--------------
+
+    def _save_failure(self, name: str, img: Union[bytes, np.ndarray], actual: np.ndarray, baseline: dict,
+                      diff: Optional[SnapshotDiff] = None) -> None:
+        self.failure_dir.mkdir(parents=True, exist_ok=True)
+        _write(self.failure_dir / f"Actual_{name}", img, actual)
+        shutil.copyfile(self.store.object_path(baseline["sha256"]), self.failure_dir / f"Expected_{name}")
+
+        if diff is not None and diff.image is not None:
+            Image.fromarray(diff.image).save(self.failure_dir / f"Diff_{name}")
+            regions = [dict(zip(("x", "y", "width", "height"), box)) for box in diff.boxes]
+            (self.failure_dir / f"Diff_{Path(name).stem}.json").write_text(json.dumps(
+                {"mismatched": diff.mismatched, "antialiased": diff.antialiased, "regions": regions}, indent=2))
+
+
+def pixel_hash(pixels: np.ndarray) -> str:
+    """
+    sha256 of the size and RGB bytes, the same whatever format the image was encoded in
+    """
+    digest = hashlib.sha256(f"{pixels.shape[1]}x{pixels.shape[0]}:".encode())
+    digest.update(np.ascontiguousarray(pixels).data)
+    return digest.hexdigest()
+
+
+def perceptual_hash(pixels: np.ndarray) -> int:
+    """
+    64 bit difference hash: a 9x8 grayscale thumbnail, one bit per pixel brighter than its right neighbour
+    """
+    thumbnail = np.asarray(Image.fromarray(pixels).convert("L").resize((9, 8), Image.Resampling.BILINEAR), dtype=np.int16)
+    bits = (thumbnail[:, :-1] > thumbnail[:, 1:]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+#-------------Helper----------------
+
+def _write(path: Path, img: Union[bytes, np.ndarray], pixels: np.ndarray) -> None:
+    """
+    Files are always PNG: PNG screenshot bytes are written as they are, anything else
+    (JPEG bytes, arrays) is re-encoded from its decoded pixels
+    """
+    if isinstance(img, (bytes, bytearray)) and img[:8] == PNG_SIGNATURE:
+        path.write_bytes(img)
+    else:
+        Image.fromarray(pixels).save(path, format="PNG")
+
+
+@functools.lru_cache(maxsize=32)
+def _decode_object(path: Path) -> np.ndarray:
+    # objects never change once written, so each is decoded once per process
+    return decode(path)
+
+
+def _size(image: np.ndarray) -> str:
+    return f"{image.shape[1]}x{image.shape[0]}"
+
+
+# the 8 neighbours in pixelmatch's order (x outer, y inner), the first darkest / brightest wins ties
+NEIGHBOURS = [(dy, dx) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dy or dx]
+
+
+def _luminance(pixels: np.ndarray) -> np.ndarray:
+    return pixels @ np.array([0.29889531, 0.58662247, 0.11448223])
+
+
+def _many_siblings(pixels: np.ndarray) -> np.ndarray:
+    """
+    True where more than 2 of the 8 neighbours have exactly the pixel's colour (inside a flat area),
+    a pixel on the border counts one extra as pixelmatch does
+    """
+    height, width = pixels.shape[:2]
+    padded = np.pad(pixels, ((1, 1), (1, 1), (0, 0)), constant_values=-1)
+    same = sum((padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] == pixels).all(axis=2).astype(np.int8)
+               for dy, dx in NEIGHBOURS)
+    border = np.zeros((height, width), dtype=np.int8)
+    border[[0, -1], :] = border[:, [0, -1]] = 1
+    return same + border > 2
+
+
+def _antialiased(pixels: np.ndarray, other: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """
+    For each (y, x): is the pixel anti-aliasing in pixels? It must sit between a darker and a
+    brighter neighbour with at most 2 neighbours of its own brightness, and the darkest or the
+    brightest neighbour must lie inside a flat area in both images, i.e. on a high contrast edge.
+    A pixel of a hard edge has many equal neighbours, so an edge that moved is not forgiven.
+    """
+    height, width = pixels.shape[:2]
+    luminance = np.pad(_luminance(pixels), 1, constant_values=np.nan)
+    center = luminance[ys + 1, xs + 1]
+    deltas = np.stack([luminance[ys + 1 + dy, xs + 1 + dx] - center for dy, dx in NEIGHBOURS])
+
+    on_border = (ys == 0) | (ys == height - 1) | (xs == 0) | (xs == width - 1)
+    zeroes = (deltas == 0).sum(axis=0) + on_border
+    darkest = np.argmin(np.where(np.isnan(deltas), np.inf, deltas), axis=0)
+    brightest = np.argmax(np.where(np.isnan(deltas), -np.inf, deltas), axis=0)
+    between = (zeroes <= 2) & (np.nanmin(deltas, axis=0) < 0) & (np.nanmax(deltas, axis=0) > 0)
+
+    flat = _many_siblings(pixels) & _many_siblings(other)
+    offsets = np.array(NEIGHBOURS)
+
+    def in_flat_area(index: np.ndarray) -> np.ndarray:
+        ny = np.clip(ys + offsets[index, 0], 0, height - 1)
+        nx = np.clip(xs + offsets[index, 1], 0, width - 1)
+        return flat[ny, nx]
+
+    return between & (in_flat_area(darkest) | in_flat_area(brightest))
+
+
+def _diff_image(expected: np.ndarray, changed: np.ndarray, antialiased: np.ndarray, boxes: List[Box]) -> np.ndarray:
+    """
+    Faded grayscale of the baseline, red changed pixels, yellow forgiven ones, magenta region outlines
+    """
+    gray = expected @ np.array([0.299, 0.587, 0.114])
+    faded = (255 - (255 - gray) * 0.1).astype(np.uint8)
+    image = np.repeat(faded[..., None], 3, axis=2)
+    image[antialiased] = ANTIALIAS_COLOR
+    image[changed] = MISMATCH_COLOR
+
+    canvas = Image.fromarray(image)
+    draw = ImageDraw.Draw(canvas)
+    for x, y, w, h in boxes:
+        draw.rectangle((x - 1, y - 1, x + w, y + h), outline=REGION_COLOR)
+    return np.asarray(canvas)